@@ -0,0 +1,223 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pandas as pd
+import streamlit as st
+
+from cohorts import retention_range
+from engines import aggregate, engine_name
+from facts import ORDER_SEQUENCES, PAYMENT_SOURCES
+from geolocation import hex_density, state_distances
+from loader import USED_COLUMNS, load_table, table_version
+from rankings import TOP_N, ranked_series, ranking, top_per_group
+from rollups import cube_range, new_sellers, ratio, rollup
+from stats import box_stats, merge_sketches
+
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September',
+               'October', 'November', 'December']
+
+
+def _as_str(df: pd.DataFrame, *columns: str) -> pd.DataFrame:
+    # Label kategori dijadikan string agar seaborn memakai urutan baris hasil
+    # sort, bukan urutan kategori bawaan dtype.
+    return df.astype({col: str for col in columns})
+
+
+def orders_delivery(start: pd.Timestamp = None, end: pd.Timestamp = None) -> dict:
+    """Fungsi untuk menghitung analisis Pesanan & Pengiriman (pertanyaan 1a-1e)."""
+    cube = cube_range('items', start, end)
+    return {
+        # Waktu pengiriman berupa hari bulat, jadi distribusinya cukup disimpan
+        # sebagai jumlah per hari dan digambar sebagai histogram berbobot.
+        '1a': aggregate('delivery_days', start, end).rename('count'),
+        '1b': aggregate('delay_by_category', start, end).rename('delay_time').reset_index(),
+        '1c_month': ratio(cube, cube['day'].dt.month, 'delay_sum', 'delay_count'),
+        '1c_day': ratio(cube, cube['day'].dt.dayofweek, 'delay_sum', 'delay_count'),
+        '1d': aggregate('delivery_by_state', start, end).rename('delivery_time').reset_index(),
+        '1e': box_stats(merge_sketches(cube_range('delay_by_review', start, end), 'review_score').sort_index(level=0)),
+    }
+
+
+def payments(start: pd.Timestamp = None, end: pd.Timestamp = None) -> dict:
+    """Fungsi untuk menghitung analisis Pembayaran (pertanyaan 2a-2e)."""
+    category_payment = aggregate('payment_by_category', start, end).rename('payment_value').sort_values(kind='stable')
+
+    cube = cube_range('payments', start, end)
+    payments_orders = rollup(cube, [cube['day'].dt.to_period('M').rename('year_month'), 'payment_type'], ['payment_value'])
+    payments_orders = payments_orders.reset_index()
+    payments_orders['year_month'] = payments_orders['year_month'].astype(str)
+    return {
+        '2a': aggregate('payment_total', start, end) / aggregate('payment_orders', start, end),
+        '2b': category_payment,
+        '2c': aggregate('installment_payments', start, end) / aggregate('payment_count', start, end) * 100,
+        '2d': payments_orders[['year_month', 'payment_type', 'payment_value']],
+        '2e': box_stats(merge_sketches(cube_range('review_by_payment', start, end), 'payment_type')),
+    }
+
+
+def sales_products(start: pd.Timestamp = None, end: pd.Timestamp = None) -> dict:
+    """Fungsi untuk menghitung analisis Penjualan & Produk (pertanyaan 3a-3e)."""
+    cube = cube_range('items', start, end)
+    category_sales = ranked_series(cube, 'items_by_category')
+
+    monthly_orders = cube.set_index('day')['items'].resample('ME').sum()
+    # Rentang sempit bisa hanya berisi produk tanpa kategori.
+    top_category = category_sales.idxmax() if len(category_sales) else None
+    top_cube = cube[cube['product_category_name_english'] == top_category]
+    category_trend = top_cube.set_index('day')['items'].resample('ME').sum()
+
+    returns_count = ranked_series(cube_range('category_returns', start, end), 'returns_by_category')
+    category_revenue = ranked_series(cube, 'revenue_by_category')
+
+    day_sales = rollup(cube, cube['day'].dt.dayofweek, ['items'])['items'].reindex(range(7))
+    day_sales.index = DAY_NAMES
+    month_sales = rollup(cube, cube['day'].dt.month, ['items'])['items'].reindex(range(1, 13))
+    month_sales.index = MONTH_NAMES
+    return {
+        '3a': category_sales,
+        '3b_total': monthly_orders,
+        '3b_top_category': top_category,
+        '3b_top': category_trend,
+        '3c': returns_count,
+        '3d': category_revenue,
+        '3e_day': day_sales,
+        '3e_month': month_sales,
+    }
+
+
+def customers(start: pd.Timestamp = None, end: pd.Timestamp = None) -> dict:
+    """Fungsi untuk menghitung analisis Pelanggan (pertanyaan 4a-4e)."""
+    cube = cube_range('items', start, end)
+
+    # Di Olist setiap customer_id hanya punya satu pesanan, jadi jumlah pesanan
+    # per negara bagian sama dengan jumlah pelanggan pada rentang tersebut.
+    active_customers = aggregate('orders_by_state', start, end).sort_values(ascending=False, kind='stable')
+    active_customers = active_customers.reset_index()
+    active_customers.columns = ['State', 'Total Customers']
+
+    products = load_table('products', USED_COLUMNS['products'])
+    product_info = _as_str(products[['product_id', 'product_category_name']], 'product_category_name')
+    product_info['product_id'] = product_info['product_id'].astype(str)
+    product_counts = aggregate('items_by_product', start, end)
+
+    def top_products(is_new: bool) -> pd.DataFrame:
+        counts = product_counts[product_counts.index.get_level_values(0) == is_new].droplevel(0)
+        counts = counts.sort_values(ascending=False, kind='stable').head(10).reset_index()
+        counts.columns = ['product_id', 'count']
+        return counts.merge(product_info, on='product_id', how='left')
+
+    retention = retention_range(start, end)
+    retention.index = retention.index.astype(str)
+
+    # Nomor urut pesanan sudah ada di tabel fakta, jadi pembelian ulang cukup
+    # dikelompokkan tanpa merge tambahan.
+    sequences = pd.CategoricalIndex(ORDER_SEQUENCES, name='order_sequence')
+    sequence_trend = aggregate('orders_by_sequence_month', start, end).unstack('order_sequence')
+    sequence_trend = sequence_trend.reindex(columns=ORDER_SEQUENCES).fillna(0).astype('int64')
+    sequence_trend.columns = sequences
+    repeat_summary = pd.DataFrame({
+        name: aggregate(f"{name}_by_sequence", start, end).reindex(ORDER_SEQUENCES, fill_value=0).to_numpy()
+        for name in ['orders', 'customers', 'revenue']
+    }, index=sequences)
+    repeat_summary['average_order_value'] = repeat_summary['revenue'] / repeat_summary['orders']
+    return {
+        '4a': rollup(cube, cube['day'].dt.year.rename('year'), ['orders'])['orders'],
+        '4b': active_customers,
+        '4c_new': top_products(True),
+        '4c_old': top_products(False),
+        '4d': retention,
+        '4e_trend': sequence_trend,
+        '4e_summary': repeat_summary,
+    }
+
+
+def sellers(start: pd.Timestamp = None, end: pd.Timestamp = None) -> dict:
+    """Fungsi untuk menghitung analisis Seller & Revenue (pertanyaan 5a-5c)."""
+    # Peringkat dihitung dari kubus berkode integer (lihat rankings.py), jadi
+    # hanya N seller teratas dan seller teratas per kategori yang diurutkan.
+    seller_order_counts = ranking(cube_range('seller_orders', start, end), 'orders_by_seller', TOP_N)
+    seller_order_counts = seller_order_counts.rename(columns={'orders': 'order_count'})
+
+    df_category_top_seller = top_per_group(cube_range('category_seller_orders', start, end), 'orders_by_category_seller')
+    df_category_top_seller = df_category_top_seller.rename(columns={'orders': 'order_count'})
+
+    # Seller baru dihitung dari pesanan pertamanya di seluruh riwayat, lalu
+    # dipotong ke rentang tanggal yang dipilih.
+    seller_first_order = new_sellers(start, end)
+    seller_join_trend = seller_first_order.groupby(seller_first_order.dt.to_period("M")).count()
+    return {
+        '5a': seller_order_counts,
+        '5b': df_category_top_seller,
+        '5c': seller_join_trend,
+    }
+
+
+def geospatial(start: pd.Timestamp = None, end: pd.Timestamp = None) -> dict:
+    """Fungsi untuk menghitung analisis Geospatial (pertanyaan 6a-6e)."""
+    sales_by_city = ranking(cube_range('city_sales', start, end), 'sales_by_city', TOP_N)
+    sales_by_city = sales_by_city.rename(columns={'revenue': 'price'})
+
+    delay_by_state = aggregate('delay_by_state', start, end).reset_index(name='delay')
+    delay_by_state = delay_by_state.sort_values(by='delay', ascending=False, kind='stable')
+
+    state_orders = aggregate('orders_by_state', start, end).reset_index(name='order_count')
+    state_orders['customer_state'] = state_orders['customer_state'].str.upper()
+
+    # Lokasi diambil dari centroid prefiks kode pos, jadi pesanan dan seller
+    # cukup dicacah per prefiks sebelum dipetakan ke sel heksagon.
+    zip_orders = aggregate('orders_by_customer_zip', start, end)
+    return {
+        '6a': sales_by_city,
+        '6b': delay_by_state,
+        '6c': state_orders,
+        '6d': hex_density(zip_orders.groupby(level=1).sum(), aggregate('sellers_by_zip', start, end)),
+        '6e_distance': aggregate('seller_distances', start, end).rename('count'),
+        '6e_states': state_distances(zip_orders, aggregate('seller_distance_by_state', start, end)),
+    }
+
+
+SECTIONS = {
+    "Pesanan & Pengiriman": orders_delivery,
+    "Pembayaran": payments,
+    "Penjualan & Produk": sales_products,
+    "Pelanggan": customers,
+    "Seller & Revenue": sellers,
+    "Geospatial": geospatial,
+}
+
+DATA_SOURCES = sorted(set(PAYMENT_SOURCES) | set(USED_COLUMNS))
+
+
+def data_version() -> tuple:
+    """Fungsi untuk mendapatkan kunci versi seluruh tabel sumber analisis."""
+    return tuple(table_version(name) for name in DATA_SOURCES)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_section(section: str, engine: str, version: tuple, start: pd.Timestamp, end: pd.Timestamp) -> dict:
+    return SECTIONS[section](start, end)
+
+
+def section_results(section: str, start: pd.Timestamp = None, end: pd.Timestamp = None) -> dict:
+    """Fungsi untuk menghitung satu bagian analisis pada rentang [start, end); hasil yang sudah ada dipakai ulang."""
+    return _cached_section(section, engine_name(), data_version(), start, end)
@@ -0,0 +1,112 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark backend grafik: PNG dari server vs Vega-Lite di browser, per bagian.
+
+Dashboard dijalankan dengan streamlit.testing (AppTest) untuk setiap backend.
+Untuk setiap bagian diukur waktu CPU server satu interaksi (memilih bagian
+itu) dan ukuran kiriman grafiknya: byte PNG untuk backend png, ukuran elemen
+Vega-Lite (spesifikasi dan data Arrow) untuk backend vega-lite. Hasil analisis
+dihitung dulu sekali agar yang diukur hanya grafik; cache gambar PNG
+dikosongkan sebelum setiap bagian (dingin) lalu bagian dijalankan sekali lagi
+(hangat). Jalankan dari direktori dashboard:
+
+    python -m benchmarks.charts
+"""
+
+import argparse
+import os
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import streamlit.logger  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from analysis import SECTIONS  # noqa: E402
+from figures import CHART_BACKENDS, CHARTS_VARIABLE, figure_cache  # noqa: E402
+
+DASHBOARD_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dashboard.py")
+
+
+def clear_figures() -> None:
+    """Fungsi untuk mengosongkan cache gambar di memori tanpa menyentuh salinan di disk."""
+    cache = figure_cache()
+    cache.spill_directory = None
+    with cache._lock:
+        cache.entries.clear()
+        cache.size = 0
+
+
+def payload_bytes(app: AppTest, backend: str) -> int:
+    """Fungsi untuk menghitung ukuran kiriman grafik pada run terakhir."""
+    if backend == 'png':
+        # Setiap PNG yang ditampilkan masuk ke cache gambar yang baru dikosongkan.
+        return figure_cache().size
+    return sum(element.proto.ByteSize() for element in app.get('arrow_vega_lite_chart'))
+
+
+def interaction(app: AppTest, section: str) -> float:
+    """Fungsi untuk memilih bagian di dashboard; mengembalikan waktu CPU proses dalam detik."""
+    started = time.process_time()
+    app.radio[0].set_value(section).run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].value)
+    return time.process_time() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sections', nargs='+', choices=list(SECTIONS), default=list(SECTIONS), metavar='SECTION')
+    args = parser.parse_args()
+    streamlit.logger.set_log_level("error")
+
+    results = {}
+    for backend in CHART_BACKENDS:
+        os.environ[CHARTS_VARIABLE] = backend
+        app = AppTest.from_file(DASHBOARD_FILE, default_timeout=600)
+        app.run()
+        # Hasil analisis dan tabel sumber dihitung dulu agar tidak ikut terukur.
+        for section in args.sections:
+            interaction(app, section)
+        for section in args.sections:
+            # Pindah ke bagian lain dulu agar memilih `section` adalah interaksi baru.
+            other = next(name for name in SECTIONS if name != section)
+            interaction(app, other)
+            clear_figures()
+            cold = interaction(app, section)
+            size = payload_bytes(app, backend)
+            interaction(app, other)
+            warm = interaction(app, section)
+            results[backend, section] = cold, warm, size
+
+    print(f"{'bagian':<24}{'backend':<11}{'CPU dingin':>11}{'CPU hangat':>11}{'kiriman':>11}")
+    for section in args.sections:
+        for backend in CHART_BACKENDS:
+            cold, warm, size = results[backend, section]
+            print(f"{section:<24}{backend:<11}{cold:>10.3f}s{warm:>10.3f}s{size / 1024:>9.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark cold start: membandingkan pd.read_csv dengan cache Feather.
+
+Jalankan dari direktori dashboard:
+
+    python -m benchmarks.cold_start
+
+Setiap mode dijalankan di proses baru agar waktu muat dan peak RSS tidak
+terpengaruh oleh cache dari mode sebelumnya.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+MODES = ['import', 'csv', 'feather', 'feather-columns']
+
+
+def run_child(mode: str) -> None:
+    """Fungsi untuk memuat seluruh tabel dengan satu mode lalu mencetak hasilnya."""
+    import pandas as pd
+
+    import loader
+    from loader import TABLES, USED_COLUMNS
+
+    start = time.perf_counter()
+    if mode == 'csv':
+        # Jalur lama dashboard.py: read_csv tanpa dtype untuk sembilan tabel.
+        tables = {name: pd.read_csv(loader.data_path(spec['file'])) for name, spec in TABLES.items()}
+    elif mode == 'feather':
+        tables = {name: loader.read_columnar(name) for name in TABLES}
+    elif mode == 'feather-columns':
+        tables = {name: loader.read_columnar(name, cols) for name, cols in USED_COLUMNS.items()}
+    else:
+        tables = {}
+    elapsed = time.perf_counter() - start
+    rows = sum(len(df) for df in tables.values())
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({'mode': mode, 'seconds': elapsed, 'peak_rss_mb': peak_rss_mb, 'rows': rows}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help="jumlah pengulangan per mode")
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    # Konversi dilakukan di proses terpisah: peak RSS proses induk ikut
+    # terwarisi oleh proses anak hasil fork di Linux.
+    subprocess.run([sys.executable, '-c', 'import loader; loader.build_columnar_cache()'],
+                   check=True, capture_output=True)
+
+    print(f"{'mode':<16}{'detik':>10}{'peak RSS (MB)':>16}{'baris':>12}")
+    for mode in MODES:
+        runs = []
+        for _ in range(args.repeat):
+            out = subprocess.run([sys.executable, '-m', 'benchmarks.cold_start', '--child', mode],
+                                 check=True, capture_output=True, text=True).stdout
+            runs.append(json.loads(out.strip().splitlines()[-1]))
+        best = min(runs, key=lambda r: r['seconds'])
+        print(f"{mode:<16}{best['seconds']:>10.3f}{best['peak_rss_mb']:>16.1f}{best['rows']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark mesin agregasi: membandingkan waktu pandas dan DuckDB.
+
+Jalankan dari direktori dashboard (mesin duckdb butuh `pip install duckdb`):
+
+    python -m benchmarks.engines --threads 1 2 4 8
+
+Waktu seluruh agregasi di engines.AGGREGATES (rentang penuh dan satu tahun)
+diukur per mesin, untuk DuckDB dengan beberapa jumlah thread. Kesamaan hasil
+antar mesin diperiksa oleh tests/test_engines.py.
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+
+import pandas as pd
+import streamlit.logger
+
+
+def time_engine(engine: str, ranges: list, repeat: int) -> float:
+    """Fungsi untuk mengukur waktu terbaik menjalankan semua agregasi pada semua rentang."""
+    from engines import AGGREGATES, ENGINES
+
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for start, end in ranges:
+            for name in AGGREGATES:
+                ENGINES[engine](name, start, end)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, os.cpu_count()],
+                        help="jumlah thread DuckDB yang diukur")
+    parser.add_argument('--repeat', type=int, default=3, help="jumlah pengulangan per mesin")
+    args = parser.parse_args()
+    streamlit.logger.set_log_level("error")
+
+    from engines import THREADS_VARIABLE
+    from facts import fact_table, payment_table
+    from rollups import date_bounds
+
+    engines = ['duckdb'] if importlib.util.find_spec('duckdb') else []
+    if not engines:
+        print("duckdb tidak terpasang; hanya pandas yang diukur.")
+    # Tabel fakta dibangun dulu agar tidak ikut terukur.
+    fact_table(), payment_table()
+    first, last = date_bounds()
+    year = pd.Timestamp(last) - pd.DateOffset(years=1)
+    ranges = [(None, None), (year, pd.Timestamp(last) + pd.Timedelta(days=1))]
+
+    print(f"{len(fact_table())} baris fakta, {first} - {last}")
+
+    print(f"{'mesin':<10}{'thread':>8}{'detik':>10}{'speedup':>10}")
+    baseline = time_engine('pandas', ranges, args.repeat)
+    print(f"{'pandas':<10}{1:>8}{baseline:>10.3f}{1:>10.2f}")
+    for engine in engines:
+        for threads in args.threads:
+            os.environ[THREADS_VARIABLE] = str(threads)
+            time_engine(engine, ranges[:1], 1)  # registrasi tabel tidak ikut terukur
+            seconds = time_engine(engine, ranges, args.repeat)
+            print(f"{engine:<10}{threads:>8}{seconds:>10.3f}{baseline / seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark peta choropleth 6c: GeoJSON mentah vs GeoParquet sederhana vs cache.
+
+Jalankan dari direktori dashboard:
+
+    python -m benchmarks.geo_render
+
+Sebelum mengukur, akses jaringan diblokir di proses ini untuk membuktikan
+peta bisa dimuat tanpa koneksi.
+"""
+
+import argparse
+import io
+import socket
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import geopandas as gpd  # noqa: E402
+import matplotlib.pyplot as plt  # noqa: E402
+import shapely  # noqa: E402
+
+import geo  # noqa: E402
+from loader import data_path  # noqa: E402
+
+
+def block_network() -> None:
+    """Fungsi untuk menolak semua koneksi socket di proses ini."""
+    def refuse(*args, **kwargs):
+        raise OSError("akses jaringan diblokir oleh benchmark")
+    socket.socket.connect = refuse
+    socket.create_connection = refuse
+
+
+def render(states: gpd.GeoDataFrame) -> None:
+    """Fungsi untuk menggambar choropleth seperti di dashboard (tanpa Streamlit)."""
+    fig, ax = plt.subplots(figsize=(12, 8))
+    states.assign(order_count=range(len(states))).plot(column='order_count', cmap='Blues', linewidth=0.8,
+                                                       edgecolor='black', legend=True, ax=ax)
+    fig.savefig(io.BytesIO(), format='png')
+    plt.close(fig)
+
+
+def timed(label: str, load, repeat: int) -> gpd.GeoDataFrame:
+    """Fungsi untuk mengukur waktu muat dan render terbaik dari beberapa pengulangan."""
+    best_load = best_render = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        states = load()
+        loaded = time.perf_counter()
+        render(states)
+        best_load = min(best_load, loaded - start)
+        best_render = min(best_render, time.perf_counter() - loaded)
+    vertices = shapely.get_num_coordinates(states.geometry.values).sum()
+    print(f"{label:<24}{best_load:>12.3f}{best_render:>12.3f}{vertices:>12}")
+    return states
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help="jumlah pengulangan per mode")
+    args = parser.parse_args()
+
+    block_network()
+    geo.build_geoparquet()
+    print(f"{'mode':<24}{'muat (s)':>12}{'render (s)':>12}{'titik':>12}")
+    timed("geojson (read_file)", lambda: gpd.read_file(data_path(geo.BRAZIL_STATES_FILE)), args.repeat)
+    timed("geoparquet sederhana", lambda: gpd.read_parquet(geo.geoparquet_path()), args.repeat)
+    states = geo.read_brazil_states()
+    timed("cache proses", lambda: states, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark peringkat top-N: kubus berkode integer vs groupby atas tabel fakta.
+
+Jalankan dari direktori dashboard:
+
+    python -m benchmarks.rankings --top 10
+
+Untuk setiap peringkat di rankings.RANKINGS, hasil dari kubusnya dibandingkan
+dengan agregasi pandas engines.AGGREGATES bernama sama yang diurutkan penuh
+(seller teratas per kategori lewat idxmax, seperti sebelumnya) pada rentang
+penuh, 90 hari, dan 7 hari terakhir; perbedaan apa pun membuat skrip berhenti
+dengan kode keluar 1. Setelah itu waktu terbaik kedua cara diukur per
+peringkat dan rentang.
+"""
+
+import argparse
+import sys
+import time
+
+import pandas as pd
+import streamlit.logger
+
+
+def groupby_ranking(name: str, start: pd.Timestamp, end: pd.Timestamp, n: int) -> pd.DataFrame:
+    """Fungsi untuk memeringkat dengan cara lama: groupby penuh, sort_values, lalu head atau idxmax."""
+    from engines import ENGINES
+    from rankings import RANKINGS
+
+    spec = RANKINGS[name]
+    values = ENGINES['pandas'](name, start, end).rename(spec['value'])
+    if len(spec['by']) > 1 and name == 'orders_by_category_seller':
+        frame = values.reset_index()
+        return frame.loc[frame.groupby(spec['by'][0])[spec['value']].idxmax()].reset_index(drop=True)
+    frame = values.sort_values(ascending=False, kind='stable').reset_index()
+    return frame.head(n) if len(spec['by']) > 1 or name == 'orders_by_seller' else frame
+
+
+def cube_ranking(name: str, start: pd.Timestamp, end: pd.Timestamp, n: int) -> pd.DataFrame:
+    """Fungsi untuk memeringkat dari kubus lewat rankings.py, dengan jumlah baris yang sama seperti `groupby_ranking`."""
+    from rankings import RANKINGS, ranking, top_per_group
+    from rollups import cube_range
+
+    spec = RANKINGS[name]
+    cube = cube_range(spec['cube'], start, end)
+    if name == 'orders_by_category_seller':
+        return top_per_group(cube, name)
+    return ranking(cube, name, n if len(spec['by']) > 1 or name == 'orders_by_seller' else None)
+
+
+def best_time(compute, repeat: int) -> float:
+    """Fungsi untuk mengukur waktu terbaik dari beberapa pengulangan."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compute()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--top', type=int, default=10, help="jumlah baris peringkat teratas")
+    parser.add_argument('--repeat', type=int, default=5, help="jumlah pengulangan per pengukuran")
+    args = parser.parse_args()
+    streamlit.logger.set_log_level("error")
+
+    from facts import fact_table
+    from rankings import RANKINGS
+    from rollups import cubes, date_bounds
+
+    # Tabel fakta dan kubus dibangun dulu agar tidak ikut terukur.
+    fact_table(), cubes()
+    first, last = date_bounds()
+    end = pd.Timestamp(last) + pd.Timedelta(days=1)
+    ranges = {'penuh': (None, None), '90 hari': (end - pd.Timedelta(days=90), end),
+              '7 hari': (end - pd.Timedelta(days=7), end)}
+
+    failures = 0
+    for name in RANKINGS:
+        for label, (start, stop) in ranges.items():
+            expected = groupby_ranking(name, start, stop, args.top)
+            actual = cube_ranking(name, start, stop, args.top).drop(columns='share')
+            try:
+                pd.testing.assert_frame_equal(expected, actual, check_dtype=False, check_exact=False, rtol=1e-9)
+            except AssertionError as error:
+                failures += 1
+                print(f"BEDA  {name:<28}{label}: {str(error).splitlines()[0]}")
+    print(f"Kesamaan hasil: {'OK' if not failures else f'{failures} perbedaan'} "
+          f"({len(fact_table())} baris fakta, {first} - {last})")
+
+    print(f"{'peringkat':<28}{'rentang':<10}{'groupby ms':>12}{'kubus ms':>10}{'speedup':>10}")
+    for name in RANKINGS:
+        for label, (start, stop) in ranges.items():
+            grouped = best_time(lambda: groupby_ranking(name, start, stop, args.top), args.repeat)
+            ranked = best_time(lambda: cube_ranking(name, start, stop, args.top), args.repeat)
+            print(f"{name:<28}{label:<10}{grouped * 1000:>12.2f}{ranked * 1000:>10.2f}{grouped / ranked:>10.1f}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark replika: memori per replika dashboard dengan dan tanpa hasil olahan bersama.
+
+Beberapa proses replika dijalankan bersamaan di direktori kerja saat ini
+(yang berisi main-data). Setiap replika memuat tabel fakta, pembayaran,
+kubus, dan kohort lalu menghitung semua bagian analysis.SECTIONS sekali,
+kemudian memorinya dibaca dari /proc/<pid>/smaps_rollup selagi semua replika
+masih hidup:
+
+- lokal:   setiap replika membangun tabelnya sendiri dari cache kolumnar;
+- bersama: satu proses penerbit (ingest.py --rebuild) menulis hasil olahan ke
+           DASHBOARD_STATE_DIRECTORY di tmpfs dan replika memetakannya.
+
+PSS membagi halaman bersama rata ke semua proses yang memetakannya, dan
+Anonymous adalah memori privat replika. Jalankan dari direktori dashboard:
+
+    python -m benchmarks.replicas --replicas 4
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+DASHBOARD_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIELDS = ['Rss', 'Pss', 'Anonymous', 'Shared_Clean']
+
+
+def run_child() -> None:
+    """Fungsi untuk memuat data dan menghitung semua bagian seperti satu replika, lalu menunggu diukur."""
+    import streamlit.logger
+
+    streamlit.logger.set_log_level("error")
+
+    from analysis import SECTIONS
+    from cohorts import cohorts
+    from facts import fact_table, payment_table
+    from rollups import cubes
+
+    fact_table(), payment_table(), cubes(), cohorts()
+    for compute in SECTIONS.values():
+        compute()
+    gc.collect()
+    print("siap", flush=True)
+    sys.stdin.readline()
+
+
+def smaps_rollup(pid: int) -> dict:
+    """Fungsi untuk membaca ringkasan memori (MB) sebuah proses dari /proc/<pid>/smaps_rollup."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(':')
+            if name in FIELDS:
+                values[name] = int(rest.split()[0]) / 1024
+    return values
+
+
+def run_replicas(count: int, env: dict) -> list:
+    """Fungsi untuk menjalankan `count` replika bersamaan dan mengukur memori masing-masing."""
+    replicas = [subprocess.Popen([sys.executable, '-m', 'benchmarks.replicas', '--child'], env=env, text=True,
+                                 stdin=subprocess.PIPE, stdout=subprocess.PIPE) for _ in range(count)]
+    try:
+        for replica in replicas:
+            if replica.stdout.readline().strip() != "siap":
+                raise RuntimeError(f"replika gagal (kode {replica.wait()})")
+        return [smaps_rollup(replica.pid) for replica in replicas]
+    finally:
+        for replica in replicas:
+            if replica.poll() is None:
+                replica.stdin.close()
+            replica.wait()
+
+
+def _print(mode: str, usage: list, seconds: float) -> None:
+    mean = {field: sum(entry[field] for entry in usage) / len(usage) for field in FIELDS}
+    total = sum(entry['Pss'] for entry in usage)
+    print(f"{mode:<10}" + "".join(f"{mean[field]:>14.0f}" for field in FIELDS) + f"{total:>12.0f}{seconds:>9.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--replicas', type=int, default=3, help="jumlah replika yang dijalankan bersamaan")
+    parser.add_argument('--shm', default="/dev/shm" if os.path.isdir("/dev/shm") else None,
+                        help="direktori tmpfs untuk hasil olahan bersama (bawaan: /dev/shm)")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([DASHBOARD_DIRECTORY, os.environ.get('PYTHONPATH', '')]))
+    print(f"{args.replicas} replika, rata-rata per replika (MB); total PSS semua replika")
+    print(f"{'mode':<10}" + "".join(f"{field:>14}" for field in FIELDS) + f"{'total PSS':>12}{'waktu':>10}")
+    state = tempfile.mkdtemp(prefix="dashboard-state-", dir=args.shm)
+    try:
+        # Direktori kosong: tidak ada hasil olahan, jadi setiap replika membangun sendiri.
+        env['DASHBOARD_STATE_DIRECTORY'] = state
+        started = time.perf_counter()
+        _print('lokal', run_replicas(args.replicas, env), time.perf_counter() - started)
+
+        subprocess.run([sys.executable, os.path.join(DASHBOARD_DIRECTORY, 'ingest.py'), '--rebuild'], env=env,
+                       check=True, capture_output=True)
+        started = time.perf_counter()
+        _print('bersama', run_replicas(args.replicas, env), time.perf_counter() - started)
+    finally:
+        shutil.rmtree(state, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark skala: waktu dan memori setiap bagian analisis pada data sintetis.
+
+Untuk setiap faktor skala, data dibuat dengan benchmarks.synthetic (sekali,
+lalu dipakai ulang) dan diukur di proses baru: konversi ke cache kolumnar,
+pembangunan tabel fakta/kubus/kohort, lalu setiap bagian analysis.SECTIONS
+untuk rentang penuh dan 90 hari terakhir. Hasil disimpan sebagai JSON agar
+bisa dibandingkan dengan hasil sebelumnya. Jalankan dari direktori dashboard:
+
+    python -m benchmarks.sections --scales 1 10 --data /tmp/olist-bench
+    python -m benchmarks.sections --scales 1 --compare benchmarks/results/sebelumnya.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+DASHBOARD_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIRECTORY = os.path.join(DASHBOARD_DIRECTORY, "benchmarks", "results")
+RECENT_DAYS = 90
+
+
+def _peak_rss_mb() -> float:
+    # VmHWM milik proses ini saja; ru_maxrss di Linux terbawa dari proses
+    # induk melewati exec (mis. memori saat membuat data sintetis).
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child() -> None:
+    """Fungsi untuk mengukur satu skala di direktori kerja saat ini lalu mencetak hasilnya sebagai JSON."""
+    started = time.perf_counter()
+    import streamlit.logger
+
+    streamlit.logger.set_log_level("error")
+
+    import pandas as pd
+
+    from analysis import SECTIONS
+    from cohorts import cohorts
+    from facts import fact_table, payment_table
+    from loader import build_columnar_cache
+    from rollups import cubes, date_bounds
+
+    result = {'stages': {'import': {'seconds': round(time.perf_counter() - started, 4),
+                                    'peak_rss_mb': round(_peak_rss_mb(), 1)}},
+              'sections': {}}
+
+    def measure(name: str, compute, target: dict):
+        started = time.perf_counter()
+        value = compute()
+        target[name] = {'seconds': round(time.perf_counter() - started, 4), 'peak_rss_mb': round(_peak_rss_mb(), 1)}
+        return value
+
+    measure('columnar_cache', lambda: build_columnar_cache(force=True), result['stages'])
+    fact = measure('fact_table', fact_table, result['stages'])
+    measure('payment_table', payment_table, result['stages'])
+    measure('cubes', cubes, result['stages'])
+    measure('cohorts', cohorts, result['stages'])
+    result['rows'] = {'fact': len(fact), 'orders': int(fact['first_item'].sum())}
+
+    last = pd.Timestamp(date_bounds()[1]) + pd.Timedelta(days=1)
+    ranges = {'full': (None, None), f'last_{RECENT_DAYS}_days': (last - pd.Timedelta(days=RECENT_DAYS), last)}
+    for section, compute in SECTIONS.items():
+        for label, (start, end) in ranges.items():
+            measure(f"{section} / {label}", lambda: compute(start, end), result['sections'])
+    result['peak_rss_mb'] = round(_peak_rss_mb(), 1)
+    print(json.dumps(result))
+
+
+def run_scale(scale: float, data: str, engine: str) -> dict:
+    """Fungsi untuk membuat data skala `scale` bila belum ada lalu mengukurnya di proses baru."""
+    directory = os.path.join(data, f"scale-{scale:g}")
+    data_directory = os.path.join(directory, "main-data")
+    if not os.path.exists(os.path.join(data_directory, "orders_cleaned.csv")):
+        from benchmarks.synthetic import generate
+
+        started = time.perf_counter()
+        generate(data_directory, scale)
+        print(f"skala {scale:g}: data dibuat dalam {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([DASHBOARD_DIRECTORY, os.environ.get('PYTHONPATH', '')]),
+               DASHBOARD_ENGINE=engine)
+    out = subprocess.run([sys.executable, '-m', 'benchmarks.sections', '--child'], cwd=directory, env=env,
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def compare(current: dict, previous: dict, threshold: float) -> int:
+    """Fungsi untuk mencetak rasio waktu terhadap hasil sebelumnya; mengembalikan jumlah regresi."""
+    regressions = 0
+    print(f"{'skala':<7}{'langkah':<44}{'sebelum':>10}{'sekarang':>10}{'rasio':>8}")
+    for scale, result in current['scales'].items():
+        old = previous.get('scales', {}).get(scale)
+        if old is None:
+            continue
+        for group in ('stages', 'sections'):
+            for name, entry in result[group].items():
+                before = old[group].get(name, {}).get('seconds')
+                if not before:
+                    continue
+                ratio = entry['seconds'] / before
+                flag = " <-- lebih lambat" if ratio > threshold and entry['seconds'] - before > 0.05 else ""
+                regressions += bool(flag)
+                print(f"{scale:<7}{name:<44}{before:>10.3f}{entry['seconds']:>10.3f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=float, nargs='+', default=[1.0], help="faktor skala (mis. 1 10 100)")
+    parser.add_argument('--data', default=os.path.join(DASHBOARD_DIRECTORY, "main-data", ".cache", "synthetic"),
+                        help="direktori data sintetis per skala")
+    parser.add_argument('--engine', default=os.environ.get('DASHBOARD_ENGINE', 'pandas'), help="mesin agregasi")
+    parser.add_argument('--output', help="file JSON hasil (bawaan: benchmarks/results/sections-<waktu>.json)")
+    parser.add_argument('--compare', help="file JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument('--threshold', type=float, default=1.25, help="rasio waktu yang dianggap regresi")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    import pandas as pd
+
+    results = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'engine': args.engine,
+        'host': {'python': platform.python_version(), 'pandas': pd.__version__, 'cpus': os.cpu_count(),
+                 'machine': platform.machine()},
+        'scales': {},
+    }
+    for scale in args.scales:
+        result = results['scales'][f"{scale:g}"] = run_scale(scale, args.data, args.engine)
+        print(f"skala {scale:g}: {result['rows']['orders']} pesanan, peak RSS {result['peak_rss_mb']:.0f} MB")
+        for group in ('stages', 'sections'):
+            for name, entry in result[group].items():
+                print(f"  {name:<44}{entry['seconds']:>9.3f}s{entry['peak_rss_mb']:>9.0f} MB")
+
+    output = args.output or os.path.join(
+        RESULTS_DIRECTORY, f"sections-{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Hasil -> {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark startup dashboard: waktu impor dan waktu sampai render pertama.
+
+Bagian pertama menjalankan `python -X importtime` untuk modul yang diimpor
+dashboard.py dan mencetak total waktu impor, modul teratas, serta pustaka
+berat (matplotlib, seaborn, geopandas, shapely) yang ikut termuat.
+
+Bagian kedua menyalin CSV di main-data ke direktori sementara lalu menjalankan
+dashboard dengan streamlit.testing (AppTest) di proses baru: sekali dengan
+salinan tanpa cache (replika dingin) dan sekali setelah `warmup.py`. Yang diukur
+adalah waktu sejak proses dimulai sampai bagian pertama selesai dirender,
+lalu waktu membuka bagian Geospatial. Jalankan dari direktori dashboard:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --backends png --no-report
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+DASHBOARD_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DASHBOARD_FILE = os.path.join(DASHBOARD_DIRECTORY, "dashboard.py")
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'geopandas', 'shapely', 'pyarrow', 'duckdb']
+CHART_BACKENDS = ['png', 'vega-lite']
+GEO_SECTION = "Geospatial"
+
+
+def dashboard_imports() -> list:
+    """Fungsi untuk mendaftar modul tingkat atas yang diimpor dashboard.py."""
+    with open(DASHBOARD_FILE) as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def import_times(modules: list) -> tuple:
+    """Fungsi untuk menjalankan `python -X importtime`; mengembalikan waktu kumulatif per modul akar dan pustaka berat yang termuat."""
+    code = f"import sys; import {', '.join(modules)}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    done = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=DASHBOARD_DIRECTORY,
+                          capture_output=True, text=True, check=True)
+    roots = {}
+    for line in done.stderr.splitlines():
+        # Baris akar tidak berindentasi: "import time:   123 |   4567 | pandas".
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| (\S.*)$", line)
+        if match:
+            roots[match.group(3)] = int(match.group(2)) / 1e6
+    return roots, done.stdout.split()
+
+
+def run_child(section: str, started: float) -> None:
+    """Fungsi untuk merender bagian pertama lalu `section`; mencetak waktunya sebagai JSON."""
+    import streamlit.logger
+    from streamlit.testing.v1 import AppTest
+
+    streamlit.logger.set_log_level("error")
+    app = AppTest.from_file(DASHBOARD_FILE, default_timeout=600)
+    app.run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].value)
+    first = time.time() - started
+    heavy_first = [name for name in HEAVY_MODULES if name in sys.modules]
+    switched = time.perf_counter()
+    app.radio[0].set_value(section).run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].value)
+    print(json.dumps({
+        'first_render': first,
+        'section': time.perf_counter() - switched,
+        'heavy_first': heavy_first,
+        'heavy_section': [name for name in HEAVY_MODULES if name in sys.modules],
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def copy_data(source: str, target: str) -> None:
+    """Fungsi untuk menyalin file data (tanpa .cache dan laporan) ke `target`/main-data."""
+    from loader import DATA_DIRECTORY
+
+    os.makedirs(os.path.join(target, DATA_DIRECTORY))
+    for name in os.listdir(source):
+        path = os.path.join(source, name)
+        if os.path.isfile(path) and not name.startswith('.'):
+            shutil.copy2(path, os.path.join(target, DATA_DIRECTORY, name))
+
+
+def render(directory: str, backend: str) -> dict:
+    """Fungsi untuk mengukur render pertama dashboard di proses baru dengan data di `directory`."""
+    from figures import CHARTS_VARIABLE
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [DASHBOARD_DIRECTORY, os.environ.get('PYTHONPATH')])))
+    env[CHARTS_VARIABLE] = backend
+    started = time.time()
+    done = subprocess.run([sys.executable, '-m', 'benchmarks.startup', '--child', GEO_SECTION, '--started', str(started)],
+                          cwd=directory, env=env, capture_output=True, text=True)
+    if done.returncode:
+        raise RuntimeError(done.stderr)
+    return json.loads(done.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--backends', nargs='+', choices=CHART_BACKENDS, default=CHART_BACKENDS)
+    parser.add_argument('--no-report', action='store_true', help="warm-up tanpa laporan rentang penuh")
+    parser.add_argument('--top', type=int, default=8, help="jumlah modul impor terlama yang dicetak")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--started', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.started)
+        return
+
+    from loader import DATA_DIRECTORY
+
+    roots, heavy = import_times(dashboard_imports())
+    print(f"Impor modul dashboard.py: {sum(roots.values()):.3f}s (python -X importtime)")
+    for name, seconds in sorted(roots.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<30}{seconds:>8.3f}s")
+    print(f"  pustaka berat termuat: {', '.join(heavy) or '-'}")
+
+    print(f"\n{'replika':<10}{'backend':<11}{'render pertama':>15}{GEO_SECTION:>12}{'peak RSS':>11}  pustaka berat")
+    with tempfile.TemporaryDirectory() as workdir:
+        for backend in args.backends:
+            # Salinan baru untuk setiap backend: cache yang dibangun run sebelumnya tidak ikut terpakai.
+            cold = os.path.join(workdir, f"dingin-{backend}")
+            copy_data(DATA_DIRECTORY, cold)
+            result = render(cold, backend)
+            print(f"{'dingin':<10}{backend:<11}{result['first_render']:>14.2f}s{result['section']:>11.2f}s"
+                  f"{result['peak_rss_mb']:>8.0f} MB  {', '.join(result['heavy_first']) or '-'} -> "
+                  f"{', '.join(result['heavy_section'])}")
+        warm = os.path.join(workdir, "warm-up")
+        copy_data(DATA_DIRECTORY, warm)
+        started = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(DASHBOARD_DIRECTORY, "warmup.py")] +
+                       (['--no-report'] if args.no_report else []), cwd=warm, check=True, capture_output=True)
+        warm_up = time.perf_counter() - started
+        for backend in args.backends:
+            result = render(warm, backend)
+            print(f"{'warm-up':<10}{backend:<11}{result['first_render']:>14.2f}s{result['section']:>11.2f}s"
+                  f"{result['peak_rss_mb']:>8.0f} MB  {', '.join(result['heavy_first']) or '-'} -> "
+                  f"{', '.join(result['heavy_section'])}")
+    print(f"\nwarmup.py sendiri: {warm_up:.2f}s (dijalankan sekali sebelum replika dimulai)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generator data sintetis berbentuk dataset Olist untuk benchmark.
+
+Menulis sembilan tabel *_cleaned.csv dengan kolom dan dtype yang sama seperti
+main-data. Skala 1 kira-kira sebesar dataset asli (99.441 pesanan); pesanan,
+pelanggan, produk, dan seller bertambah linear dengan skala, sedangkan tabel
+terjemahan kategori dan geolocation (referensi prefiks kode pos) tetap.
+Sebarannya meniru data asli: pelanggan dan seller terpusat di SP, popularitas
+produk dan seller berekor panjang (lognormal), sekitar 3% pelanggan berbelanja ulang,
+sebagian kecil pesanan punya banyak item atau pembayaran, jumlah pesanan naik
+dari 2016 ke 2018, dan pengiriman terlambat cenderung mendapat ulasan buruk.
+
+Hasilnya deterministik untuk seed yang sama. Pesanan dibuat per potongan
+sehingga skala 100 tidak perlu muat di memori sekaligus. Contoh pemakaian dari
+direktori dashboard:
+
+    python -m benchmarks.synthetic --scale 10 --output /tmp/olist-10/main-data
+"""
+
+import argparse
+import binascii
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from loader import DATA_DIRECTORY, TABLES
+
+BASE_ORDERS = 99_441
+BASE_PRODUCTS = 32_951
+BASE_SELLERS = 3_095
+BASE_CITIES = 4_100
+GEOLOCATION_ROWS = 1_000_000
+REPEAT_SHARE = 0.03
+CHUNK_ORDERS = 500_000
+FIRST_PURCHASE = pd.Timestamp("2016-09-04")
+LAST_PURCHASE = pd.Timestamp("2018-10-17")
+
+# Negara bagian: (bobot pelanggan %, bobot seller %, awal dan akhir prefiks kode
+# pos, lintang, bujur, ibu kota).
+STATES = {
+    'SP': (41.9, 59.7, 1000, 19999, -22.2, -48.8, "sao paulo"),
+    'RJ': (12.9, 5.5, 20000, 28999, -22.3, -42.7, "rio de janeiro"),
+    'ES': (2.0, 0.8, 29000, 29999, -19.6, -40.6, "vitoria"),
+    'MG': (11.7, 7.9, 30000, 39999, -18.5, -44.6, "belo horizonte"),
+    'BA': (3.4, 0.6, 40000, 48999, -12.5, -41.7, "salvador"),
+    'SE': (0.35, 0.05, 49000, 49999, -10.6, -37.4, "aracaju"),
+    'PE': (1.7, 0.3, 50000, 56999, -8.4, -37.9, "recife"),
+    'AL': (0.41, 0.05, 57000, 57999, -9.6, -36.6, "maceio"),
+    'PB': (0.54, 0.2, 58000, 58999, -7.1, -36.8, "joao pessoa"),
+    'RN': (0.49, 0.2, 59000, 59999, -5.8, -36.6, "natal"),
+    'CE': (1.3, 0.4, 60000, 63999, -5.2, -39.5, "fortaleza"),
+    'PI': (0.5, 0.05, 64000, 64999, -7.7, -42.7, "teresina"),
+    'MA': (0.75, 0.05, 65000, 65999, -5.0, -45.3, "sao luis"),
+    'PA': (1.0, 0.05, 66000, 68899, -3.9, -52.5, "belem"),
+    'AP': (0.07, 0.01, 68900, 68999, 1.4, -51.8, "macapa"),
+    'AM': (0.15, 0.05, 69000, 69299, -4.1, -63.0, "manaus"),
+    'RR': (0.05, 0.01, 69300, 69399, 2.1, -61.4, "boa vista"),
+    'AC': (0.08, 0.01, 69900, 69999, -9.0, -70.5, "rio branco"),
+    'DF': (2.2, 1.0, 70000, 72799, -15.8, -47.9, "brasilia"),
+    'GO': (2.0, 1.3, 72800, 76799, -16.0, -49.6, "goiania"),
+    'RO': (0.25, 0.05, 76800, 76999, -10.9, -62.8, "porto velho"),
+    'TO': (0.28, 0.05, 77000, 77999, -10.2, -48.3, "palmas"),
+    'MT': (0.9, 0.2, 78000, 78899, -12.9, -55.9, "cuiaba"),
+    'MS': (0.72, 0.2, 79000, 79999, -20.5, -54.5, "campo grande"),
+    'PR': (5.1, 11.3, 80000, 87999, -24.6, -51.6, "curitiba"),
+    'SC': (3.7, 6.1, 88000, 89999, -27.3, -50.5, "florianopolis"),
+    'RS': (5.5, 4.0, 90000, 99999, -29.7, -53.2, "porto alegre"),
+}
+STATE_CODES = np.array(list(STATES))
+ORDER_STATUSES = (['delivered', 'shipped', 'canceled', 'unavailable', 'invoiced', 'processing'],
+                  [0.970, 0.011, 0.006, 0.006, 0.004, 0.003])
+ITEMS_PER_ORDER = ([1, 2, 3, 4, 5, 6], [0.900, 0.076, 0.013, 0.007, 0.002, 0.002])
+PAYMENT_TYPES = (['credit_card', 'boleto', 'voucher', 'debit_card'], [0.740, 0.190, 0.055, 0.015])
+REVIEW_SCORES = [1, 2, 3, 4, 5]
+REVIEWS_ON_TIME = [0.08, 0.03, 0.08, 0.20, 0.61]
+REVIEWS_LATE = [0.45, 0.08, 0.12, 0.12, 0.23]
+
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+def _mix(values: np.ndarray, salt: int) -> np.ndarray:
+    # splitmix64: bilangan bulat berurutan menjadi bit acak yang stabil.
+    z = values.astype(np.uint64) + np.uint64(salt * _GOLDEN % (1 << 64))
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def hex_ids(values: np.ndarray, salt: int) -> np.ndarray:
+    """Fungsi untuk membuat ID heksadesimal 32 karakter (seperti ID Olist) dari nomor urut."""
+    words = np.stack([_mix(values, salt), _mix(values, salt + 1)], axis=1).astype('>u8')
+    return np.frombuffer(binascii.hexlify(words.tobytes()), dtype='S32').astype(str)
+
+
+def _uniform(values: np.ndarray, salt: int) -> np.ndarray:
+    return (_mix(values, salt) >> np.uint64(11)).astype('float64') / float(1 << 53)
+
+
+def _state_cities(scale: float) -> dict:
+    # Ibu kota di posisi 0; pemilihan indeks condong ke awal (lihat `_skewed`).
+    weights = np.array([spec[0] for spec in STATES.values()])
+    counts = np.maximum(3, np.round(BASE_CITIES * weights / weights.sum())).astype(int)
+    return {state: np.array([spec[6]] + [f"{spec[6]} {k}" for k in range(1, count)])
+            for (state, spec), count in zip(STATES.items(), counts)}
+
+
+def _skewed(u: np.ndarray, size, power: float = 8.0) -> np.ndarray:
+    return np.minimum((u ** power * size).astype('int64'), np.asarray(size) - 1)
+
+
+def _places(keys: np.ndarray, weight: int, salt: int, cities: dict) -> tuple:
+    """Fungsi untuk menentukan negara bagian, kota, dan prefiks kode pos yang stabil untuk setiap kunci."""
+    weights = np.array([spec[weight] for spec in STATES.values()])
+    cumulative = np.cumsum(weights) / weights.sum()
+    state_index = np.minimum(np.searchsorted(cumulative, _uniform(keys, salt), side='right'), len(STATES) - 1)
+    states = STATE_CODES[state_index]
+    city = np.empty(len(keys), dtype=object)
+    zip_prefix = np.empty(len(keys), dtype='int32')
+    u = _uniform(keys, salt + 1)
+    for i, (state, spec) in enumerate(STATES.items()):
+        rows = state_index == i
+        names = cities[state]
+        index = _skewed(u[rows], len(names))
+        city[rows] = names[index]
+        # Setiap kota mendapat rentang prefiks kode posnya sendiri.
+        width = max(1, (spec[3] - spec[2] + 1) // len(names))
+        zip_prefix[rows] = spec[2] + index * width + (_mix(keys[rows], salt + 2) % np.uint64(width)).astype('int64')
+    return states, city, zip_prefix
+
+
+def _write(frame: pd.DataFrame, name: str, output: str, append: bool = False) -> None:
+    path = os.path.join(output, TABLES[name]['file'])
+    frame.to_csv(path, mode='a' if append else 'w', header=not append, index=False)
+
+
+def write_dimensions(output: str, scale: float, rng: np.random.Generator, translation: pd.DataFrame) -> dict:
+    """Fungsi untuk menulis tabel produk, seller, terjemahan kategori, dan geolocation."""
+    cities = _state_cities(scale)
+    n_sellers = max(10, round(BASE_SELLERS * scale))
+    seller_keys = np.arange(n_sellers)
+    seller_states, seller_cities, seller_zips = _places(seller_keys, 1, 11, cities)
+    sellers = pd.DataFrame({
+        'seller_id': hex_ids(seller_keys, 3),
+        'seller_zip_code_prefix': seller_zips,
+        'seller_city': seller_cities,
+        'seller_state': seller_states,
+    })
+    _write(sellers, 'sellers', output)
+
+    n_products = max(10, round(BASE_PRODUCTS * scale))
+    categories = translation['product_category_name'].to_numpy()
+    category = categories[np.minimum(rng.zipf(1.6, n_products) - 1, len(categories) - 1)].astype(object)
+    category[rng.random(n_products) < 0.019] = None
+    products = pd.DataFrame({
+        'product_id': hex_ids(np.arange(n_products), 5),
+        'product_category_name': category,
+        'product_name_lenght': rng.integers(5, 77, n_products).astype(float),
+        'product_description_lenght': np.round(rng.lognormal(6.4, 0.7, n_products)).clip(4, 3992),
+        'product_photos_qty': np.minimum(rng.geometric(0.5, n_products), 20).astype(float),
+        'product_weight_g': np.round(rng.lognormal(6.6, 1.2, n_products)).clip(2, 40425),
+        'product_length_cm': rng.integers(7, 105, n_products).astype(float),
+        'product_height_cm': rng.integers(2, 105, n_products).astype(float),
+        'product_width_cm': rng.integers(6, 118, n_products).astype(float),
+    })
+    _write(products, 'products', output)
+    translation.to_csv(os.path.join(output, TABLES['category_translation']['file']), index=False)
+
+    # Prefiks kode pos adalah referensi tetap, jadi ukurannya tidak ikut skala.
+    geo_keys = np.arange(GEOLOCATION_ROWS)
+    geo_states, geo_cities, geo_zips = _places(geo_keys, 0, 13, cities)
+    centers = np.array([[spec[4], spec[5]] for spec in STATES.values()])
+    state_index = pd.Index(STATE_CODES).get_indexer(geo_states)
+    spread = rng.normal(0, 1.5, (GEOLOCATION_ROWS, 2))
+    pd.DataFrame({
+        'geolocation_zip_code_prefix': geo_zips,
+        'geolocation_lat': centers[state_index, 0] + spread[:, 0],
+        'geolocation_lng': centers[state_index, 1] + spread[:, 1],
+        'geolocation_city': geo_cities,
+        'geolocation_state': geo_states,
+    }).to_csv(os.path.join(output, TABLES['geolocation']['file']), index=False)
+
+    # Popularitas, harga dasar, dan seller setiap produk. Popularitas lognormal
+    # membuat produk/seller teratas sekitar 0,5-2% item seperti data asli.
+    popularity = rng.lognormal(0, 1.5, n_products)
+    seller_weight = rng.lognormal(0, 1.5, n_sellers)
+    return {
+        'cities': cities,
+        'product_ids': products['product_id'].to_numpy(),
+        'product_popularity': np.cumsum(popularity) / popularity.sum(),
+        'product_seller': rng.choice(n_sellers, n_products, p=seller_weight / seller_weight.sum()),
+        'product_price': np.round(rng.lognormal(4.3, 0.9, n_products), 2).clip(0.85, 6735),
+        'seller_ids': sellers['seller_id'].to_numpy(),
+    }
+
+
+def write_orders(output: str, first: int, count: int, rng: np.random.Generator, dimensions: dict,
+                 append: bool) -> int:
+    """Fungsi untuk menulis satu potongan pesanan beserta pelanggan, item, pembayaran, dan ulasannya.
+
+    Mengembalikan jumlah baris item yang ditulis.
+    """
+    order_keys = np.arange(first, first + count)
+    # Sekitar REPEAT_SHARE pesanan berasal dari pelanggan yang sudah pernah
+    # berbelanja (nomor pelanggan diambil dari pesanan sebelumnya).
+    customer_keys = order_keys.copy()
+    repeat = (rng.random(count) < REPEAT_SHARE) & (order_keys > 0)
+    customer_keys[repeat] = (rng.random(repeat.sum()) * order_keys[repeat]).astype('int64')
+    states, cities, zips = _places(customer_keys, 0, 17, dimensions['cities'])
+    customer_ids = hex_ids(order_keys, 7)
+    customers = pd.DataFrame({
+        'customer_id': customer_ids,
+        'customer_unique_id': hex_ids(customer_keys, 9),
+        'customer_zip_code_prefix': zips,
+        'customer_city': cities,
+        'customer_state': states,
+    })
+    _write(customers, 'customers', output, append)
+
+    # Kepadatan pesanan naik linear sepanjang periode (akar dari seragam).
+    span = (LAST_PURCHASE - FIRST_PURCHASE).total_seconds()
+    purchase = FIRST_PURCHASE + pd.to_timedelta(np.sqrt(rng.random(count)) * span, unit='s').floor('s')
+    status = rng.choice(ORDER_STATUSES[0], count, p=ORDER_STATUSES[1])
+    delivered = status == 'delivered'
+    approved = purchase + pd.to_timedelta(rng.exponential(10 * 3600, count), unit='s').floor('s')
+    carrier = approved + pd.to_timedelta(rng.gamma(2.0, 1.4 * 86400, count), unit='s').floor('s')
+    delivery = carrier + pd.to_timedelta(rng.lognormal(2.1, 0.55, count) * 86400, unit='s').floor('s')
+    estimated = (purchase + pd.to_timedelta(rng.normal(24, 6, count).clip(3, 60), unit='D')).normalize()
+    order_ids = hex_ids(order_keys, 1)
+    orders = pd.DataFrame({
+        'order_id': order_ids,
+        'customer_id': customer_ids,
+        'order_status': status,
+        'order_purchase_timestamp': purchase,
+        'order_approved_at': approved,
+        'order_delivered_carrier_date': carrier.where(delivered | (status == 'shipped')),
+        'order_delivered_customer_date': delivery.where(delivered),
+        'order_estimated_delivery_date': estimated,
+        'datetime': purchase,
+    })
+    _write(orders, 'orders', output, append)
+
+    n_items = rng.choice(ITEMS_PER_ORDER[0], count, p=ITEMS_PER_ORDER[1])
+    item_order = np.repeat(np.arange(count), n_items)
+    item_number = np.arange(len(item_order)) - np.repeat(np.cumsum(n_items) - n_items, n_items) + 1
+    popularity = dimensions['product_popularity']
+    product = np.minimum(np.searchsorted(popularity, rng.random(len(item_order))), len(popularity) - 1)
+    price = np.round(dimensions['product_price'][product] * rng.uniform(0.9, 1.1, len(item_order)), 2)
+    freight = np.round(rng.gamma(2.0, 10.0, len(item_order)), 2)
+    items = pd.DataFrame({
+        'order_id': order_ids[item_order],
+        'order_item_id': item_number,
+        'product_id': dimensions['product_ids'][product],
+        'seller_id': dimensions['seller_ids'][dimensions['product_seller'][product]],
+        'shipping_limit_date': (purchase[item_order] + pd.Timedelta(days=6)),
+        'price': price,
+        'freight_value': freight,
+    })
+    _write(items, 'order_items', output, append)
+
+    order_total = np.bincount(item_order, weights=price + freight, minlength=count)
+    payment_type = rng.choice(PAYMENT_TYPES[0], count, p=PAYMENT_TYPES[1])
+    # Voucher sering dipecah menjadi beberapa pembayaran.
+    n_payments = np.where(payment_type == 'voucher', rng.geometric(0.55, count), 1)
+    payment_order = np.repeat(np.arange(count), n_payments)
+    sequence = np.arange(len(payment_order)) - np.repeat(np.cumsum(n_payments) - n_payments, n_payments) + 1
+    types = payment_type[payment_order]
+    installments = np.where(types == 'credit_card', np.minimum(rng.geometric(0.3, len(payment_order)), 24), 1)
+    payments = pd.DataFrame({
+        'order_id': order_ids[payment_order],
+        'payment_sequential': sequence,
+        'payment_type': types,
+        'payment_installments': installments,
+        'payment_value': np.round(order_total[payment_order] / n_payments[payment_order], 2),
+    })
+    _write(payments, 'order_payments', output, append)
+
+    late = delivered & (delivery.normalize() > estimated)
+    n_reviews = rng.choice([0, 1, 2], count, p=[0.008, 0.9865, 0.0055])
+    review_order = np.repeat(np.arange(count), n_reviews)
+    on_time = rng.choice(REVIEW_SCORES, len(review_order), p=REVIEWS_ON_TIME)
+    late_score = rng.choice(REVIEW_SCORES, len(review_order), p=REVIEWS_LATE)
+    created = delivery.where(delivered, estimated)[review_order].normalize() + pd.Timedelta(days=1)
+    reviews = pd.DataFrame({
+        'review_id': hex_ids(np.arange(len(review_order)) + 2 * first, 21),
+        'order_id': order_ids[review_order],
+        'review_score': np.where(late[review_order], late_score, on_time),
+        'review_comment_title': None,
+        'review_comment_message': None,
+        'review_creation_date': created,
+        'review_answer_timestamp': created + pd.to_timedelta(rng.exponential(2 * 86400, len(review_order)),
+                                                             unit='s').floor('s'),
+    })
+    _write(reviews, 'order_reviews', output, append)
+    return len(items)
+
+
+def generate(output: str, scale: float = 1.0, seed: int = 0, translation_path: str = None) -> dict:
+    """Fungsi untuk menulis seluruh tabel sintetis ke direktori `output`; mengembalikan jumlah baris per tabel."""
+    os.makedirs(output, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    translation_path = translation_path or os.path.join(DATA_DIRECTORY, TABLES['category_translation']['file'])
+    translation = pd.read_csv(translation_path)
+    dimensions = write_dimensions(output, scale, rng, translation)
+    n_orders = max(1, round(BASE_ORDERS * scale))
+    items = 0
+    for first in range(0, n_orders, CHUNK_ORDERS):
+        items += write_orders(output, first, min(CHUNK_ORDERS, n_orders - first), rng, dimensions, first > 0)
+    return {'orders': n_orders, 'order_items': items, 'products': len(dimensions['product_ids']),
+            'sellers': len(dimensions['seller_ids'])}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=float, default=1.0, help="faktor skala terhadap dataset asli")
+    parser.add_argument('--output', required=True, help="direktori keluaran (mis. .../main-data)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    started = time.perf_counter()
+    counts = generate(args.output, args.scale, args.seed)
+    # Peta negara bagian ikut disalin bila ada, agar dashboard lengkap.
+    geojson = os.path.join(DATA_DIRECTORY, "brazil-states.geojson")
+    if os.path.exists(geojson):
+        shutil.copy(geojson, args.output)
+    print(", ".join(f"{name} {count}" for name, count in counts.items()),
+          f"-> {args.output} ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Mode chunked (out-of-core) untuk dataset yang lebih besar dari RAM.
+
+Tabel pesanan (orders, order_items, order_payments, order_reviews, customers)
+dibaca per potongan CSV lalu dipecah ke PARTITIONS file Arrow IPC menurut hash
+kunci join, sehingga setiap pesanan beserta item, pembayaran, dan ulasannya
+ada di partisi yang sama:
+
+1. customers dan orders dipartisi menurut customer_id, lalu digabung per
+   partisi dan dipartisi ulang menurut order_id;
+2. pasangan (customer_unique_id, order_id, waktu) dipartisi menurut
+   pelanggan untuk menomori pesanan pelanggan dan menghitung kohort;
+3. setiap partisi pesanan dibangun menjadi tabel fakta dengan tabel dimensi
+   kecil (products, sellers, category_translation) yang tetap di memori, lalu
+   diringkas menjadi kubus dan agregat parsial engines.AGGREGATES yang bisa
+   dijumlahkan.
+
+Memori puncak sebanding satu partisi ditambah ukuran agregat, bukan ukuran
+data. Bagian-bagian analysis.SECTIONS lalu dijalankan apa adanya di atas
+hasil gabungannya, jadi hasilnya sama dengan mode di memori untuk rentang
+penuh. Hasil ini dipakai report.py --chunked; filter tanggal di dashboard
+tetap membutuhkan tabel fakta di memori.
+
+    python chunked.py --partitions 32
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from analysis import SECTIONS
+from cohorts import CohortCounts
+from engines import AGGREGATES, finish_aggregate, merge_partials, partial_aggregate
+from facts import build_fact_table, build_payment_table, order_sequence, prepared_tables
+from loader import CACHE_DIRECTORY, ID, TABLES, USED_COLUMNS, load_table, read_feather, read_table_chunks
+from rollups import CUBE_DIMENSIONS, CUBE_NAMES, build_cubes, sum_cubes
+
+CHUNK_SIZE = 250_000
+PARTITIONS = 16
+PARTITION_DIRECTORY = os.path.join(CACHE_DIRECTORY, "partitions")
+# Kubus parsial dijumlahkan ulang setiap kali total barisnya melewati batas ini.
+COMPACT_ROWS = 1_000_000
+
+CATEGORY_COLUMNS = {col for spec in TABLES.values() for col, dtype in spec['dtypes'].items() if dtype == 'category'}
+CUSTOMER_COLUMNS = ['customer_unique_id', 'customer_zip_code_prefix', 'customer_city', 'customer_state']
+
+
+def partition_of(keys: pd.Series, partitions: int) -> np.ndarray:
+    """Fungsi untuk menentukan nomor partisi setiap baris dari hash kuncinya."""
+    return (pd.util.hash_pandas_object(keys, index=False).to_numpy() % partitions).astype('int32')
+
+
+class PartitionedTable:
+    """Tabel yang dipecah ke beberapa file Arrow IPC menurut hash satu kolom kunci."""
+
+    def __init__(self, directory: str, name: str, partitions: int):
+        self.paths = [os.path.join(directory, f"{name}-{part:03d}.arrow") for part in range(partitions)]
+        self.writers = [None] * partitions
+        self.schema = None
+        self.empty = None
+
+    def write(self, frame: pd.DataFrame, key: str) -> None:
+        """Fungsi untuk menambahkan baris ke partisi masing-masing menurut kolom `key`."""
+        # Kategori berbeda antar potongan, jadi kolom category ditulis sebagai string.
+        frame = frame.astype({col: ID for col in frame.columns if isinstance(frame[col].dtype, pd.CategoricalDtype)})
+        if self.empty is None:
+            self.empty = frame.iloc[:0]
+        parts = partition_of(frame[key], len(self.paths))
+        order = np.argsort(parts, kind='stable')
+        bounds = np.searchsorted(parts[order], np.arange(len(self.paths) + 1))
+        table = pa.Table.from_pandas(frame, preserve_index=False).replace_schema_metadata(None)
+        # Potongan yang seluruh nilainya kosong bisa terbaca dengan tipe lain.
+        self.schema = self.schema or table.schema
+        table = table.cast(self.schema).take(order)
+        for part, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])):
+            if lo == hi:
+                continue
+            if self.writers[part] is None:
+                self.writers[part] = pa.ipc.new_file(self.paths[part], self.schema)
+            self.writers[part].write_table(table.slice(lo, hi - lo))
+
+    def close(self) -> "PartitionedTable":
+        for writer in self.writers:
+            if writer is not None:
+                writer.close()
+        return self
+
+    def read(self, part: int) -> pd.DataFrame:
+        """Fungsi untuk membaca satu partisi; kolom category dikembalikan ke category."""
+        frame = read_feather(self.paths[part]) if self.writers[part] is not None else self.empty.copy()
+        # Lewat object agar kategorinya bertipe object seperti hasil load_table.
+        return frame.assign(**{col: frame[col].astype(object).astype('category')
+                               for col in frame.columns if col in CATEGORY_COLUMNS})
+
+    def remove(self) -> None:
+        for path, writer in zip(self.paths, self.writers):
+            if writer is not None:
+                os.remove(path)
+
+
+def partition_table(name: str, key: str, directory: str, partitions: int, chunksize: int) -> PartitionedTable:
+    """Fungsi untuk membaca satu tabel CSV per potongan dan memecahnya menurut kolom `key`."""
+    table = PartitionedTable(directory, name, partitions)
+    for chunk in read_table_chunks(name, USED_COLUMNS[name], chunksize):
+        table.write(chunk, key)
+    return table.close()
+
+
+# Cacah pelanggan unik per urutan pesanan hanya bisa dijumlahkan antar
+# partisi pelanggan, jadi dihitung saat penomoran, bukan per partisi pesanan.
+CUSTOMER_AGGREGATES = ['customers_by_sequence']
+
+
+def partial_aggregates(fact: pd.DataFrame, payments: pd.DataFrame) -> dict:
+    """Fungsi untuk menghitung agregat parsial engines.AGGREGATES satu partisi pesanan (lihat engines.partial_aggregate)."""
+    return {name: partial_aggregate(name, fact, payments) for name in AGGREGATES if name not in CUSTOMER_AGGREGATES}
+
+
+def number_orders(keys: pd.DataFrame) -> tuple:
+    """Fungsi untuk menomori pesanan pelanggan dalam satu partisi pelanggan (lihat `customer_order_numbers`).
+
+    Mengembalikan nomor per order_id, agregat parsial CUSTOMER_AGGREGATES,
+    dan jumlah kohortnya.
+    """
+    number = keys.groupby('customer_unique_id', sort=False)['order_purchase_timestamp'].rank(method='min')
+    number = number.fillna(0).astype('int32')
+    # Satu baris per pesanan, jadi setiap baris adalah item pertamanya.
+    orders = keys.assign(order_sequence=order_sequence(number), first_item=True)
+    partials = {name: partial_aggregate(name, orders, None, partition_key='customer_unique_id')
+                for name in CUSTOMER_AGGREGATES}
+    counts = CohortCounts().update(keys['customer_unique_id'], keys['order_purchase_timestamp'])
+    # Peta kohort per pelanggan hanya dibutuhkan untuk update berikutnya, dan
+    # membuat memori tumbuh seiring jumlah pelanggan.
+    counts.cohorts = counts.cohorts.iloc[:0]
+    return pd.Series(number.to_numpy(), index=keys['order_id'].to_numpy()), partials, counts
+
+
+def build_aggregates(partitions: int = PARTITIONS, chunksize: int = CHUNK_SIZE, directory: str = None) -> dict:
+    """Fungsi untuk membangun kubus, kohort, dan agregat parsial seluruh data secara out-of-core."""
+    os.makedirs(PARTITION_DIRECTORY, exist_ok=True)
+    directory = directory or tempfile.mkdtemp(dir=PARTITION_DIRECTORY)
+    try:
+        return _build_aggregates(partitions, chunksize, directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _build_aggregates(partitions: int, chunksize: int, directory: str) -> dict:
+    customers = partition_table('customers', 'customer_id', directory, partitions, chunksize)
+    orders = partition_table('orders', 'customer_id', directory, partitions, chunksize)
+    enriched = PartitionedTable(directory, 'orders_enriched', partitions)
+    keys = PartitionedTable(directory, 'customer_orders', partitions)
+    for part in range(partitions):
+        # customer_id unik di tabel customers Olist.
+        merged = orders.read(part).merge(customers.read(part).drop_duplicates('customer_id'), on='customer_id',
+                                         how='left')
+        enriched.write(merged, 'order_id')
+        keys.write(merged[['customer_unique_id', 'order_id', 'order_purchase_timestamp']], 'customer_unique_id')
+    enriched.close(), keys.close()
+    customers.remove(), orders.remove()
+
+    numbers = PartitionedTable(directory, 'order_numbers', partitions)
+    partials, cohorts = {}, CohortCounts()
+    for part in range(partitions):
+        number, customer_partials, counts = number_orders(keys.read(part))
+        numbers.write(number.rename_axis('order_id').rename('customer_order_number').reset_index(), 'order_id')
+        for name, partial in customer_partials.items():
+            partials[name] = merge_partials(partials.get(name), partial)
+        cohorts.merge(counts)
+    numbers.close()
+    keys.remove()
+
+    tables = {name: partition_table(name, 'order_id', directory, partitions, chunksize)
+              for name in ['order_items', 'order_payments', 'order_reviews']}
+    dimensions = {name: load_table(name, USED_COLUMNS[name]) for name in ['products', 'sellers', 'category_translation']}
+    cubes = {name: [] for name in CUBE_NAMES}
+    for part in range(partitions):
+        orders_part = enriched.read(part)
+        data = {
+            'orders': orders_part.drop(columns=CUSTOMER_COLUMNS),
+            'customers': orders_part[['customer_id'] + CUSTOMER_COLUMNS].drop_duplicates('customer_id'),
+            'order_items': tables['order_items'].read(part),
+            'order_reviews': tables['order_reviews'].read(part),
+            **dimensions,
+        }
+        # Nomor pesanan dari seluruh riwayat pelanggan (langkah 2), bukan dari partisi ini.
+        fact = build_fact_table(data, order_numbers=numbers.read(part).set_index('order_id')['customer_order_number'])
+        payments = build_payment_table(fact, tables['order_payments'].read(part))
+
+        for name, cube in build_cubes(fact, payments).items():
+            cubes[name].append(cube)
+            if name in CUBE_DIMENSIONS and sum(len(frame) for frame in cubes[name]) > COMPACT_ROWS:
+                cubes[name] = [sum_cubes(cubes[name], CUBE_DIMENSIONS[name])]
+        for name, partial in partial_aggregates(fact, payments).items():
+            partials[name] = merge_partials(partials.get(name), partial)
+        del fact, payments, data
+
+    merged = {name: sum_cubes(frames, CUBE_DIMENSIONS[name]) for name, frames in cubes.items() if name in CUBE_DIMENSIONS}
+    first = pd.concat(cubes['seller_first_orders'])
+    merged['seller_first_orders'] = first.groupby(level=0, observed=True).min().sort_values()
+    return {'cubes': merged, 'cohorts': cohorts,
+            'aggregates': {name: finish_aggregate(name, partials[name]) for name in AGGREGATES}}
+
+
+def aggregate_results(aggregates: dict) -> dict:
+    """Fungsi untuk menghitung semua bagian analysis.SECTIONS (rentang penuh) dari hasil `build_aggregates`.
+
+    Fungsi analisisnya sama dengan mode di memori; hanya kubus, kohort, dan
+    agregatnya yang diambil dari hasil out-of-core (lihat facts.prepared_tables).
+    """
+    with prepared_tables(aggregates):
+        return {section: analyze() for section, analyze in SECTIONS.items()}
+
+
+def date_bounds(aggregates: dict) -> tuple:
+    """Fungsi untuk mendapatkan tanggal pembelian pertama dan terakhir dari kubus hasil `build_aggregates`."""
+    day = aggregates['cubes']['items']['day'].dropna()
+    return day.iloc[0].date(), day.iloc[-1].date()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--partitions', type=int, default=PARTITIONS, help="jumlah partisi hash")
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE, help="jumlah baris per potongan CSV")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    results = aggregate_results(build_aggregates(args.partitions, args.chunksize))
+    for section, values in results.items():
+        print(f"{section:<24}{', '.join(values)}")
+    print(f"Selesai dalam {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
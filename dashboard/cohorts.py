@@ -0,0 +1,205 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Matriks retensi kohort: pelanggan dikelompokkan menurut bulan pembelian pertama.
+
+Bulan disimpan sebagai bilangan bulat (tahun * 12 + bulan - 1) dan sel matriks
+dihitung dengan np.bincount, sehingga biaya sebanding jumlah pesanan dan
+memori hanya sebanding jumlah pelanggan unik ditambah ukuran matriks.
+Data dapat dimasukkan bertahap lewat CohortCounts.update, misalnya satu bulan
+atau satu potongan file sekaligus, asalkan urut waktu.
+"""
+
+import copy
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from facts import FACT_SOURCES, fact_table, order_rows, prepared_table
+from loader import table_version
+from metrics import measure
+from state import read_state
+
+
+def month_numbers(timestamps: pd.Series) -> np.ndarray:
+    """Fungsi untuk mengubah timestamp menjadi nomor bulan bulat (tahun * 12 + bulan - 1); -1 untuk NaT."""
+    months = timestamps.dt.year * 12 + timestamps.dt.month - 1
+    return months.fillna(-1).to_numpy(dtype='int32')
+
+
+class CohortCounts:
+    """Jumlah pelanggan aktif per (bulan kohort, bulan sejak pembelian pertama) yang bisa diperbarui bertahap."""
+
+    def __init__(self):
+        # Bulan kohort setiap pelanggan, diindeks customer_unique_id.
+        self.cohorts = pd.Series(dtype='int32')
+        self.counts = np.zeros((0, 0), dtype='int64')
+        self.first_month = None
+        self.last_month = None
+        # Pelanggan yang sudah dihitung di bulan terakhir, agar potongan data
+        # berikutnya di bulan yang sama tidak menghitungnya dua kali.
+        self._last_month_customers = pd.Index([])
+
+    def update(self, customers: pd.Series, timestamps: pd.Series) -> "CohortCounts":
+        """Fungsi untuk menambahkan satu potongan pesanan (id pelanggan dan waktu pembelian).
+
+        Potongan harus berisi bulan yang sama atau setelah bulan terakhir yang
+        sudah dimasukkan; baris tanpa pelanggan atau tanpa waktu diabaikan.
+        """
+        pairs = pd.DataFrame({'customer': customers.to_numpy(), 'month': month_numbers(timestamps)})
+        pairs = pairs[pairs['customer'].notna() & (pairs['month'] >= 0)].drop_duplicates()
+        if pairs.empty:
+            return self
+        if self.last_month is not None and pairs['month'].min() < self.last_month:
+            raise ValueError("Potongan data harus urut waktu: bulan lebih awal dari bulan terakhir yang sudah dimasukkan.")
+        if self.last_month is not None:
+            repeated = (pairs['month'] == self.last_month) & pairs['customer'].isin(self._last_month_customers)
+            pairs = pairs[~repeated]
+
+        # Pelanggan baru mendapat kohort dari bulan paling awal di potongan ini.
+        known = self.cohorts.index.get_indexer(pairs['customer'])
+        new = pairs[known < 0].groupby('customer', sort=False)['month'].min().astype('int32')
+        if len(new):
+            self.cohorts = pd.concat([self.cohorts, new]) if len(self.cohorts) else new
+        cohort = self.cohorts.to_numpy()[self.cohorts.index.get_indexer(pairs['customer'])]
+        month = pairs['month'].to_numpy()
+
+        if self.first_month is None:
+            self.first_month = int(cohort.min())
+        last_month = int(month.max())
+        size = last_month - self.first_month + 1
+        flat = (cohort - self.first_month).astype('int64') * size + (month - cohort)
+        batch = np.bincount(flat, minlength=size * size).reshape(size, size)
+        old = self.counts.shape[0]
+        batch[:old, :old] += self.counts
+        self.counts = batch
+
+        last_month_customers = pd.Index(pairs.loc[pairs['month'] == last_month, 'customer'])
+        if last_month == self.last_month:
+            last_month_customers = self._last_month_customers.append(last_month_customers)
+        self._last_month_customers = last_month_customers
+        self.last_month = last_month
+        return self
+
+    def merge(self, other: "CohortCounts") -> "CohortCounts":
+        """Fungsi untuk menjumlahkan CohortCounts lain yang pelanggannya tidak beririsan (mis. partisi per pelanggan).
+
+        Setelah digabung, `update` hanya benar untuk data yang lebih baru dari
+        kedua sumber.
+        """
+        if other.first_month is None:
+            return self
+        if self.first_month is None:
+            self.__dict__.update(other.__dict__)
+            return self
+        first_month = min(self.first_month, other.first_month)
+        last_month = max(self.last_month, other.last_month)
+        size = last_month - first_month + 1
+        counts = np.zeros((size, size), dtype='int64')
+        for source in (self, other):
+            offset = source.first_month - first_month
+            n = source.counts.shape[0]
+            counts[offset:offset + n, :n] += source.counts
+        if other.last_month == last_month:
+            pending = other._last_month_customers
+            if self.last_month == last_month:
+                pending = self._last_month_customers.append(pending)
+            self._last_month_customers = pending
+        self.cohorts = pd.concat([self.cohorts, other.cohorts]) if len(self.cohorts) else other.cohorts
+        self.counts, self.first_month, self.last_month = counts, first_month, last_month
+        return self
+
+    def split_customers(self) -> tuple:
+        """Fungsi untuk memisahkan peta kohort per pelanggan (hanya dibutuhkan `update`) dari jumlah kohortnya.
+
+        Mengembalikan salinan tanpa peta pelanggan beserta peta itu, agar
+        dashboard yang hanya membaca retensi tidak perlu memuat data per
+        pelanggan (lihat state.py).
+        """
+        counts = copy.copy(self)
+        counts.cohorts = pd.Series(dtype='int32')
+        return counts, self.cohorts.rename('cohort')
+
+    def with_customers(self, cohorts: pd.Series) -> "CohortCounts":
+        """Fungsi untuk memasang kembali peta kohort per pelanggan hasil `split_customers`."""
+        self.cohorts = cohorts
+        return self
+
+    def matrix(self, first_cohort: int = None, last_month: int = None) -> pd.DataFrame:
+        """Fungsi untuk mendapatkan jumlah pelanggan per kohort (baris) dan bulan sejak pembelian pertama (kolom).
+
+        Hanya kohort mulai `first_cohort` dan aktivitas hingga `last_month`
+        (keduanya nomor bulan) yang diikutkan; sel di luar jangkauan data berisi NaN.
+        """
+        if self.first_month is None:
+            return pd.DataFrame()
+        first_cohort = self.first_month if first_cohort is None else max(first_cohort, self.first_month)
+        last_month = self.last_month if last_month is None else min(last_month, self.last_month)
+        size = last_month - first_cohort + 1
+        if size <= 0:
+            return pd.DataFrame()
+        offset = first_cohort - self.first_month
+        counts = self.counts[offset:offset + size, :size].astype('float64')
+        # Kohort c hanya bisa diamati sampai bulan last_month, yaitu umur last_month - c.
+        ages = np.arange(size)
+        counts[ages[None, :] > (size - 1 - ages)[:, None]] = np.nan
+        months = np.arange(first_cohort, first_cohort + size)
+        index = pd.PeriodIndex.from_fields(year=months // 12, month=months % 12 + 1, freq='M')
+        return pd.DataFrame(counts, index=index.rename('cohort'), columns=pd.RangeIndex(size, name='months_since_first'))
+
+    def retention(self, first_cohort: int = None, last_month: int = None) -> pd.DataFrame:
+        """Fungsi untuk mendapatkan proporsi pelanggan kohort yang kembali berbelanja tiap bulan sesudahnya."""
+        counts = self.matrix(first_cohort, last_month)
+        return counts.div(counts[0], axis=0) if not counts.empty else counts
+
+
+@measure('aggregate', 'cohorts')
+def build_cohorts(fact: pd.DataFrame) -> CohortCounts:
+    """Fungsi untuk membangun jumlah kohort dari tabel fakta."""
+    orders = order_rows(fact)
+    return CohortCounts().update(orders['customer_unique_id'], orders['order_purchase_timestamp'])
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_cohorts(versions: tuple) -> CohortCounts:
+    stored = read_state('cohorts', versions)
+    return stored if stored is not None else build_cohorts(fact_table())
+
+
+def cohorts() -> CohortCounts:
+    """Fungsi untuk memuat jumlah kohort dari cache proses; bersifat read-only."""
+    prepared = prepared_table('cohorts')
+    if prepared is not None:
+        return prepared
+    return _cached_cohorts(tuple(table_version(name) for name in FACT_SOURCES))
+
+
+def retention_range(start: pd.Timestamp = None, end: pd.Timestamp = None) -> pd.DataFrame:
+    """Fungsi untuk mendapatkan matriks retensi kohort yang bulan pertamanya ada di rentang [start, end).
+
+    Kohort tetap ditentukan dari seluruh riwayat; rentang dibulatkan ke bulan.
+    """
+    first_cohort = None if start is None else start.year * 12 + start.month - 1
+    last = None if end is None else end - pd.Timedelta(1, 'ns')
+    last_month = None if last is None else last.year * 12 + last.month - 1
+    return cohorts().retention(first_cohort, last_month)
@@ -0,0 +1,315 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Mesin agregasi analisis: pandas (bawaan) atau DuckDB (opsional, multi-thread).
+
+Setiap agregasi atas tabel fakta didefinisikan sekali di AGGREGATES sebagai
+baris sumber, kunci grup, kolom nilai, dan fungsi agregasi. `aggregate`
+menjalankannya dengan mesin yang dipilih lewat variabel lingkungan
+DASHBOARD_ENGINE (`pandas` atau `duckdb`). DuckDB membaca tabel fakta dan
+pembayaran yang sudah ada di cache proses lewat Arrow tanpa menyalinnya;
+jumlah thread-nya diatur dengan DASHBOARD_THREADS (bawaan: semua core).
+
+Hasil kedua mesin identik: Series terurut per kunci dengan label kategori
+sebagai string, atau skalar bila tanpa kunci grup.
+
+    DASHBOARD_ENGINE=duckdb streamlit run dashboard.py
+"""
+
+import operator
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from facts import (PAYMENT_SOURCES, date_slice, fact_table, grain_rows, item_rows, order_payment_totals, order_rows,
+                   payment_table, prepared_table)
+from loader import table_version
+from metrics import measure
+
+ENGINE_VARIABLE = "DASHBOARD_ENGINE"
+THREADS_VARIABLE = "DASHBOARD_THREADS"
+
+# rows: 'fact' (semua baris), 'items' (baris berisi item), 'orders' (satu baris
+# per pesanan), 'payments', atau 'order_payment_categories' (total pembayaran
+# per pesanan x kategori item pesanan itu). `grain` menyisakan satu baris per
+# kombinasi kolomnya sebelum diagregasi, agar nilai tingkat pesanan tidak
+# terhitung sekali per item.
+AGGREGATES = {
+    'delivery_days': {'rows': 'orders', 'by': ['delivery_time'], 'how': 'size'},
+    'delay_by_category': {'rows': 'items', 'grain': ['order_id', 'product_category_name'],
+                          'by': ['product_category_name'], 'value': 'delay_time', 'how': 'mean'},
+    'delivery_by_state': {'rows': 'orders', 'by': ['customer_state'], 'value': 'delivery_time', 'how': 'mean'},
+    'payment_total': {'rows': 'payments', 'by': [], 'value': 'payment_value', 'how': 'sum'},
+    'payment_orders': {'rows': 'payments', 'by': [], 'value': 'order_id', 'how': 'nunique'},
+    'payment_count': {'rows': 'payments', 'by': [], 'how': 'size'},
+    'installment_payments': {'rows': 'payments', 'by': [], 'how': 'size', 'where': ('payment_installments', '>', 1)},
+    'payment_by_category': {'rows': 'order_payment_categories', 'by': ['product_category_name'],
+                            'value': 'payment_value', 'how': 'mean'},
+    'items_by_category': {'rows': 'items', 'by': ['product_category_name_english'], 'how': 'size'},
+    'returns_by_category': {'rows': 'items', 'grain': ['order_id', 'product_category_name_english'],
+                            'by': ['product_category_name_english'], 'how': 'size', 'where': ('review_score', '==', 1)},
+    'revenue_by_category': {'rows': 'items', 'by': ['product_category_name_english'], 'value': 'price', 'how': 'sum'},
+    'orders_by_state': {'rows': 'orders', 'by': ['customer_state'], 'how': 'size'},
+    'items_by_product': {'rows': 'items', 'by': ['is_new_customer', 'product_id'], 'how': 'size'},
+    'orders_by_sequence_month': {'rows': 'orders', 'by': ['purchase_year_month', 'order_sequence'], 'how': 'size'},
+    'orders_by_sequence': {'rows': 'orders', 'by': ['order_sequence'], 'how': 'size'},
+    'customers_by_sequence': {'rows': 'orders', 'by': ['order_sequence'], 'value': 'customer_unique_id',
+                              'how': 'nunique'},
+    'revenue_by_sequence': {'rows': 'items', 'by': ['order_sequence'], 'value': 'price', 'how': 'sum'},
+    'orders_by_seller': {'rows': 'items', 'grain': ['order_id', 'seller_id'], 'by': ['seller_id'], 'how': 'size'},
+    'orders_by_category_seller': {'rows': 'items', 'grain': ['order_id', 'product_category_name', 'seller_id'],
+                                  'by': ['product_category_name', 'seller_id'], 'how': 'size'},
+    'sales_by_city': {'rows': 'fact', 'by': ['customer_city', 'customer_state'], 'value': 'price', 'how': 'sum'},
+    'delay_by_state': {'rows': 'orders', 'by': ['customer_state'], 'value': 'delay_time', 'how': 'mean'},
+    'orders_by_customer_zip': {'rows': 'orders', 'by': ['customer_state', 'customer_zip_code_prefix'], 'how': 'size'},
+    'sellers_by_zip': {'rows': 'items', 'by': ['seller_zip_code_prefix'], 'value': 'seller_id', 'how': 'nunique'},
+    'seller_distances': {'rows': 'items', 'grain': ['order_id', 'seller_id'], 'by': ['seller_distance_km'],
+                         'how': 'size'},
+    'seller_distance_by_state': {'rows': 'items', 'grain': ['order_id', 'seller_id'], 'by': ['customer_state'],
+                                 'value': 'seller_distance_km', 'how': 'mean'},
+}
+
+_OPERATORS = {'>': operator.gt, '==': operator.eq}
+
+
+def _result(values: pd.Series, spec: dict, name: str) -> pd.Series:
+    # Label non-numerik (category, string, Period) dijadikan string lalu diurutkan
+    # agar urutan baris tidak bergantung pada mesin maupun urutan kategori.
+    index = values.index
+    levels = [index.get_level_values(i) for i in range(index.nlevels)]
+    levels = [level if pd.api.types.is_numeric_dtype(level) or pd.api.types.is_bool_dtype(level)
+              else level.astype(str) for level in levels]
+    values.index = pd.MultiIndex.from_arrays(levels, names=spec['by']) if len(levels) > 1 else levels[0].rename(spec['by'][0])
+    return values.rename(name).sort_index(kind='stable')
+
+
+def _rows(rows: str, fact: pd.DataFrame, payments: pd.DataFrame) -> pd.DataFrame:
+    if rows == 'payments':
+        return payments
+    if rows == 'items':
+        return item_rows(fact)
+    if rows == 'orders':
+        return order_rows(fact)
+    if rows == 'order_payment_categories':
+        # Kedua sisi diringkas ke grain pesanan dulu: pembayaran dijumlahkan per
+        # pesanan dan kategori diambil sekali per pesanan.
+        categories = grain_rows(item_rows(fact), ['order_id', 'product_category_name'])
+        return order_payment_totals(payments).merge(categories[['order_id', 'product_category_name']],
+                                                    on='order_id', validate='one_to_many')
+    return fact
+
+
+def _spec_rows(spec: dict, fact: pd.DataFrame, payments: pd.DataFrame) -> pd.DataFrame:
+    frame = _rows(spec['rows'], fact, payments)
+    if 'where' in spec:
+        column, op, value = spec['where']
+        frame = frame[_OPERATORS[op](frame[column], value)]
+    if 'grain' in spec:
+        frame = grain_rows(frame, spec['grain'])
+    return frame
+
+
+def _pandas_rows(spec: dict, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    fact = payments = None
+    if spec['rows'] in ('payments', 'order_payment_categories'):
+        payments = payment_table()
+        payments = payments.iloc[date_slice(payments['order_purchase_timestamp'], start, end)]
+    if spec['rows'] != 'payments':
+        fact = fact_table()
+        fact = fact.iloc[date_slice(fact['order_purchase_timestamp'], start, end)]
+    return _spec_rows(spec, fact, payments)
+
+
+def pandas_aggregate(name: str, start: pd.Timestamp = None, end: pd.Timestamp = None):
+    """Fungsi untuk menjalankan satu agregasi AGGREGATES dengan groupby pandas."""
+    spec = AGGREGATES[name]
+    frame = _pandas_rows(spec, start, end)
+    how, value = spec['how'], spec.get('value')
+    if not spec['by']:
+        return len(frame) if how == 'size' else frame[value].agg(how)
+    grouped = frame.groupby(spec['by'], observed=True)
+    values = grouped.size() if how == 'size' else grouped[value].agg(how)
+    return _result(values, spec, name)
+
+
+def partial_aggregate(name: str, fact: pd.DataFrame, payments: pd.DataFrame, partition_key: str = 'order_id') -> pd.DataFrame:
+    """Fungsi untuk menghitung agregat parsial satu partisi data yang bisa dijumlahkan antar partisi (lihat chunked.py).
+
+    Rata-rata disimpan sebagai jumlah dan cacah. Cacah nilai unik langsung
+    dijumlahkan bila kolomnya adalah `partition_key` (nilainya tidak muncul di
+    partisi lain); selain itu yang disimpan adalah pasangan (kunci, nilai).
+    Gabungkan parsial dengan `merge_partials` lalu selesaikan dengan `finish_aggregate`.
+    """
+    spec = AGGREGATES[name]
+    frame = _spec_rows(spec, fact, payments)
+    how, value, by = spec['how'], spec.get('value'), list(spec['by'])
+    if how == 'nunique' and value != partition_key:
+        by, how = by + [value], 'size'
+    grouped = frame.groupby(by or np.zeros(len(frame), dtype='int8'), observed=True)
+    if how == 'size':
+        partial = grouped.size().to_frame('size')
+    elif how == 'mean':
+        partial = grouped[value].agg(['sum', 'count'])
+    else:
+        partial = grouped[value].agg(how).to_frame(how)
+    # Kategori tiap partisi berbeda, jadi label category dijadikan object agar
+    # parsial bisa dijumlahkan dengan DataFrame.add.
+    index = partial.index
+    levels = [index.get_level_values(i) for i in range(index.nlevels)]
+    levels = [level.astype(object) if isinstance(level.dtype, pd.CategoricalDtype) else level for level in levels]
+    partial.index = pd.MultiIndex.from_arrays(levels, names=index.names) if len(levels) > 1 else levels[0]
+    return partial
+
+
+def merge_partials(total: pd.DataFrame, partial: pd.DataFrame) -> pd.DataFrame:
+    """Fungsi untuk menjumlahkan dua agregat parsial hasil `partial_aggregate`; `total` boleh None."""
+    return partial if total is None else total.add(partial, fill_value=0)
+
+
+def finish_aggregate(name: str, partial: pd.DataFrame):
+    """Fungsi untuk mengubah agregat parsial gabungan menjadi hasil yang sama seperti `aggregate` rentang penuh."""
+    spec = AGGREGATES[name]
+    how, by = spec['how'], spec['by']
+    if how == 'mean':
+        values = partial['sum'] / partial['count']
+    elif how == 'nunique' and 'nunique' not in partial:
+        # Pasangan (kunci, nilai) unik: cacah nilai unik = jumlah pasangan per kunci.
+        values = partial['size'].groupby(level=by).size() if by else pd.Series([len(partial)])
+    else:
+        values = partial[how]
+    if how in ('size', 'nunique'):
+        values = values.astype('int64')
+    if not by:
+        value = values.sum() if len(values) else (np.nan if how == 'mean' else values.dtype.type(0))
+        return value.item() if how in ('size', 'nunique') else value
+    return _result(values, spec, name)
+
+
+# Kolom turunan yang tidak bisa dikirim ke DuckDB apa adanya (Period).
+_SQL_COLUMNS = {'purchase_year_month': "strftime(order_purchase_timestamp, '%Y-%m')"}
+_SQL_MEASURES = {
+    'size': 'count(*)',
+    'sum': 'coalesce(sum("{value}"), 0)',
+    'mean': 'avg("{value}")',
+    'nunique': 'count(DISTINCT "{value}")',
+}
+_SQL_OPERATORS = {'>': '>', '==': '='}
+_SQL_VIEWS = {
+    'items': 'SELECT * FROM fact WHERE order_item_id IS NOT NULL',
+    'orders': 'SELECT * FROM fact WHERE first_item',
+    'order_payment_categories': """
+        SELECT p.*, i.product_category_name
+        FROM (SELECT order_id, sum(payment_value) AS payment_value, first(order_purchase_timestamp)
+                  AS order_purchase_timestamp
+              FROM payments GROUP BY order_id) p
+        JOIN (SELECT DISTINCT order_id, product_category_name FROM items) i USING (order_id)
+    """,
+}
+
+
+def _arrow(frame: pd.DataFrame) -> pa.Table:
+    return pa.Table.from_pandas(frame.drop(columns=list(_SQL_COLUMNS), errors='ignore'), preserve_index=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _duckdb_database(versions: tuple, threads: int) -> tuple:
+    try:
+        import duckdb
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(f"Mesin duckdb butuh paket duckdb (pip install duckdb): {error}") from error
+    connection = duckdb.connect()
+    if threads:
+        connection.execute(f"SET threads = {int(threads)}")
+    connection.register('fact', _arrow(fact_table()))
+    connection.register('payments', _arrow(payment_table()))
+    for view, sql in _SQL_VIEWS.items():
+        connection.execute(f"CREATE VIEW {view} AS {sql}")
+    # Satu koneksi tidak boleh dipakai beberapa thread sekaligus; setiap query
+    # sudah dijalankan paralel oleh DuckDB sendiri.
+    return connection, threading.Lock()
+
+
+def duckdb_aggregate(name: str, start: pd.Timestamp = None, end: pd.Timestamp = None):
+    """Fungsi untuk menjalankan satu agregasi AGGREGATES sebagai query DuckDB."""
+    spec = AGGREGATES[name]
+    keys = [_SQL_COLUMNS.get(col, f'"{col}"') for col in spec['by']]
+    conditions = [f"{key} IS NOT NULL" for key in keys]
+    params = []
+    if 'where' in spec:
+        column, op, value = spec['where']
+        conditions.append(f'"{column}" {_SQL_OPERATORS[op]} ?')
+        params.append(value)
+    for bound, op in ((start, '>='), (end, '<')):
+        if bound is not None:
+            conditions.append(f"order_purchase_timestamp {op} ?")
+            params.append(bound.to_pydatetime())
+    measure = _SQL_MEASURES[spec['how']].format(value=spec.get('value'))
+    columns = [f'{key} AS "{col}"' for key, col in zip(keys, spec['by'])] + [f"{measure} AS value"]
+    rows = spec['rows']
+    if 'grain' in spec:
+        grain = ', '.join(f'"{col}"' for col in spec['grain'])
+        rows = f"(SELECT DISTINCT ON ({grain}) * FROM {rows}) AS {rows}"
+    sql = f"SELECT {', '.join(columns)} FROM {rows}"
+    if conditions:
+        sql += f" WHERE {' AND '.join(conditions)}"
+    if keys:
+        sql += " GROUP BY ALL"
+    connection, lock = _duckdb_database(tuple(table_version(table) for table in PAYMENT_SOURCES),
+                                        int(os.environ.get(THREADS_VARIABLE, 0)))
+    with lock:
+        frame = connection.execute(sql, params).df()
+    if not keys:
+        value = frame['value'].iloc[0]
+        return value.item() if isinstance(value, np.generic) else value
+    return _result(frame.set_index(spec['by'])['value'], spec, name)
+
+
+ENGINES = {
+    'pandas': pandas_aggregate,
+    'duckdb': duckdb_aggregate,
+}
+
+
+def engine_name() -> str:
+    """Fungsi untuk mendapatkan nama mesin agregasi dari konfigurasi (variabel lingkungan DASHBOARD_ENGINE)."""
+    name = os.environ.get(ENGINE_VARIABLE, 'pandas')
+    if name not in ENGINES:
+        raise ValueError(f"{ENGINE_VARIABLE}={name!r} tidak dikenal; pilih salah satu dari {', '.join(ENGINES)}.")
+    return name
+
+
+def aggregate(name: str, start: pd.Timestamp = None, end: pd.Timestamp = None):
+    """Fungsi untuk menjalankan satu agregasi AGGREGATES pada rentang [start, end) dengan mesin terpilih.
+
+    Di dalam `facts.prepared_tables` hasilnya diambil dari agregat rentang penuh yang sudah jadi.
+    """
+    precomputed = prepared_table('aggregates')
+    if precomputed is not None:
+        if start is not None or end is not None:
+            raise ValueError("Agregat yang sudah jadi hanya mencakup rentang penuh.")
+        return precomputed[name]
+    with measure('aggregate', name):
+        return ENGINES[engine_name()](name, start, end)
@@ -0,0 +1,253 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import contextvars
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from geolocation import seller_distances
+from loader import USED_COLUMNS, load_table, table_version
+from metrics import measure
+from state import read_state
+
+FACT_TABLES = ['orders', 'order_items', 'products', 'category_translation', 'customers', 'sellers', 'order_reviews']
+# Tabel geolocation tidak di-join; hanya centroid prefiks kode posnya
+# (geolocation.zip_centroids) yang dipakai untuk jarak seller ke pelanggan.
+FACT_SOURCES = FACT_TABLES + ['geolocation']
+PAYMENT_SOURCES = FACT_SOURCES + ['order_payments']
+
+# Label urutan pesanan pelanggan untuk analisis pembelian ulang.
+ORDER_SEQUENCES = ['1', '2', '3+']
+
+
+@measure('merge', 'fact_table')
+def build_fact_table(data: dict, previous_orders: pd.Series = None, centroids: np.ndarray = None,
+                     order_numbers: pd.Series = None) -> pd.DataFrame:
+    """Fungsi untuk membangun tabel fakta pesanan dengan grain satu baris per item.
+
+    Pesanan tanpa item tetap ada sebagai satu baris dengan kolom item kosong.
+    Ulasan diambil satu per pesanan agar tidak menggandakan baris item. Baris
+    diurutkan berdasarkan `order_purchase_timestamp` agar bisa dipotong per
+    rentang tanggal dengan `date_slice`.
+
+    `previous_orders` (lihat `customer_order_counts`) dipakai saat `data` hanya
+    berisi batch pesanan baru, agar nomor urut pesanan pelanggan melanjutkan
+    riwayat sebelumnya. `centroids` menggantikan array centroid prefiks kode
+    pos bawaan (lihat geolocation.zip_centroids). `order_numbers` berisi nomor
+    urut pesanan per order_id yang sudah dihitung dari seluruh riwayat (mis.
+    chunked.py); bila diberikan, penomoran dari `data` dilewati.
+    """
+    reviews = data['order_reviews'][['order_id', 'review_score']].drop_duplicates('order_id', keep='last')
+
+    # validate membuat merge gagal (pandas.errors.MergeError) bila kunci tabel
+    # dimensi ganda, yang diam-diam akan menggandakan baris item (fanout).
+    fact = data['orders'].merge(data['order_items'], on='order_id', how='left', validate='one_to_many')
+    fact = fact.merge(data['products'], on='product_id', how='left', validate='many_to_one')
+    fact = fact.merge(data['category_translation'], on='product_category_name', how='left', validate='many_to_one')
+    fact = fact.merge(data['customers'], on='customer_id', how='left', validate='many_to_one')
+    fact = fact.merge(data['sellers'], on='seller_id', how='left', validate='many_to_one')
+    fact = fact.merge(reviews, on='order_id', how='left', validate='many_to_one')
+
+    # Kunci merge kategori produk berbeda kategorinya antar tabel sehingga
+    # pandas mengembalikannya sebagai object; kembalikan ke category.
+    fact['product_category_name'] = fact['product_category_name'].astype('category')
+
+    purchase = fact['order_purchase_timestamp']
+    delivered = fact['order_delivered_customer_date']
+    fact['delivery_time'] = (delivered - purchase).dt.days
+    fact['delay_time'] = (delivered - fact['order_estimated_delivery_date']).dt.days
+    fact['seller_distance_km'] = seller_distances(fact['customer_zip_code_prefix'], fact['seller_zip_code_prefix'],
+                                                  centroids)
+    fact['purchase_month'] = purchase.dt.month.astype('int8')
+    fact['purchase_day'] = purchase.dt.dayofweek.astype('int8')
+    fact['purchase_year_month'] = purchase.dt.to_period('M')
+    fact['first_item'] = ~fact['order_id'].duplicated()
+    fact = fact.sort_values('order_purchase_timestamp', kind='stable', ignore_index=True)
+
+    # Pelanggan baru ditentukan dari seluruh riwayat, bukan dari rentang tanggal
+    # yang sedang dipilih, jadi dihitung sekali di sini.
+    if order_numbers is None:
+        numbers = customer_order_numbers(fact, previous_orders)
+    else:
+        position = order_numbers.index.get_indexer(fact['order_id'])
+        numbers = np.where(position >= 0, order_numbers.to_numpy()[position], 0).astype('int32')
+    assign_order_numbers(fact, numbers)
+    return fact
+
+
+def assign_order_numbers(fact: pd.DataFrame, numbers: np.ndarray) -> None:
+    """Fungsi untuk mengisi nomor urut pesanan pelanggan beserta kolom turunannya di tabel fakta."""
+    fact['customer_order_number'] = numbers
+    fact['is_new_customer'] = fact['customer_order_number'] == 1
+    fact['order_sequence'] = order_sequence(fact['customer_order_number'])
+
+
+def customer_order_numbers(fact: pd.DataFrame, previous_orders: pd.Series = None) -> np.ndarray:
+    """Fungsi untuk menomori pesanan setiap pelanggan (1 = pesanan pertama) menurut waktu pembelian.
+
+    Dihitung sekali pada grain pesanan lalu disebarkan ke baris item. Pesanan
+    dengan waktu yang sama mendapat nomor yang sama (rank 'min'), sehingga dua
+    pesanan di detik pertama sama-sama dihitung sebagai pesanan pertama.
+    Pelanggan atau waktu yang kosong diberi nomor 0. `fact` harus terurut per
+    waktu pembelian dengan item satu pesanan berdampingan.
+    """
+    first_item = fact['first_item'].to_numpy()
+    orders = fact.loc[first_item, ['customer_unique_id', 'order_purchase_timestamp']]
+    number = orders.groupby('customer_unique_id', sort=False)['order_purchase_timestamp'].rank(method='min')
+    if previous_orders is not None:
+        number += previous_orders.reindex(orders['customer_unique_id']).fillna(0).to_numpy()
+    number = number.fillna(0).to_numpy(dtype='int32')
+    # Posisi pesanan untuk setiap baris item: item pertama menaikkan hitungan.
+    return number[np.cumsum(first_item) - 1]
+
+
+def order_sequence(customer_order_number: pd.Series) -> pd.Categorical:
+    """Fungsi untuk mengelompokkan nomor pesanan pelanggan ke 1, 2, dan 3+ (kosong bila tidak diketahui)."""
+    codes = np.minimum(customer_order_number.to_numpy(), len(ORDER_SEQUENCES)) - 1
+    return pd.Categorical.from_codes(codes, categories=ORDER_SEQUENCES)
+
+
+def customer_order_counts(fact: pd.DataFrame) -> pd.Series:
+    """Fungsi untuk menghitung jumlah pesanan bernomor (waktu pembelian diketahui) per pelanggan."""
+    orders = fact[fact['first_item'] & (fact['customer_order_number'] > 0)]
+    return orders.groupby('customer_unique_id', sort=False).size().rename('orders')
+
+
+def concat_frames(frames: list) -> pd.DataFrame:
+    """Fungsi untuk menyambung beberapa DataFrame dengan kolom category tetap category (kategorinya digabung)."""
+    frames = [frame for frame in frames if len(frame)] or frames[:1]
+    for col in frames[0].columns:
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            columns = [frame[col].astype('category') for frame in frames]
+            categories = columns[0].cat.categories
+            for column in columns[1:]:
+                categories = categories.union(column.cat.categories, sort=False)
+            frames = [frame.assign(**{col: column.cat.set_categories(categories)})
+                      for frame, column in zip(frames, columns)]
+    return pd.concat(frames, ignore_index=True)
+
+
+@measure('merge', 'payment_table')
+def build_payment_table(fact: pd.DataFrame, order_payments: pd.DataFrame) -> pd.DataFrame:
+    """Fungsi untuk membangun tabel pembayaran beserta atribut pesanannya, terurut per waktu pembelian."""
+    orders = order_rows(fact)[['order_id', 'order_purchase_timestamp', 'purchase_year_month', 'customer_state',
+                               'review_score']]
+    payments = order_payments.merge(orders, on='order_id', how='left', validate='many_to_one')
+    return payments.sort_values('order_purchase_timestamp', kind='stable', ignore_index=True)
+
+
+def order_payment_totals(payments: pd.DataFrame) -> pd.DataFrame:
+    """Fungsi untuk menjumlahkan pembayaran ke grain pesanan (satu baris per order_id) sebelum di-join ke item."""
+    return payments.groupby('order_id', sort=False).agg(
+        payment_value=('payment_value', 'sum'),
+        order_purchase_timestamp=('order_purchase_timestamp', 'first'),
+    ).reset_index()
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_fact_table(versions: tuple) -> pd.DataFrame:
+    # Hasil olahan dari ingest.py dipakai bila mewakili versi CSV yang sama.
+    fact = read_state('fact', versions)
+    if fact is not None:
+        return fact
+    data = {name: load_table(name, USED_COLUMNS[name]) for name in FACT_TABLES}
+    return build_fact_table(data)
+
+
+def fact_table() -> pd.DataFrame:
+    """Fungsi untuk memuat tabel fakta dari cache proses; bersifat read-only."""
+    if _prepared.get() is not None:
+        raise RuntimeError("Tabel fakta tidak dimuat di dalam prepared_tables; hasil olahannya sudah disediakan.")
+    return _cached_fact_table(tuple(table_version(name) for name in FACT_SOURCES))
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_payment_table(versions: tuple) -> pd.DataFrame:
+    payments = read_state('payments', versions)
+    if payments is not None:
+        return payments
+    return build_payment_table(fact_table(), load_table('order_payments', USED_COLUMNS['order_payments']))
+
+
+def payment_table() -> pd.DataFrame:
+    """Fungsi untuk memuat tabel pembayaran dari cache proses; bersifat read-only."""
+    if _prepared.get() is not None:
+        raise RuntimeError("Tabel pembayaran tidak dimuat di dalam prepared_tables; hasil olahannya sudah disediakan.")
+    return _cached_payment_table(tuple(table_version(name) for name in PAYMENT_SOURCES))
+
+
+# Hasil olahan rentang penuh yang menggantikan tabel fakta; lihat prepared_tables.
+_prepared = contextvars.ContextVar('prepared_tables', default=None)
+
+
+@contextmanager
+def prepared_tables(tables: dict):
+    """Fungsi untuk menjalankan analisis dari hasil olahan yang sudah jadi alih-alih dari tabel fakta.
+
+    `tables` berisi 'cubes' (lihat rollups.cubes), 'cohorts' (cohorts.cohorts),
+    dan 'aggregates' (hasil engines.aggregate rentang penuh per nama), mis. dari
+    agregasi out-of-core chunked.py. Di dalam blok ini tabel fakta tidak dimuat.
+    """
+    token = _prepared.set(tables)
+    try:
+        yield
+    finally:
+        _prepared.reset(token)
+
+
+def prepared_table(name: str):
+    """Fungsi untuk mengambil hasil olahan `name` dari prepared_tables yang aktif; None bila tidak ada."""
+    tables = _prepared.get()
+    return None if tables is None else tables[name]
+
+
+def date_slice(timestamps: pd.Series, start: pd.Timestamp = None, end: pd.Timestamp = None) -> slice:
+    """Fungsi untuk mencari posisi baris dalam rentang [start, end) lewat binary search.
+
+    `timestamps` harus sudah terurut naik (NaT di akhir). Batas None berarti
+    tidak dibatasi, sehingga rentang penuh juga mengikutkan baris NaT.
+    """
+    lo = 0 if start is None else timestamps.searchsorted(start, side='left')
+    hi = len(timestamps) if end is None else timestamps.searchsorted(end, side='left')
+    return slice(lo, hi)
+
+
+def order_rows(fact: pd.DataFrame) -> pd.DataFrame:
+    """Fungsi untuk memproyeksikan tabel fakta ke grain satu baris per pesanan."""
+    return fact[fact['first_item']]
+
+
+def grain_rows(fact: pd.DataFrame, grain: list) -> pd.DataFrame:
+    """Fungsi untuk mengambil satu baris tabel fakta per kombinasi kolom `grain` (mis. pesanan x kategori).
+
+    Nilai tingkat pesanan (ulasan, keterlambatan) tercatat di setiap baris item;
+    tanpa ini pesanan dengan banyak item terhitung berkali-kali.
+    """
+    return fact.drop_duplicates(grain)
+
+
+def item_rows(fact: pd.DataFrame) -> pd.DataFrame:
+    """Fungsi untuk memproyeksikan tabel fakta ke baris yang memiliki item."""
+    return fact[fact['order_item_id'].notna()]
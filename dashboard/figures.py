@@ -0,0 +1,345 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Cache hasil render grafik matplotlib.
+
+Setiap grafik digambar oleh fungsi `draw(ax, *data)`. Kunci cache dibentuk
+dari sidik jari isi data agregat, ukuran gambar, dan kode fungsi gambarnya,
+sehingga grafik yang datanya tidak berubah cukup diambil sebagai byte PNG
+tanpa memanggil matplotlib. Cache disimpan di memori dengan batas ukuran
+(LRU); entri yang tergusur dapat disimpan ke disk dan dimuat kembali. Disk
+juga dibatasi (SPILL_LIMIT): file yang paling lama tidak dipakai dihapus lebih
+dulu, saat cache dibuat dan setiap kali batasnya terlewati.
+
+Grafik yang punya spesifikasi Vega-Lite (lihat vegalite.py) bisa juga
+digambar di browser: pilih backend 'vega-lite' lewat DASHBOARD_CHARTS atau
+`set_chart_backend`. Server hanya mengirim data agregat, bukan PNG.
+
+matplotlib dan seaborn baru diimpor saat grafik PNG pertama benar-benar
+digambar (lihat `DeferredModule`), jadi proses yang hanya memakai gambar dari
+cache atau backend Vega-Lite tidak pernah memuatnya.
+"""
+
+import contextvars
+import hashlib
+import importlib
+import io
+import os
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from loader import CACHE_DIRECTORY
+from metrics import measure
+
+MEMORY_LIMIT = 64 * 2 ** 20
+# None untuk mematikan penyimpanan ke disk.
+SPILL_DIRECTORY = os.path.join(CACHE_DIRECTORY, "figures")
+# Batas total ukuran gambar di disk, dibagi semua replika yang memakai direktori yang sama.
+SPILL_LIMIT = 512 * 2 ** 20
+# Pemangkasan berhenti di bawah batas agar direktori tidak dipindai di setiap penyimpanan.
+PRUNE_TARGET = 0.9
+
+# Sama dengan pengaturan st.pyplot agar tampilan tidak berubah.
+SAVEFIG_OPTIONS = {'format': 'png', 'dpi': 200, 'bbox_inches': 'tight'}
+
+CHARTS_VARIABLE = "DASHBOARD_CHARTS"
+CHART_BACKENDS = ['png', 'vega-lite']
+
+
+class DeferredModule:
+    """Modul yang baru diimpor saat atributnya pertama kali dipakai, mis. `DeferredModule('seaborn').barplot`."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __getattr__(self, attr: str):
+        # Setelah impor pertama, import_module hanya membaca sys.modules.
+        return getattr(importlib.import_module(self.name), attr)
+
+    def imported(self) -> bool:
+        """Fungsi untuk memeriksa apakah modulnya sudah diimpor, tanpa mengimpornya."""
+        return self.name in sys.modules
+
+
+plt = DeferredModule('matplotlib.pyplot')
+
+
+def close_figures() -> None:
+    """Fungsi untuk menutup semua figure matplotlib; tidak mengimpor pyplot bila belum pernah dipakai."""
+    if plt.imported():
+        plt.close('all')
+
+
+def _update(digest, value) -> None:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(repr((type(value).__name__, value.shape, value.index.names)).encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr((list(value.columns), list(value.dtypes.astype(str)))).encode())
+        else:
+            digest.update(repr((value.name, str(value.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'{')
+        for key in value:
+            _update(digest, key)
+            _update(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _update(digest, item)
+        digest.update(b']')
+    else:
+        digest.update(repr(value).encode())
+        digest.update(b';')
+
+
+def fingerprint(*values) -> str:
+    """Fungsi untuk menghitung sidik jari isi data (DataFrame, Series, array, skalar, atau gabungannya)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update(digest, value)
+    return digest.hexdigest()
+
+
+def _code_fingerprint(code) -> tuple:
+    # Kode fungsi gambar ikut dalam kunci agar perubahan gaya grafik tidak
+    # menampilkan gambar lama dari cache. Kode fungsi bersarang diuraikan
+    # karena repr-nya memuat alamat memori yang berbeda di tiap proses.
+    consts = tuple(_code_fingerprint(const) if hasattr(const, 'co_code') else const for const in code.co_consts)
+    return code.co_name, code.co_code, consts, code.co_names
+
+
+class FigureCache:
+    """Cache LRU berisi byte gambar, dibatasi total ukuran di memori, dengan opsi simpan ke disk."""
+
+    def __init__(self, max_bytes: int = MEMORY_LIMIT, spill_directory: str = None, spill_limit: int = SPILL_LIMIT):
+        self.max_bytes = max_bytes
+        self.spill_directory = spill_directory
+        self.spill_limit = spill_limit
+        self.entries = OrderedDict()
+        self.size = 0
+        # Perkiraan ukuran direktori disk; dihitung ulang setiap pemangkasan
+        # karena replika lain bisa ikut menulis dan menghapus.
+        self.spill_size = None
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+
+    def _spill_path(self, key: str) -> str:
+        return os.path.join(self.spill_directory, f"{key}.png")
+
+    def prune(self) -> int:
+        """Fungsi untuk menghapus gambar di disk yang paling lama tidak dipakai bila totalnya melewati batas.
+
+        Mengembalikan jumlah file yang dihapus.
+        """
+        with self._prune_lock:
+            files = []
+            try:
+                with os.scandir(self.spill_directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".png"):
+                            try:
+                                stat = entry.stat()
+                            except OSError:
+                                # Sudah dihapus replika lain.
+                                continue
+                            files.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                pass
+            total = sum(size for _, size, _ in files)
+            removed = 0
+            if total > self.spill_limit:
+                for _, size, path in sorted(files):
+                    if total <= self.spill_limit * PRUNE_TARGET:
+                        break
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        continue
+                    total -= size
+                    removed += 1
+            self.spill_size = total
+            return removed
+
+    def persist(self, key: str, data: bytes) -> None:
+        """Fungsi untuk menyimpan byte gambar langsung ke disk (mis. dari laporan batch)."""
+        if self.spill_directory is not None:
+            self._spill(key, data)
+
+    def _spill(self, key: str, data: bytes) -> None:
+        path = self._spill_path(key)
+        if os.path.exists(path):
+            return
+        try:
+            os.makedirs(self.spill_directory, exist_ok=True)
+            with open(path + ".tmp", 'wb') as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            # Direktori read-only: entri cukup dibuang dari memori.
+            return
+        with self._lock:
+            self.spill_size = None if self.spill_size is None else self.spill_size + len(data)
+            over = self.spill_size is None or self.spill_size > self.spill_limit
+        if over:
+            self.prune()
+
+    def get(self, key: str) -> bytes:
+        """Fungsi untuk mengambil byte gambar; None bila tidak ada di memori maupun disk."""
+        with self._lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return data
+        if self.spill_directory is not None:
+            path = self._spill_path(key)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                pass
+            else:
+                try:
+                    # mtime menandai pemakaian terakhir, jadi pemangkasan menghapus
+                    # gambar yang paling lama tidak dipakai, bukan yang paling lama dibuat.
+                    os.utime(path)
+                except OSError:
+                    pass
+                self.put(key, data)
+                with self._lock:
+                    self.hits += 1
+                return data
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Fungsi untuk menyimpan byte gambar dan menggusur entri terlama bila melewati batas."""
+        evicted = []
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes and len(self.entries) > 1:
+                old_key, old_data = self.entries.popitem(last=False)
+                self.size -= len(old_data)
+                evicted.append((old_key, old_data))
+        if self.spill_directory is not None:
+            for old_key, old_data in evicted:
+                self._spill(old_key, old_data)
+
+
+@st.cache_resource(show_spinner=False)
+def figure_cache() -> FigureCache:
+    """Fungsi untuk mendapatkan cache gambar bersama untuk semua sesi."""
+    cache = FigureCache(MEMORY_LIMIT, SPILL_DIRECTORY, SPILL_LIMIT)
+    if SPILL_DIRECTORY is not None:
+        # Sisa run sebelumnya dipangkas saat proses dimulai.
+        cache.prune()
+    return cache
+
+
+# Daftar penampung grafik yang aktif; lihat record_charts.
+_recorders = []
+
+
+@contextmanager
+def record_charts():
+    """Fungsi untuk mengumpulkan (nama fungsi gambar, kunci, PNG) setiap grafik yang dirender di dalam blok ini."""
+    charts = []
+    _recorders.append(charts)
+    try:
+        yield charts
+    finally:
+        _recorders.remove(charts)
+
+
+def render_png(draw, *data, figsize: tuple) -> bytes:
+    """Fungsi untuk mendapatkan PNG sebuah grafik; `draw(ax, *data)` hanya dipanggil saat cache miss."""
+    cache = figure_cache()
+    key = fingerprint(_code_fingerprint(draw.__code__), figsize, SAVEFIG_OPTIONS, *data)
+    png = cache.get(key)
+    if png is None:
+        fig, ax = plt.subplots(figsize=figsize)
+        try:
+            with measure('plot', draw.__name__):
+                draw(ax, *data)
+            buffer = io.BytesIO()
+            with measure('serialize', draw.__name__):
+                fig.savefig(buffer, **SAVEFIG_OPTIONS)
+        finally:
+            plt.close(fig)
+        png = buffer.getvalue()
+        cache.put(key, png)
+    for charts in _recorders:
+        charts.append((draw.__name__, key, png))
+    return png
+
+
+def default_chart_backend() -> str:
+    """Fungsi untuk mendapatkan backend grafik bawaan dari variabel lingkungan DASHBOARD_CHARTS."""
+    name = os.environ.get(CHARTS_VARIABLE, 'png')
+    if name not in CHART_BACKENDS:
+        raise ValueError(f"{CHARTS_VARIABLE}={name!r} tidak dikenal; pilih salah satu dari {', '.join(CHART_BACKENDS)}.")
+    return name
+
+
+# Backend pilihan sesi saat ini; ContextVar terpisah per thread sehingga
+# pilihan satu sesi Streamlit tidak memengaruhi sesi lain.
+_backend = contextvars.ContextVar('chart_backend', default=None)
+
+
+def set_chart_backend(name: str) -> None:
+    """Fungsi untuk memilih backend grafik ('png' atau 'vega-lite') untuk run saat ini."""
+    if name not in CHART_BACKENDS:
+        raise ValueError(f"Backend grafik {name!r} tidak dikenal; pilih salah satu dari {', '.join(CHART_BACKENDS)}.")
+    _backend.set(name)
+
+
+def chart(draw, *data, figsize: tuple, spec=None) -> None:
+    """Fungsi untuk menampilkan grafik dari cache render dengan st.image, atau di browser dengan Vega-Lite.
+
+    `spec(*data)` mengembalikan (data, spesifikasi) Vega-Lite (lihat vegalite.py)
+    dan hanya dipanggil pada backend 'vega-lite'. Saat grafik sedang direkam
+    (laporan batch) selalu dibuat PNG.
+    """
+    if spec is not None and not _recorders and (_backend.get() or default_chart_backend()) == 'vega-lite':
+        with measure('plot', draw.__name__):
+            source, vega_spec = spec(*data)
+        with measure('serialize', draw.__name__):
+            st.vega_lite_chart(source, vega_spec, use_container_width=True)
+        return
+    st.image(render_png(draw, *data, figsize=figsize), use_container_width=True, output_format="PNG")
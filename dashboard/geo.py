@@ -0,0 +1,211 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Geometri negara bagian Brasil untuk peta choropleth (pertanyaan 6c).
+
+Geometri ikut di repositori sebagai main-data/brazil-states.geojson sehingga
+dashboard tidak butuh jaringan. Saat pertama dimuat, GeoJSON disederhanakan ke
+toleransi render lalu disimpan sebagai GeoParquet di main-data/.cache;
+pemuatan berikutnya hanya membaca file biner itu. geopandas baru diimpor saat
+geometri dimuat (bagian Geospatial), bukan saat modul ini diimpor.
+
+GeoJSON tersebut disusun dari malha municipal IBGE 2005 skala 1:2.500.000
+(55mu2500gsd.shp): munisipalitas digabung per negara bagian, diubah ke WGS84,
+dan disederhanakan ke PRESIMPLIFY_TOLERANCE. Untuk menyusunnya ulang dari
+shapefile itu, atau memasang GeoJSON lain dengan kolom sigla dan name:
+
+    python geo.py --municipalities /path/to/55mu2500gsd.shp
+    python geo.py --source /path/to/brazil-states.geojson
+"""
+
+import argparse
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+import streamlit as st
+
+from loader import CACHE_DIRECTORY, data_path
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+BRAZIL_STATES_FILE = "brazil-states.geojson"
+STATE_COLUMNS = ['sigla', 'name', 'geometry']
+
+# Dalam derajat (~1 km). Peta 12x8 inci hanya punya sekitar 0.03 derajat per
+# piksel, jadi detail yang dibuang tidak terlihat.
+SIMPLIFY_TOLERANCE = 0.01
+# Presisi koordinat GeoJSON yang dikirim ke browser (grafik Vega-Lite).
+FEATURE_PRECISION = 0.001
+# Toleransi dan presisi GeoJSON di repositori (lihat dissolve_municipalities):
+# jauh di bawah SIMPLIFY_TOLERANCE sehingga tidak mengubah peta, tetapi
+# memangkas ukuran file.
+PRESIMPLIFY_TOLERANCE = 0.001
+STORED_PRECISION = 0.0001
+# Celah antar munisipalitas yang tersisa sebagai lubang setelah digabung (derajat persegi).
+SLIVER_AREA = 1e-6
+MISSING_MAP_MESSAGE = (
+    f"Peta negara bagian tidak ada: main-data/{BRAZIL_STATES_FILE} ikut di repositori tetapi terhapus. "
+    "Pulihkan dengan `git checkout`, atau pasang GeoJSON lain dengan `python geo.py --source <file>`."
+)
+# Nama negara bagian per sigla; malha municipal IBGE hanya memuat siglanya.
+STATE_NAMES = {
+    'AC': "Acre", 'AL': "Alagoas", 'AM': "Amazonas", 'AP': "Amapá", 'BA': "Bahia", 'CE': "Ceará",
+    'DF': "Distrito Federal", 'ES': "Espírito Santo", 'GO': "Goiás", 'MA': "Maranhão", 'MG': "Minas Gerais",
+    'MS': "Mato Grosso do Sul", 'MT': "Mato Grosso", 'PA': "Pará", 'PB': "Paraíba", 'PE': "Pernambuco",
+    'PI': "Piauí", 'PR': "Paraná", 'RJ': "Rio de Janeiro", 'RN': "Rio Grande do Norte", 'RO': "Rondônia",
+    'RR': "Roraima", 'RS': "Rio Grande do Sul", 'SC': "Santa Catarina", 'SE': "Sergipe", 'SP': "São Paulo",
+    'TO': "Tocantins",
+}
+
+
+def geoparquet_path() -> str:
+    """Fungsi untuk mendapatkan path GeoParquet hasil penyederhanaan."""
+    return os.path.join(CACHE_DIRECTORY, f"brazil-states-{SIMPLIFY_TOLERANCE:g}.parquet")
+
+
+def _without_slivers(geometry):
+    import shapely
+
+    polygons = getattr(geometry, 'geoms', [geometry])
+    polygons = [shapely.Polygon(polygon.exterior, [ring for ring in polygon.interiors
+                                                   if shapely.Polygon(ring).area >= SLIVER_AREA])
+                for polygon in polygons]
+    return polygons[0] if len(polygons) == 1 else shapely.MultiPolygon(polygons)
+
+
+def dissolve_municipalities(source: str) -> str:
+    """Fungsi untuk menyusun GeoJSON negara bagian di main-data dari malha municipal IBGE.
+
+    Negara bagian diambil dari dua digit pertama kode IBGE munisipalitas,
+    sehingga poligon laguna (kode 43000xx) ikut Rio Grande do Sul.
+    """
+    import geopandas as gpd
+    import shapely
+
+    municipalities = gpd.read_file(source, columns=['GEOCODIG_M', 'UF', 'Sigla'])
+    codes = municipalities.dropna(subset=['Sigla']).groupby('UF')['Sigla'].first()
+    municipalities['sigla'] = municipalities['GEOCODIG_M'].astype(str).str[:2].map(codes)
+    municipalities['geometry'] = shapely.make_valid(municipalities.geometry.values)
+    states = municipalities[['sigla', 'geometry']].dissolve('sigla').reset_index().to_crs(4326)
+    states['geometry'] = states.geometry.map(_without_slivers).simplify(PRESIMPLIFY_TOLERANCE, preserve_topology=True)
+    states['geometry'] = states.geometry.set_precision(STORED_PRECISION)
+    states.insert(1, 'name', states['sigla'].map(STATE_NAMES))
+    path = data_path(BRAZIL_STATES_FILE)
+    states.to_file(path + ".tmp", driver='GeoJSON', COORDINATE_PRECISION=4)
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def install_brazil_states(source: str) -> str:
+    """Fungsi untuk menyalin GeoJSON negara bagian lain dari file lokal ke main-data."""
+    path = data_path(BRAZIL_STATES_FILE)
+    shutil.copyfile(source, path + ".tmp")
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def build_geoparquet() -> str:
+    """Fungsi untuk menyederhanakan GeoJSON lokal dan menyimpannya sebagai GeoParquet bila sumbernya berubah.
+
+    Melempar FileNotFoundError bila GeoJSON belum dipasang (lihat MISSING_MAP_MESSAGE).
+    """
+    source = data_path(BRAZIL_STATES_FILE)
+    if not os.path.exists(source):
+        # Diperiksa di sini karena gpd.read_file melempar DataSourceError milik
+        # pyogrio, bukan FileNotFoundError.
+        raise FileNotFoundError(MISSING_MAP_MESSAGE)
+    target = geoparquet_path()
+    if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+        return target
+    import geopandas as gpd
+
+    states = gpd.read_file(source)[STATE_COLUMNS]
+    states['geometry'] = states.geometry.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True)
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    states.to_parquet(target + ".tmp")
+    os.replace(target + ".tmp", target)
+    return target
+
+
+def read_brazil_states() -> 'gpd.GeoDataFrame':
+    """Fungsi untuk membaca geometri negara bagian yang sudah disederhanakan."""
+    import geopandas as gpd
+
+    try:
+        return gpd.read_parquet(build_geoparquet())
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # Direktori cache read-only: sederhanakan langsung dari GeoJSON.
+        states = gpd.read_file(data_path(BRAZIL_STATES_FILE))[STATE_COLUMNS]
+        states['geometry'] = states.geometry.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True)
+        return states
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_brazil_states(path: str, mtime: float) -> 'gpd.GeoDataFrame':
+    return read_brazil_states()
+
+
+def brazil_states_version() -> tuple:
+    """Fungsi untuk mendapatkan kunci versi (path, mtime) GeoJSON negara bagian.
+
+    Melempar FileNotFoundError bila GeoJSON belum ada di main-data.
+    """
+    path = data_path(BRAZIL_STATES_FILE)
+    return path, os.path.getmtime(path)
+
+
+def brazil_states() -> 'gpd.GeoDataFrame':
+    """Fungsi untuk memuat geometri negara bagian dari cache proses; bersifat read-only."""
+    return _cached_brazil_states(*brazil_states_version())
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_state_features(path: str, mtime: float) -> list:
+    states = brazil_states()
+    states = states.set_geometry(states.geometry.set_precision(FEATURE_PRECISION))
+    return states.__geo_interface__['features']
+
+
+def state_features() -> list:
+    """Fungsi untuk mendapatkan geometri negara bagian sebagai daftar fitur GeoJSON berpresisi rendah; bersifat read-only."""
+    return _cached_state_features(*brazil_states_version())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--municipalities', help="susun ulang GeoJSON dari shapefile malha municipal IBGE")
+    source.add_argument('--source', help="pasang file GeoJSON lokal lain")
+    args = parser.parse_args()
+    if args.municipalities:
+        print(dissolve_municipalities(args.municipalities))
+    elif args.source:
+        print(install_brazil_states(args.source))
+    print(build_geoparquet())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Lokasi prefiks kode pos: centroid, jarak haversine, binning heksagon, dan seller terdekat.
+
+Tabel geolocation berisi sekitar satu juta titik, puluhan per prefiks kode
+pos. Titik-titik itu diringkas sekali menjadi centroid per prefiks dalam array
+NumPy berukuran ZIP_PREFIXES x 2 yang diindeks langsung dengan prefiksnya
+(NaN bila prefiks tidak dikenal) dan disimpan di main-data/.cache. Lokasi
+jutaan baris pesanan cukup dicari dengan indexing array, dan jarak serta sel
+heksagonnya dihitung vektor tanpa loop Python.
+
+Seller terdekat dicari lewat STRtree (shapely) atas lokasi seller: kandidat
+awal dari tetangga terdekat planar, lalu semua seller dalam kotak yang pasti
+memuat lingkaran haversine kandidat itu dibandingkan dengan jarak sebenarnya.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from loader import CACHE_DIRECTORY, TABLES, USED_COLUMNS, data_path, load_table, read_columnar, read_table, table_version
+from metrics import measure
+
+# Prefiks kode pos Brasil (CEP) terdiri dari lima digit.
+ZIP_PREFIXES = 100_000
+GEOLOCATION_COLUMNS = ['geolocation_zip_code_prefix', 'geolocation_lat', 'geolocation_lng']
+# Batas kasar wilayah Brasil; titik di luarnya (salah input di data Olist) dibuang.
+BRAZIL_LAT = (-34.0, 5.5)
+BRAZIL_LNG = (-74.0, -34.0)
+EARTH_RADIUS_KM = 6371.0088
+
+# Jari-jari heksagon (pusat ke sudut). Sel dihitung pada proyeksi
+# equirectangular dengan lintang acuan di tengah Brasil, sehingga luas sel
+# hampir sama di seluruh negeri.
+HEX_SIZE_KM = 25.0
+HEX_REFERENCE_LAT = -15.0
+# Koordinat aksial (q, r) dikodekan menjadi satu bilangan bulat non-negatif.
+HEX_OFFSET = 1 << 15
+HEX_STRIDE = 1 << 16
+
+
+def centroids_path() -> str:
+    """Fungsi untuk mendapatkan path array centroid prefiks kode pos di direktori cache."""
+    return os.path.join(CACHE_DIRECTORY, "zip-centroids.npy")
+
+
+def centroid_array(geolocation: pd.DataFrame) -> np.ndarray:
+    """Fungsi untuk meringkas tabel geolocation menjadi array centroid (lat, lng) yang diindeks prefiks kode pos."""
+    zips = geolocation['geolocation_zip_code_prefix'].to_numpy()
+    lat = geolocation['geolocation_lat'].to_numpy(dtype='float64')
+    lng = geolocation['geolocation_lng'].to_numpy(dtype='float64')
+    inside = ((zips >= 0) & (zips < ZIP_PREFIXES) & (lat >= BRAZIL_LAT[0]) & (lat <= BRAZIL_LAT[1])
+              & (lng >= BRAZIL_LNG[0]) & (lng <= BRAZIL_LNG[1]))
+    zips = zips[inside]
+    counts = np.bincount(zips, minlength=ZIP_PREFIXES)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        centroids = np.stack([np.bincount(zips, weights=lat[inside], minlength=ZIP_PREFIXES) / counts,
+                              np.bincount(zips, weights=lng[inside], minlength=ZIP_PREFIXES) / counts], axis=1)
+    return centroids.astype('float32')
+
+
+def build_zip_centroids(force: bool = False) -> str:
+    """Fungsi untuk menghitung dan menyimpan array centroid bila tabel geolocation berubah."""
+    source = data_path(TABLES['geolocation']['file'])
+    target = centroids_path()
+    if not force and os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+        return target
+    centroids = centroid_array(read_columnar('geolocation', GEOLOCATION_COLUMNS))
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    with open(target + ".tmp", 'wb') as f:
+        np.save(f, centroids)
+    os.replace(target + ".tmp", target)
+    return target
+
+
+def read_zip_centroids() -> np.ndarray:
+    """Fungsi untuk membaca array centroid prefiks kode pos (lihat `centroid_array`)."""
+    try:
+        # Di-memory-map agar replika dashboard di satu host berbagi array yang sama.
+        return np.load(build_zip_centroids(), mmap_mode='r')
+    except OSError:
+        # Direktori cache read-only: hitung langsung dari CSV.
+        return centroid_array(read_table('geolocation')[GEOLOCATION_COLUMNS])
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_zip_centroids(path: str, mtime: float) -> np.ndarray:
+    with measure('load', 'zip_centroids'):
+        return read_zip_centroids()
+
+
+def zip_centroids() -> np.ndarray:
+    """Fungsi untuk memuat array centroid prefiks kode pos dari cache proses; bersifat read-only."""
+    return _cached_zip_centroids(*table_version('geolocation'))
+
+
+def zip_lookup(values: np.ndarray, zips) -> np.ndarray:
+    """Fungsi untuk mengambil baris array berindeks prefiks kode pos; NaN bila prefiks kosong atau tidak dikenal."""
+    zips = pd.to_numeric(pd.Series(zips), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    known = (zips >= 0) & (zips < len(values))
+    result = values[np.where(known, zips, 0).astype('int64')].astype('float64')
+    result[~known] = np.nan
+    return result
+
+
+def zip_locations(zips, centroids: np.ndarray = None) -> tuple:
+    """Fungsi untuk mencari (lat, lng) setiap prefiks kode pos; NaN bila prefiks kosong atau tidak dikenal."""
+    points = zip_lookup(zip_centroids() if centroids is None else centroids, zips)
+    return points[:, 0], points[:, 1]
+
+
+def haversine_km(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """Fungsi untuk menghitung jarak lingkaran besar (km) antar pasangan titik dalam derajat."""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(value, dtype='float64')) for value in (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _project(lat, lng) -> tuple:
+    scale = np.radians(EARTH_RADIUS_KM)
+    return np.asarray(lng) * scale * np.cos(np.radians(HEX_REFERENCE_LAT)), np.asarray(lat) * scale
+
+
+def _unproject(x, y) -> tuple:
+    scale = np.radians(EARTH_RADIUS_KM)
+    return y / scale, x / (scale * np.cos(np.radians(HEX_REFERENCE_LAT)))
+
+
+def hex_cells(lat, lng, size_km: float = HEX_SIZE_KM) -> np.ndarray:
+    """Fungsi untuk menentukan kode sel heksagon (pointy-top) setiap titik; -1 bila lokasinya kosong."""
+    x, y = _project(lat, lng)
+    q = (np.sqrt(3) / 3 * x - y / 3) / size_km
+    r = 2 / 3 * y / size_km
+    s = -q - r
+    # Pembulatan koordinat kubus: komponen dengan selisih pembulatan terbesar
+    # dihitung ulang dari dua lainnya agar q + r + s tetap nol.
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    known = np.isfinite(q) & np.isfinite(r)
+    codes = np.where(known, (rq + HEX_OFFSET) * HEX_STRIDE + (rr + HEX_OFFSET), -1)
+    return codes.astype('int64')
+
+
+def _hex_axial(codes) -> tuple:
+    codes = np.asarray(codes, dtype='int64')
+    return codes // HEX_STRIDE - HEX_OFFSET, codes % HEX_STRIDE - HEX_OFFSET
+
+
+def hex_centers(codes, size_km: float = HEX_SIZE_KM) -> tuple:
+    """Fungsi untuk mendapatkan (lat, lng) pusat sel heksagon dari kodenya."""
+    q, r = _hex_axial(codes)
+    return _unproject(size_km * np.sqrt(3) * (q + r / 2), size_km * 1.5 * r)
+
+
+def hex_corners(codes, size_km: float = HEX_SIZE_KM) -> np.ndarray:
+    """Fungsi untuk mendapatkan sudut (lng, lat) setiap sel heksagon, berbentuk (sel, 6, 2), untuk digambar."""
+    q, r = _hex_axial(codes)
+    x, y = size_km * np.sqrt(3) * (q + r / 2), size_km * 1.5 * r
+    angles = np.radians(30 + 60 * np.arange(6))
+    lat, lng = _unproject(x[:, None] + size_km * np.cos(angles), y[:, None] + size_km * np.sin(angles))
+    return np.stack([lng, lat], axis=-1)
+
+
+def zip_density(counts: pd.Series, size_km: float = HEX_SIZE_KM) -> pd.Series:
+    """Fungsi untuk menjumlahkan cacah per prefiks kode pos (indeks `counts`) ke sel heksagon."""
+    cells = hex_cells(*zip_locations(counts.index), size_km)
+    known = cells >= 0
+    return pd.Series(counts.to_numpy()[known]).groupby(cells[known]).sum()
+
+
+def hex_density(orders: pd.Series, sellers: pd.Series, size_km: float = HEX_SIZE_KM) -> pd.DataFrame:
+    """Fungsi untuk menyusun kepadatan pesanan dan seller per sel heksagon dari cacah per prefiks kode pos.
+
+    Semua pesanan atau seller di satu prefiks berbagi centroid yang sama, jadi
+    binning cukup dilakukan per prefiks lalu dijumlahkan per sel.
+    """
+    density = pd.DataFrame({'orders': zip_density(orders, size_km), 'sellers': zip_density(sellers, size_km)})
+    density = density.fillna(0).astype('int64').rename_axis('cell')
+    lat, lng = hex_centers(density.index.to_numpy(), size_km)
+    return density.assign(lat=lat, lng=lng)[['lat', 'lng', 'orders', 'sellers']]
+
+
+def _plane(lat, lng) -> np.ndarray:
+    # Koordinat planar hanya untuk indeks spasial; jarak akhir selalu haversine.
+    return np.stack([np.asarray(lng) * np.cos(np.radians(HEX_REFERENCE_LAT)), np.asarray(lat)], axis=1)
+
+
+def nearest_distances(lat, lng, target_lat, target_lng) -> np.ndarray:
+    """Fungsi untuk menghitung jarak haversine (km) setiap titik ke titik target terdekat.
+
+    Semua koordinat harus terisi. Tetangga terdekat planar dari STRtree
+    memberi batas atas jarak; semua target di dalam kotak lintang/bujur yang
+    memuat lingkaran sejauh batas itu lalu dibandingkan dengan haversine,
+    sehingga hasilnya tepat walaupun proyeksi planarnya tidak.
+    """
+    # Diimpor di sini agar shapely hanya dimuat untuk bagian Geospatial.
+    import shapely
+
+    lat, lng = np.asarray(lat, dtype='float64'), np.asarray(lng, dtype='float64')
+    target_lat, target_lng = np.asarray(target_lat, dtype='float64'), np.asarray(target_lng, dtype='float64')
+    tree = shapely.STRtree(shapely.points(_plane(target_lat, target_lng)))
+    source, nearest = tree.query_nearest(shapely.points(_plane(lat, lng)), all_matches=False)
+    best = np.empty(len(lat))
+    best[source] = haversine_km(lat[source], lng[source], target_lat[nearest], target_lng[nearest])
+
+    reach = np.degrees(best * (1 + 1e-9) / EARTH_RADIUS_KM)
+    widest = np.radians(np.minimum(np.abs(lat) + reach, 89.0))
+    lng_reach = reach / np.cos(widest)
+    low, high = _plane(lat - reach, lng - lng_reach), _plane(lat + reach, lng + lng_reach)
+    source, candidate = tree.query(shapely.box(low[:, 0], low[:, 1], high[:, 0], high[:, 1]))
+    np.minimum.at(best, source, haversine_km(lat[source], lng[source], target_lat[candidate], target_lng[candidate]))
+    return best
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_nearest_seller(geolocation_version: tuple, sellers_version: tuple) -> np.ndarray:
+    with measure('aggregate', 'nearest_seller'):
+        centroids = zip_centroids()
+        lat, lng = centroids[:, 0], centroids[:, 1]
+        sellers = load_table('sellers', USED_COLUMNS['sellers'])
+        seller_lat, seller_lng = zip_locations(sellers['seller_zip_code_prefix'].unique(), centroids)
+        known_sellers = np.isfinite(seller_lat)
+        known = np.flatnonzero(np.isfinite(lat))
+        distances = np.full(ZIP_PREFIXES, np.nan, dtype='float32')
+        if known_sellers.any():
+            distances[known] = nearest_distances(lat[known], lng[known], seller_lat[known_sellers],
+                                                 seller_lng[known_sellers])
+        return distances
+
+
+def nearest_seller_km() -> np.ndarray:
+    """Fungsi untuk memuat jarak (km) dari setiap prefiks kode pos ke lokasi seller terdekat; bersifat read-only.
+
+    Array diindeks prefiks kode pos seperti `zip_centroids`; NaN bila lokasi
+    prefiks tidak diketahui.
+    """
+    return _cached_nearest_seller(table_version('geolocation'), table_version('sellers'))
+
+
+def seller_distances(customer_zips, seller_zips, centroids: np.ndarray = None) -> np.ndarray:
+    """Fungsi untuk menghitung jarak seller ke pelanggan (km, dibulatkan) dari prefiks kode pos keduanya."""
+    centroids = zip_centroids() if centroids is None else centroids
+    distance = haversine_km(*zip_locations(customer_zips, centroids), *zip_locations(seller_zips, centroids))
+    # Centroid prefiks hanya akurat beberapa km, jadi jarak disimpan per km
+    # agar distribusinya bisa dicacah seperti waktu pengiriman.
+    return np.round(distance)
+
+
+def state_distances(orders: pd.Series, seller_distance: pd.Series) -> pd.DataFrame:
+    """Fungsi untuk membandingkan jarak seller sebenarnya dengan jarak seller terdekat per negara bagian.
+
+    `orders` adalah jumlah pesanan per (customer_state, customer_zip_code_prefix)
+    dan `seller_distance` rata-rata jarak seller per negara bagian.
+    """
+    nearest = pd.Series(zip_lookup(nearest_seller_km(), orders.index.get_level_values(1)), index=orders.index)
+    known = nearest.notna()
+    weighted = (nearest[known] * orders[known]).groupby(level=0).sum() / orders[known].groupby(level=0).sum()
+    summary = pd.DataFrame({
+        'orders': orders.groupby(level=0).sum().astype('int64'),
+        'seller_distance_km': seller_distance,
+        'nearest_seller_km': weighted,
+    }).rename_axis('customer_state')
+    summary.index = summary.index.astype(str)
+    return summary.sort_values('seller_distance_km', ascending=False, kind='stable').reset_index()
@@ -0,0 +1,263 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Ingesti bertahap batch pesanan baru (orders, order_items, order_payments, order_reviews, customers).
+
+Direktori batch berisi satu atau lebih file dengan nama yang sama seperti di
+main-data (mis. orders_cleaned.csv). Di Olist setiap pesanan punya
+customer_id baru, jadi batch biasanya membawa customers_cleaned.csv untuk
+pelanggan pesanannya. Baris batch ditambahkan ke CSV di
+main-data, lalu tabel fakta, tabel pembayaran, kubus, sketsa, tanggal pesanan
+pertama seller, dan kohort diperbarui hanya dengan data batch dan disimpan
+(lihat state.py). Dashboard kemudian memuat hasil itu tanpa membangun ulang.
+
+Pembangunan ulang penuh dilakukan bila batch menyatakan ulang data lama:
+pesanan atau customer_id yang sudah ada, baris item/pembayaran/ulasan untuk
+pesanan di luar batch, atau waktu pembelian lebih awal dari pesanan terakhir
+yang tersimpan.
+
+Sebelum baris batch ditambahkan, ukuran CSV yang akan disambung dicatat di
+main-data/.pending-batch.json dan catatan itu baru dihapus setelah hasil
+olahan diterbitkan. Bila proses terhenti di antaranya, ingest berikutnya
+memotong CSV kembali ke ukuran tercatat lalu menerapkan ulang batch itu,
+sehingga CSV, cache Feather, dan hasil olahan tidak pernah tertinggal setengah.
+
+    python ingest.py path/ke/batch
+    python ingest.py --rebuild
+
+Dengan --watch proses tetap berjalan sebagai penerbit hasil olahan untuk
+replika dashboard (lihat state.py) dan membangun ulang setiap kali CSV
+berubah di luar ingest.py.
+"""
+
+import argparse
+import json
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+
+from cohorts import CohortCounts, cohorts
+from facts import (FACT_TABLES, PAYMENT_SOURCES, build_fact_table, build_payment_table, concat_frames,
+                   customer_order_counts, fact_table, order_rows, payment_table)
+from loader import DATA_DIRECTORY, TABLES, USED_COLUMNS, append_rows, data_path, load_table, read_table, table_version
+from rollups import CUBE_NAMES, build_cubes, cubes, merge_cubes
+from state import read_state, state_matches, write_state
+
+BATCH_TABLES = ['orders', 'order_items', 'order_payments', 'order_reviews', 'customers']
+PENDING_PATH = os.path.join(DATA_DIRECTORY, ".pending-batch.json")
+
+
+def source_versions() -> tuple:
+    """Fungsi untuk mendapatkan kunci versi semua tabel sumber hasil olahan."""
+    return tuple(table_version(name) for name in PAYMENT_SOURCES)
+
+
+def read_batch(directory: str) -> dict:
+    """Fungsi untuk membaca file batch yang ada di direktori; tabel yang tidak ada menjadi tabel kosong."""
+    batch = {}
+    for name in BATCH_TABLES:
+        path = os.path.join(directory, TABLES[name]['file'])
+        if os.path.exists(path):
+            batch[name] = read_table(name, path)
+        else:
+            batch[name] = load_table(name).iloc[:0]
+    return batch
+
+
+def restatement_reason(batch: dict, stored_fact: pd.DataFrame, stored_customers: pd.Series) -> str:
+    """Fungsi untuk memeriksa apakah batch mengubah data lama; mengembalikan alasannya atau None.
+
+    `stored_customers` berisi customer_id yang sudah ada di main-data sebelum batch ditambahkan.
+    """
+    orders = batch['orders']['order_id']
+    if orders.isin(stored_fact['order_id']).any():
+        return "batch berisi pesanan yang sudah ada"
+    if batch['customers']['customer_id'].isin(stored_customers).any():
+        # Negara bagian atau kota pelanggan lama bisa berubah, jadi baris fakta lamanya ikut berubah.
+        return "batch berisi pelanggan yang sudah ada"
+    for name in ['order_items', 'order_payments', 'order_reviews']:
+        if not batch[name]['order_id'].isin(orders).all():
+            return f"{name} batch merujuk pesanan di luar batch"
+    latest = stored_fact['order_purchase_timestamp'].max()
+    if pd.notna(latest) and (batch['orders']['order_purchase_timestamp'] < latest).any():
+        return "batch berisi pesanan yang lebih awal dari pesanan terakhir"
+    return None
+
+
+def cohort_parts(counts: CohortCounts) -> dict:
+    """Fungsi untuk menyimpan jumlah kohort dan peta kohort per pelanggan sebagai dua bagian terpisah.
+
+    Dashboard hanya memuat jumlahnya; peta pelanggan hanya dibaca ingest.py.
+    """
+    counts, customers = counts.split_customers()
+    return {'cohorts': counts, 'cohort_customers': customers}
+
+
+def rebuild() -> None:
+    """Fungsi untuk membangun ulang seluruh hasil olahan dari CSV dan menyimpannya."""
+    versions = source_versions()
+    fact = fact_table()
+    parts = {'fact': fact, 'payments': payment_table(), 'customer_orders': customer_order_counts(fact),
+             **cohort_parts(cohorts())}
+    parts.update({f"cube_{name}": value for name, value in cubes().items()})
+    write_state(parts, versions)
+
+
+def stored_state() -> dict:
+    """Fungsi untuk memuat hasil olahan tersimpan; dibangun ulang dulu bila tidak cocok dengan CSV."""
+    if not state_matches(source_versions()):
+        rebuild()
+    versions = source_versions()
+    parts = ['fact', 'payments', 'cohorts', 'cohort_customers', 'customer_orders']
+    parts += [f"cube_{name}" for name in CUBE_NAMES]
+    state = {part: read_state(part, versions) for part in parts}
+    state['cohorts'] = state['cohorts'].with_customers(state.pop('cohort_customers'))
+    return state
+
+
+def begin_batch(directory: str, batch: dict) -> None:
+    """Fungsi untuk mencatat batch yang akan disambung beserta ukuran CSV sebelum disambung."""
+    sizes = {name: os.path.getsize(data_path(TABLES[name]['file'])) for name in BATCH_TABLES if len(batch[name])}
+    with open(PENDING_PATH + ".tmp", 'w') as f:
+        json.dump({'batch': os.path.abspath(directory), 'sizes': sizes}, f)
+    os.replace(PENDING_PATH + ".tmp", PENDING_PATH)
+
+
+def recover(current: str = None) -> None:
+    """Fungsi untuk memulihkan batch yang terhenti sebelum hasil olahannya diterbitkan.
+
+    CSV dipotong kembali ke ukuran sebelum batch itu, lalu batch diterapkan
+    ulang, kecuali bila batch yang sama memang akan diingest (`current`) atau
+    direktorinya sudah tidak ada. Cache Feather yang sudah ikut disambung tidak
+    lagi cocok dengan ukuran dan mtime CSV sehingga dikonversi ulang.
+    """
+    try:
+        with open(PENDING_PATH) as f:
+            pending = json.load(f)
+    except FileNotFoundError:
+        return
+    for name, size in pending['sizes'].items():
+        os.truncate(data_path(TABLES[name]['file']), size)
+    if pending['batch'] != current and os.path.isdir(pending['batch']):
+        apply_batch(pending['batch'])
+    else:
+        os.remove(PENDING_PATH)
+
+
+def ingest(directory: str) -> str:
+    """Fungsi untuk menambahkan satu batch ke CSV dan hasil olahan; mengembalikan cara pembaruannya.
+
+    Batch yang sebelumnya terhenti di tengah jalan dipulihkan lebih dulu (lihat `recover`).
+    """
+    recover(os.path.abspath(directory))
+    return apply_batch(directory)
+
+
+def apply_batch(directory: str) -> str:
+    """Fungsi untuk menyambung satu batch ke CSV lalu menerbitkan hasil olahannya."""
+    batch = read_batch(directory)
+    state = stored_state()
+    stored_customers = load_table('customers', ['customer_id'])['customer_id']
+    known = batch['orders']['customer_id'].isin(stored_customers) | \
+        batch['orders']['customer_id'].isin(batch['customers']['customer_id'])
+    if not known.all():
+        # Tanpa baris pelanggan, negara bagian dan customer_unique_id pesanan itu kosong di tabel fakta.
+        raise ValueError(f"{(~known).sum()} pesanan batch merujuk customer_id yang tidak ada di "
+                         f"{TABLES['customers']['file']} batch maupun main-data")
+    reason = restatement_reason(batch, state['fact'], stored_customers)
+    begin_batch(directory, batch)
+    for name in BATCH_TABLES:
+        if len(batch[name]):
+            append_rows(name, batch[name])
+    if reason is not None:
+        rebuild()
+        os.remove(PENDING_PATH)
+        return f"bangun ulang penuh ({reason})"
+
+    data = {name: load_table(name, USED_COLUMNS[name]) for name in FACT_TABLES if name not in BATCH_TABLES}
+    data.update({name: batch[name][[col for col in USED_COLUMNS[name] if col in batch[name].columns]]
+                 for name in BATCH_TABLES if name != 'customers'})
+    # Pelanggan batch sudah disambung ke CSV; pesanan batch juga boleh merujuk
+    # pelanggan yang sudah tersimpan, jadi pelanggan dicari dari tabel lengkap.
+    customers = load_table('customers', USED_COLUMNS['customers'])
+    data['customers'] = customers[customers['customer_id'].isin(batch['orders']['customer_id'])]
+    batch_fact = build_fact_table(data, previous_orders=state['customer_orders'])
+    batch_payments = build_payment_table(batch_fact, data['order_payments'])
+    batch_cubes = build_cubes(batch_fact, batch_payments)
+
+    # Waktu pembelian batch tidak lebih awal dari data tersimpan, jadi cukup
+    # disambung; sort stabil hanya memindahkan baris tanpa tanggal ke akhir.
+    timestamp = 'order_purchase_timestamp'
+    fact = concat_frames([state['fact'], batch_fact]).sort_values(timestamp, kind='stable', ignore_index=True)
+    payments = concat_frames([state['payments'], batch_payments]).sort_values(timestamp, kind='stable',
+                                                                            ignore_index=True)
+    orders = order_rows(batch_fact)
+    parts = {
+        'fact': fact,
+        'payments': payments,
+        'customer_orders': state['customer_orders'].add(customer_order_counts(batch_fact), fill_value=0).astype('int64'),
+        **cohort_parts(state['cohorts'].update(orders['customer_unique_id'], orders[timestamp])),
+    }
+    stored_cubes = {name: state[f"cube_{name}"] for name in CUBE_NAMES}
+    parts.update({f"cube_{name}": value for name, value in merge_cubes(stored_cubes, batch_cubes).items()})
+    write_state(parts, source_versions())
+    os.remove(PENDING_PATH)
+    return f"bertahap ({len(batch['orders'])} pesanan baru)"
+
+
+def watch(interval: float) -> None:
+    """Fungsi untuk terus menerbitkan hasil olahan: bangun ulang setiap kali tidak cocok lagi dengan CSV."""
+    while True:
+        if not state_matches(source_versions()):
+            started = time.perf_counter()
+            rebuild()
+            # Hasil olahan sudah ada di disk; tabel di cache proses ini tidak
+            # dipakai lagi dan hanya akan menumpuk per versi CSV.
+            st.cache_resource.clear()
+            print(f"diterbitkan: {time.perf_counter() - started:.2f}s", flush=True)
+        time.sleep(interval)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('batches', nargs='*', help="direktori batch, diproses berurutan")
+    parser.add_argument('--rebuild', action='store_true', help="bangun ulang hasil olahan dari CSV")
+    parser.add_argument('--watch', type=float, metavar='DETIK',
+                        help="setelah selesai, terus berjalan dan bangun ulang bila CSV berubah (cek setiap DETIK)")
+    args = parser.parse_args()
+    recover()
+    if args.rebuild:
+        started = time.perf_counter()
+        rebuild()
+        print(f"bangun ulang penuh: {time.perf_counter() - started:.2f}s")
+    for directory in args.batches:
+        started = time.perf_counter()
+        mode = ingest(directory)
+        print(f"{directory}: {mode}, {time.perf_counter() - started:.2f}s")
+    if args.watch:
+        watch(args.watch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import streamlit as st
+
+from metrics import measure
+
+DATA_DIRECTORY = "main-data"
+CACHE_DIRECTORY = os.path.join(DATA_DIRECTORY, ".cache")
+
+# Kolom ID pada dataset Olist berupa string heksadesimal 32 karakter. Disimpan
+# sebagai string Arrow agar tersimpan rapat dalam satu buffer, bukan object.
+ID = "string[pyarrow]"
+
+TABLES = {
+    'customers': {
+        'file': "customers_cleaned.csv",
+        'dtypes': {
+            'customer_id': ID,
+            'customer_unique_id': ID,
+            'customer_zip_code_prefix': 'int32',
+            'customer_city': 'category',
+            'customer_state': 'category',
+        },
+        'dates': [],
+    },
+    'orders': {
+        'file': "orders_cleaned.csv",
+        'dtypes': {
+            'order_id': ID,
+            'customer_id': ID,
+            'order_status': 'category',
+        },
+        'dates': [
+            'order_purchase_timestamp',
+            'order_approved_at',
+            'order_delivered_carrier_date',
+            'order_delivered_customer_date',
+            'order_estimated_delivery_date',
+            'datetime',
+        ],
+    },
+    'order_items': {
+        'file': "order_items_cleaned.csv",
+        'dtypes': {
+            'order_id': ID,
+            'order_item_id': 'int16',
+            'product_id': ID,
+            'seller_id': ID,
+            'price': 'float64',
+            'freight_value': 'float64',
+        },
+        'dates': ['shipping_limit_date'],
+    },
+    'order_payments': {
+        'file': "order_payments_cleaned.csv",
+        'dtypes': {
+            'order_id': ID,
+            'payment_sequential': 'int16',
+            'payment_type': 'category',
+            'payment_installments': 'int16',
+            'payment_value': 'float64',
+        },
+        'dates': [],
+    },
+    'order_reviews': {
+        'file': "order_reviews_cleaned.csv",
+        'dtypes': {
+            'review_id': ID,
+            'order_id': ID,
+            'review_score': 'float32',
+        },
+        'dates': ['review_creation_date', 'review_answer_timestamp'],
+    },
+    'products': {
+        'file': "products_cleaned.csv",
+        'dtypes': {
+            'product_id': ID,
+            'product_category_name': 'category',
+            'product_name_lenght': 'float32',
+            'product_description_lenght': 'float32',
+            'product_photos_qty': 'float32',
+            'product_weight_g': 'float32',
+            'product_length_cm': 'float32',
+            'product_height_cm': 'float32',
+            'product_width_cm': 'float32',
+        },
+        'dates': [],
+    },
+    'sellers': {
+        'file': "sellers_cleaned.csv",
+        'dtypes': {
+            'seller_id': ID,
+            'seller_zip_code_prefix': 'int32',
+            'seller_city': 'category',
+            'seller_state': 'category',
+        },
+        'dates': [],
+    },
+    'category_translation': {
+        'file': "category_translation_cleaned.csv",
+        'dtypes': {
+            'product_category_name': 'category',
+            'product_category_name_english': 'category',
+        },
+        'dates': [],
+    },
+    'geolocation': {
+        'file': "geolocation_cleaned.csv",
+        'dtypes': {
+            'geolocation_zip_code_prefix': 'int32',
+            'geolocation_lat': 'float64',
+            'geolocation_lng': 'float64',
+            'geolocation_city': 'category',
+            'geolocation_state': 'category',
+        },
+        'dates': [],
+    },
+}
+
+
+# Kolom yang benar-benar dipakai oleh dashboard; kolom lain (mis. komentar
+# ulasan) tidak ikut dimuat. Tabel geolocation hanya dibaca sekali untuk
+# diringkas menjadi centroid prefiks kode pos (lihat geolocation.py).
+USED_COLUMNS = {
+    'customers': ['customer_id', 'customer_unique_id', 'customer_zip_code_prefix', 'customer_city', 'customer_state'],
+    'orders': ['order_id', 'customer_id', 'order_purchase_timestamp', 'order_delivered_customer_date',
+               'order_estimated_delivery_date'],
+    'order_items': ['order_id', 'order_item_id', 'product_id', 'seller_id', 'price'],
+    'order_payments': ['order_id', 'payment_type', 'payment_installments', 'payment_value'],
+    'order_reviews': ['order_id', 'review_score'],
+    'products': ['product_id', 'product_category_name'],
+    'sellers': ['seller_id', 'seller_zip_code_prefix', 'seller_city', 'seller_state'],
+    'category_translation': None,
+}
+
+
+def data_path(filename: str) -> str:
+    """Fungsi untuk mendapatkan path file data."""
+    return os.path.join(DATA_DIRECTORY, filename)
+
+
+def read_table(name: str, path: str = None) -> pd.DataFrame:
+    """Fungsi untuk membaca satu tabel CSV dengan dtype yang sudah ditentukan.
+
+    `path` dapat menunjuk file lain berskema sama (mis. batch baru); bawaannya file di main-data.
+    """
+    spec = TABLES[name]
+    path = path or data_path(spec['file'])
+    return pd.read_csv(path, **_csv_options(spec, path))
+
+
+def read_table_chunks(name: str, columns: list = None, chunksize: int = 250_000):
+    """Fungsi untuk membaca satu tabel CSV per potongan `chunksize` baris (iterator DataFrame).
+
+    Dtype sama seperti `read_table`, kecuali kolom category yang dibaca sebagai
+    string karena kategori setiap potongan bisa berbeda.
+    """
+    spec = TABLES[name]
+    path = data_path(spec['file'])
+    options = _csv_options(spec, path, columns)
+    options['dtype'] = {col: ID if dtype == 'category' else dtype for col, dtype in options['dtype'].items()}
+    return pd.read_csv(path, chunksize=chunksize, **options)
+
+
+def _csv_options(spec: dict, path: str, columns: list = None) -> dict:
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [col for col in columns if col in header] if columns else list(header)
+    return {
+        'usecols': usecols if columns else None,
+        'dtype': {col: dtype for col, dtype in spec['dtypes'].items() if col in usecols},
+        'parse_dates': [col for col in spec['dates'] if col in usecols],
+    }
+
+
+def file_sha256(path: str) -> str:
+    """Fungsi untuk menghitung hash SHA-256 sebuah file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def columnar_path(name: str) -> str:
+    """Fungsi untuk mendapatkan path file Feather hasil konversi sebuah tabel."""
+    return os.path.join(CACHE_DIRECTORY, f"{name}.feather")
+
+
+# Metadata pandas di file Feather hanya mencatat "string", sehingga tanpa
+# pemetaan ini kolom ID akan kembali menjadi string berbasis object Python.
+_ARROW_TYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow"),
+}
+
+
+def _read_meta(name: str) -> dict:
+    try:
+        with open(columnar_path(name) + ".json") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def columnar_fresh(name: str) -> bool:
+    """Fungsi untuk memeriksa tanpa membaca CSV apakah file Feather sebuah tabel masih sesuai dengan sumbernya."""
+    stat = os.stat(data_path(TABLES[name]['file']))
+    meta = _read_meta(name)
+    return os.path.exists(columnar_path(name)) and (meta.get('size'), meta.get('mtime')) == (stat.st_size, stat.st_mtime)
+
+
+def build_columnar(name: str, force: bool = False) -> str:
+    """Fungsi untuk mengonversi CSV ke Feather (Arrow IPC) bila sumbernya berubah."""
+    source = data_path(TABLES[name]['file'])
+    target = columnar_path(name)
+    stat = os.stat(source)
+    meta = _read_meta(name)
+    fresh = os.path.exists(target) and meta.get('size') == stat.st_size
+    if not force and fresh and meta.get('mtime') == stat.st_mtime:
+        return target
+
+    # mtime berubah tetapi isi file mungkin sama (mis. hasil checkout ulang),
+    # jadi hash dibandingkan dulu sebelum membangun ulang.
+    sha256 = file_sha256(source)
+    if force or not fresh or meta.get('sha256') != sha256:
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        # Tanpa kompresi agar file bisa di-memory-map saat dibaca.
+        feather.write_feather(read_table(name), target + ".tmp", compression='uncompressed')
+        os.replace(target + ".tmp", target)
+    with open(target + ".json", 'w') as f:
+        json.dump({'source': source, 'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': sha256}, f)
+    return target
+
+
+def build_columnar_cache(force: bool = False) -> list:
+    """Fungsi untuk mengonversi seluruh tabel cleaned ke format kolumnar."""
+    return [build_columnar(name, force) for name in TABLES if os.path.exists(data_path(TABLES[name]['file']))]
+
+
+def append_rows(name: str, rows: pd.DataFrame) -> None:
+    """Fungsi untuk menambahkan baris ke akhir CSV sebuah tabel (urutan kolom mengikuti header CSV).
+
+    Bila cache Feather tabel itu masih segar, cache ikut diperbarui dengan
+    menyambung tabel Arrow lama dan baris baru, tanpa mem-parse ulang CSV.
+    """
+    source = data_path(TABLES[name]['file'])
+    header = pd.read_csv(source, nrows=0).columns
+    stat = os.stat(source)
+    meta = _read_meta(name)
+    target = columnar_path(name)
+    fresh = os.path.exists(target) and meta.get('size') == stat.st_size and meta.get('mtime') == stat.st_mtime
+
+    with open(source, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        newline = f.read(1) != b'\n'
+    with open(source, 'a', newline='') as f:
+        if newline:
+            f.write('\n')
+        rows.reindex(columns=header).to_csv(f, header=False, index=False)
+    if not fresh:
+        return
+
+    # `rows` dibaca dengan read_table sehingga dtype-nya sama dengan tabel di cache.
+    old = feather.read_table(target, memory_map=True)
+    new = pa.Table.from_pandas(rows[old.schema.names], preserve_index=False).cast(old.schema)
+    feather.write_feather(pa.concat_tables([old, new]), target + ".tmp", compression='uncompressed')
+    os.replace(target + ".tmp", target)
+    stat = os.stat(source)
+    with open(target + ".json", 'w') as f:
+        json.dump({'source': source, 'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': file_sha256(source)}, f)
+
+
+def read_feather(path: str, columns: list = None) -> pd.DataFrame:
+    """Fungsi untuk membaca file Feather lewat memory map, hanya kolom yang diminta."""
+    if columns is not None:
+        available = pa.ipc.open_file(pa.memory_map(path)).schema.names
+        columns = [col for col in columns if col in available]
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    # split_blocks menghindari penggabungan blok sehingga kolom numerik tanpa
+    # null dapat langsung menunjuk ke buffer yang di-memory-map.
+    return table.to_pandas(split_blocks=True, types_mapper=_ARROW_TYPES.get)
+
+
+def read_columnar(name: str, columns: list = None) -> pd.DataFrame:
+    """Fungsi untuk membaca tabel Feather hasil konversi CSV, hanya kolom yang diminta."""
+    return read_feather(build_columnar(name), columns)
+
+
+def table_version(name: str) -> tuple:
+    """Fungsi untuk mendapatkan kunci versi (path, mtime) sebuah tabel."""
+    path = data_path(TABLES[name]['file'])
+    return path, os.path.getmtime(path)
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_table(name: str, path: str, mtime: float, columns: tuple = None) -> pd.DataFrame:
+    # path dan mtime hanya dipakai sebagai kunci cache: file yang berubah di
+    # disk menghasilkan kunci baru sehingga tabel dibaca ulang.
+    columns = list(columns) if columns is not None else None
+    with measure('load', name):
+        try:
+            return read_columnar(name, columns)
+        except OSError:
+            # Direktori data read-only: tetap jalan dengan membaca CSV langsung.
+            df = read_table(name)
+            return df if columns is None else df[[col for col in columns if col in df.columns]]
+
+
+def load_table(name: str, columns: list = None) -> pd.DataFrame:
+    """Fungsi untuk memuat tabel dari cache proses; hasilnya dibagi semua sesi dan bersifat read-only."""
+    columns = tuple(columns) if columns is not None else None
+    return _cached_table(name, *table_version(name), columns)
+
+
+def load_data(columns: dict = None) -> dict:
+    """Fungsi untuk memuat tabel cleaned ke dalam dictionary.
+
+    Bila `columns` diberikan, hanya tabel yang tercantum yang dimuat, masing-masing
+    dengan daftar kolomnya (None berarti semua kolom).
+    """
+    if columns is None:
+        columns = dict.fromkeys(TABLES)
+    return {name: load_table(name, cols) for name, cols in columns.items()}
+
+
+if __name__ == "__main__":
+    for path in build_columnar_cache(force=True):
+        print(path)
@@ -0,0 +1,253 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Instrumentasi waktu dan memori per langkah dashboard.
+
+`measure(kind, step)` mencatat waktu dinding, waktu CPU, dan selisih RSS
+sebuah blok kode. Jenis langkah mengikuti alur dashboard: load (membaca
+tabel), merge (membangun tabel fakta/pembayaran), aggregate (kubus, kohort,
+agregasi mesin), analysis (satu bagian analysis.py), plot (fungsi gambar),
+serialize (savefig ke PNG), dan render (menampilkan satu bagian).
+
+Setiap catatan masuk ke daftar langkah run yang sedang berjalan (lihat
+`start_run`, ditampilkan di panel debug sidebar) dan ke total kumulatif proses
+(`REGISTRY`) yang ditulis dalam format teks Prometheus oleh `write_prometheus`,
+mis. untuk textfile collector node_exporter; setiap replika menulis filenya
+sendiri (lihat REPLICA_PLACEHOLDER). Catatan yang sama juga dikirim
+sebagai satu baris JSON ke logger "metrics" pada level DEBUG. Langkah yang
+dilewati karena cache tidak tercatat, jadi daftar per run menunjukkan apa yang
+benar-benar dikerjakan.
+"""
+
+import contextvars
+import glob
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METRICS_FILE_VARIABLE = "DASHBOARD_METRICS_FILE"
+# Diganti nama replika di path file metrik, agar replika yang berbagi
+# direktori tidak saling menimpa file yang sama.
+REPLICA_PLACEHOLDER = "{replica}"
+DEBUG_VARIABLE = "DASHBOARD_DEBUG"
+KINDS = ['load', 'merge', 'aggregate', 'analysis', 'plot', 'serialize', 'render']
+
+logger = logging.getLogger("metrics")
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def rss_bytes() -> int:
+    """Fungsi untuk membaca RSS proses saat ini (puncak RSS bila /proc tidak tersedia; 0 bila keduanya tidak ada)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        if resource is None:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def replica_name() -> str:
+    """Fungsi untuk mendapatkan nama replika proses ini, yaitu nama host dan PID."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+# (nama metrik, tipe, kolom total, keterangan)
+PROMETHEUS_METRICS = [
+    ('dashboard_step_calls_total', 'counter', 'calls', "Jumlah eksekusi langkah."),
+    ('dashboard_step_seconds_total', 'counter', 'seconds', "Total waktu dinding langkah dalam detik."),
+    ('dashboard_step_cpu_seconds_total', 'counter', 'cpu_seconds', "Total waktu CPU proses selama langkah dalam detik."),
+    ('dashboard_step_max_seconds', 'gauge', 'max_seconds', "Waktu dinding terlama satu eksekusi langkah."),
+    ('dashboard_step_last_memory_delta_bytes', 'gauge', 'memory_delta_bytes',
+     "Selisih RSS eksekusi terakhir langkah dalam byte."),
+]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Registry:
+    """Total kumulatif per (bagian, jenis, langkah) untuk seluruh proses, dibagi semua sesi."""
+
+    def __init__(self):
+        self.totals = {}
+        self._lock = threading.Lock()
+
+    def add(self, record: dict) -> None:
+        """Fungsi untuk menambahkan satu catatan langkah ke total."""
+        key = (record['section'], record['kind'], record['step'])
+        with self._lock:
+            total = self.totals.get(key)
+            if total is None:
+                total = self.totals[key] = {'calls': 0, 'seconds': 0.0, 'cpu_seconds': 0.0, 'max_seconds': 0.0}
+            total['calls'] += 1
+            total['seconds'] += record['seconds']
+            total['cpu_seconds'] += record['cpu_seconds']
+            total['max_seconds'] = max(total['max_seconds'], record['seconds'])
+            total['memory_delta_bytes'] = record['memory_delta_bytes']
+
+    def snapshot(self) -> dict:
+        """Fungsi untuk menyalin total saat ini."""
+        with self._lock:
+            return {key: dict(total) for key, total in self.totals.items()}
+
+    def prometheus(self, replica: str = None) -> str:
+        """Fungsi untuk menyusun total dalam format teks eksposisi Prometheus; `replica` ditambahkan sebagai label."""
+        totals = self.snapshot()
+        replica_label = "" if replica is None else f'replica="{_escape(replica)}"'
+        lines = []
+        for metric, kind, column, help_text in PROMETHEUS_METRICS:
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+            for (section, step_kind, step), total in sorted(totals.items()):
+                labels = f'section="{_escape(section)}",kind="{_escape(step_kind)}",step="{_escape(step)}"'
+                labels = f"{replica_label},{labels}" if replica_label else labels
+                lines.append(f"{metric}{{{labels}}} {total[column]:.6g}")
+        memory_labels = f"{{{replica_label}}}" if replica_label else ""
+        lines += ["# HELP dashboard_resident_memory_bytes RSS proses saat ekspor.",
+                  "# TYPE dashboard_resident_memory_bytes gauge",
+                  f"dashboard_resident_memory_bytes{memory_labels} {rss_bytes()}"]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# Daftar langkah run skrip saat ini, nama bagian yang sedang ditampilkan, dan
+# kedalaman langkah bersarang. ContextVar terpisah per thread, jadi sesi
+# Streamlit yang berjalan bersamaan tidak saling mencampur catatan.
+_steps = contextvars.ContextVar('metrics_steps', default=None)
+_section = contextvars.ContextVar('metrics_section', default="")
+_depth = contextvars.ContextVar('metrics_depth', default=0)
+
+
+def start_run(section: str = "") -> list:
+    """Fungsi untuk memulai daftar langkah baru bagi run saat ini; mengembalikan daftar yang akan diisi."""
+    steps = []
+    _steps.set(steps)
+    _section.set(section)
+    _depth.set(0)
+    return steps
+
+
+def set_section(section: str) -> None:
+    """Fungsi untuk menetapkan nama bagian yang dipakai sebagai label langkah berikutnya di run ini."""
+    _section.set(section)
+
+
+@contextmanager
+def measure(kind: str, step: str):
+    """Fungsi untuk mencatat waktu dinding, waktu CPU, dan selisih RSS blok di dalamnya sebagai satu langkah.
+
+    Bisa dipakai sebagai `with measure(...)` maupun dekorator. Waktu CPU
+    dihitung untuk seluruh proses, jadi ikut memuat thread mesin agregasi
+    (dan sesi lain yang berjalan bersamaan).
+    """
+    depth = _depth.get()
+    record = {'section': _section.get(), 'kind': kind, 'step': step, 'depth': depth}
+    steps = _steps.get()
+    if steps is not None:
+        # Ditambahkan saat mulai agar urutan daftar mengikuti urutan pemanggilan.
+        steps.append(record)
+    token = _depth.set(depth + 1)
+    memory, cpu, started = rss_bytes(), time.process_time(), time.perf_counter()
+    try:
+        yield
+    finally:
+        record['seconds'] = time.perf_counter() - started
+        record['cpu_seconds'] = time.process_time() - cpu
+        record['memory_delta_bytes'] = rss_bytes() - memory
+        _depth.reset(token)
+        REGISTRY.add(record)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json.dumps(record))
+
+
+def _running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Proses ada tetapi milik pengguna lain.
+        return True
+    return True
+
+
+def remove_stale_files(path: str) -> int:
+    """Fungsi untuk menghapus file metrik replika di host ini yang prosesnya sudah berhenti.
+
+    `path` adalah path berisi REPLICA_PLACEHOLDER; replika di host lain tidak
+    bisa diperiksa, jadi filenya dibiarkan. Mengembalikan jumlah file yang dihapus.
+    """
+    if REPLICA_PLACEHOLDER not in path:
+        return 0
+    prefix = f"{socket.gethostname()}-"
+    head, tail = path.split(REPLICA_PLACEHOLDER, 1)
+    removed = 0
+    for candidate in glob.glob(glob.escape(head) + glob.escape(prefix) + "*" + glob.escape(tail)):
+        pid = candidate[len(head) + len(prefix):len(candidate) - len(tail)]
+        if not pid.isdigit() or int(pid) == os.getpid() or _running(int(pid)):
+            continue
+        try:
+            os.remove(candidate)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+# Path metrik yang file replika usangnya sudah dibersihkan oleh proses ini.
+_cleaned = set()
+
+
+def write_prometheus(path: str, registry: Registry = REGISTRY) -> None:
+    """Fungsi untuk menulis total kumulatif ke file teks Prometheus secara atomik.
+
+    REPLICA_PLACEHOLDER di `path` diganti `replica_name()` dan nama replika
+    ditambahkan sebagai label, sehingga setiap replika punya file dan deret
+    sendiri. Penulisan pertama juga membuang file replika usang di host ini.
+    """
+    replica = replica_name() if REPLICA_PLACEHOLDER in path else None
+    target = path.replace(REPLICA_PLACEHOLDER, replica) if replica else path
+    directory = os.path.dirname(target)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if path not in _cleaned:
+        _cleaned.add(path)
+        remove_stale_files(path)
+    temporary = f"{target}.{uuid.uuid4().hex}.tmp"
+    with open(temporary, 'w') as f:
+        f.write(registry.prometheus(replica))
+    os.replace(temporary, target)
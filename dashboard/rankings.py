@@ -0,0 +1,157 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Peringkat top-N atas kubus berkode integer.
+
+Dimensi setiap kubus (lihat rollups.py) disimpan sebagai category, jadi
+setiap label sudah punya kode integer. Total per label dalam rentang tanggal
+dihitung dengan np.bincount atas kode tersebut, bukan groupby, lalu N
+teratas dipilih dengan np.argpartition tanpa mengurutkan semua label. Hanya
+kandidatnya yang diurutkan, dengan label seri diurutkan menurut labelnya
+seperti engines.aggregate. Hasilnya identik dengan agregasi engines.AGGREGATES
+bernama sama, ditambah kolom `share`: bagian setiap baris dari total
+seluruh label (`ranking`) atau dari total grupnya (`top_per_group`, mis.
+dominasi seller teratas dalam satu kategori).
+
+Jumlah baris peringkat di dashboard diatur dengan variabel lingkungan
+DASHBOARD_TOP_N (bawaan 10).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+TOP_VARIABLE = "DASHBOARD_TOP_N"
+TOP_N = int(os.environ.get(TOP_VARIABLE) or 10)
+# Kombinasi kode beberapa dimensi dicacah dengan array padat selama jumlah
+# kombinasinya tidak melebihi batas ini; di atasnya lewat np.unique.
+DENSE_GROUPS = 1 << 22
+
+# cube: nama kubus di rollups.cubes, by: dimensi yang diperingkat, value:
+# ukuran yang dijumlahkan.
+RANKINGS = {
+    'items_by_category': {'cube': 'items', 'by': ['product_category_name_english'], 'value': 'items'},
+    'returns_by_category': {'cube': 'category_returns', 'by': ['product_category_name_english'], 'value': 'returns'},
+    'revenue_by_category': {'cube': 'items', 'by': ['product_category_name_english'], 'value': 'revenue'},
+    'orders_by_seller': {'cube': 'seller_orders', 'by': ['seller_id'], 'value': 'orders'},
+    'orders_by_category_seller': {'cube': 'category_seller_orders', 'by': ['product_category_name', 'seller_id'],
+                                  'value': 'orders'},
+    'sales_by_city': {'cube': 'city_sales', 'by': ['customer_city', 'customer_state'], 'value': 'revenue'},
+}
+
+
+def coded_totals(cube: pd.DataFrame, by: list, value: str) -> tuple:
+    """Fungsi untuk menjumlahkan kolom `value` kubus per kombinasi kode dimensi `by`.
+
+    Mengembalikan kode setiap dimensi per grup (list array) dan total grupnya.
+    Hanya grup yang punya baris di `cube` dan tanpa dimensi kosong yang ikut,
+    sama seperti groupby dengan observed=True.
+    """
+    codes = [cube[col].cat.codes.to_numpy() for col in by]
+    sizes = [len(cube[col].cat.categories) for col in by]
+    known = np.logical_and.reduce([code >= 0 for code in codes])
+    key = np.zeros(int(known.sum()), dtype='int64')
+    for code, size in zip(codes, sizes):
+        key = key * size + code[known]
+    values = cube[value].to_numpy()[known]
+    groups = int(np.prod(sizes, dtype='int64'))
+    if groups <= DENSE_GROUPS:
+        present = np.flatnonzero(np.bincount(key, minlength=groups))
+        totals = np.bincount(key, weights=values, minlength=groups)[present]
+    else:
+        present, inverse = np.unique(key, return_inverse=True)
+        totals = np.bincount(inverse, weights=values, minlength=len(present))
+    if np.issubdtype(values.dtype, np.integer):
+        totals = totals.round().astype('int64')
+    return list(np.unravel_index(present, sizes)) if groups else [present] * len(by), totals
+
+
+def _labels(cube: pd.DataFrame, by: list, codes: list, rows: np.ndarray) -> list:
+    # Label dijadikan string seperti hasil engines.aggregate, sebagai array
+    # numpy agar bisa diurutkan dengan np.lexsort.
+    return [np.asarray(cube[col].cat.categories[code[rows]].astype(str), dtype=str) for col, code in zip(by, codes)]
+
+
+def _ranked_frame(by: list, labels: list, value: str, totals: np.ndarray, shares: np.ndarray,
+                  order: np.ndarray) -> pd.DataFrame:
+    frame = pd.DataFrame({col: label[order] for col, label in zip(by, labels)})
+    frame[value] = totals[order]
+    frame['share'] = shares[order]
+    return frame
+
+
+def ranking(cube: pd.DataFrame, name: str, n: int = None) -> pd.DataFrame:
+    """Fungsi untuk memeringkat label RANKINGS[name] pada (potongan) kubus dari nilai terbesar.
+
+    Mengembalikan `n` baris teratas (semua bila None) dengan kolom dimensi,
+    ukuran, dan `share` terhadap total semua label. Label bernilai sama
+    diurutkan menurut labelnya.
+    """
+    spec = RANKINGS[name]
+    codes, totals = coded_totals(cube, spec['by'], spec['value'])
+    rows = np.arange(len(totals))
+    if n is not None and n < len(totals):
+        # Semua label yang menyamai nilai ke-n ikut jadi kandidat, agar seri di
+        # batas dipilih menurut label, bukan menurut urutan argpartition.
+        kth = totals[np.argpartition(totals, len(totals) - n)[len(totals) - n]]
+        rows = np.flatnonzero(totals >= kth)
+    labels = _labels(cube, spec['by'], codes, rows)
+    order = np.lexsort(labels[::-1] + [-totals[rows]])[:n]
+    shares = totals[rows] / totals.sum() if len(totals) else totals[rows].astype('float64')
+    return _ranked_frame(spec['by'], labels, spec['value'], totals[rows], shares, order)
+
+
+def ranked_series(cube: pd.DataFrame, name: str, n: int = None) -> pd.Series:
+    """Fungsi untuk memeringkat label RANKINGS[name] berdimensi tunggal sebagai Series (lihat `ranking`).
+
+    Hasilnya sama dengan engines.aggregate(name) yang diurutkan menurun.
+    """
+    spec = RANKINGS[name]
+    return ranking(cube, name, n).set_index(spec['by'][0])[spec['value']].rename(name)
+
+
+def top_per_group(cube: pd.DataFrame, name: str, n: int = 1) -> pd.DataFrame:
+    """Fungsi untuk mengambil `n` label teratas dimensi kedua RANKINGS[name] dalam setiap label dimensi pertama.
+
+    Grup diurutkan menurut labelnya. `share` adalah bagian baris dari total
+    grupnya, mis. porsi pesanan kategori yang dipegang seller teratasnya.
+    """
+    spec = RANKINGS[name]
+    codes, totals = coded_totals(cube, spec['by'], spec['value'])
+    group = codes[0]
+    group_totals = np.bincount(group, weights=totals)
+    # Nilai ke-n setiap grup: urut per grup lalu nilai menurun, ambil nilai
+    # terkecil di antara n posisi pertamanya.
+    order = np.lexsort((-totals, group))
+    sorted_group = group[order]
+    first = np.arange(len(order)) - np.searchsorted(sorted_group, sorted_group) < n
+    cutoff = np.full(len(group_totals), np.inf)
+    np.minimum.at(cutoff, sorted_group[first], totals[order][first])
+    rows = np.flatnonzero(totals >= cutoff[group])
+    labels = _labels(cube, spec['by'], codes, rows)
+    order = np.lexsort(labels[:0:-1] + [-totals[rows], labels[0]])
+    # Kandidat yang seri di batas bisa lebih dari n per grup.
+    ordered = labels[0][order]
+    order = order[np.arange(len(order)) - np.searchsorted(ordered, ordered) < n]
+    return _ranked_frame(spec['by'], labels, spec['value'], totals[rows], totals[rows] / group_totals[group[rows]],
+                         order)
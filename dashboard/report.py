@@ -0,0 +1,252 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Laporan batch: menghitung dan menggambar semua bagian dashboard tanpa server Streamlit.
+
+Setiap bagian dijalankan di proses terpisah. Hasilnya ditulis ke direktori
+keluaran:
+
+    manifest.json              waktu pembuatan, versi data, dan durasi per bagian
+    <bagian>/results.pkl       hasil analysis.py apa adanya, dibaca oleh dashboard
+    <bagian>/<kunci>.csv       tabel agregat (DataFrame/Series)
+    <bagian>/values.json       nilai lain (skalar, statistik boxplot)
+    <bagian>/<grafik>.png      grafik
+
+Gambar juga disimpan di direktori cache gambar (figures.SPILL_DIRECTORY)
+dengan kunci sidik jarinya, sehingga dashboard langsung menemukannya.
+Dengan --chunked semua bagian dihitung dari agregat out-of-core (chunked.py)
+untuk data yang tidak muat di memori. Contoh pemakaian dari direktori dashboard:
+
+    python report.py --workers 4
+    python report.py --chunked --partitions 64
+"""
+
+import argparse
+import datetime
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import streamlit.logger
+
+from analysis import SECTIONS, data_version
+from chunked import PARTITIONS, aggregate_results, build_aggregates
+from chunked import date_bounds as aggregate_date_bounds
+from figures import figure_cache, record_charts
+from geo import build_geoparquet
+from loader import DATA_DIRECTORY, build_columnar_cache
+from rankings import TOP_N
+from rollups import date_bounds
+from views import RENDERERS
+
+REPORT_DIRECTORY = os.path.join(DATA_DIRECTORY, "report")
+MANIFEST_FILE = "manifest.json"
+# Dinaikkan setiap kali arti hasil analisis berubah; laporan format lama dianggap basi.
+REPORT_FORMAT = 4
+
+
+def section_directory(section: str, output: str = REPORT_DIRECTORY) -> str:
+    """Fungsi untuk mendapatkan direktori keluaran sebuah bagian (nama fungsi analisisnya)."""
+    return os.path.join(output, SECTIONS[section].__name__)
+
+
+def _json_value(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def write_section(section: str, output: str, results: dict = None) -> dict:
+    """Fungsi untuk menghitung, menggambar, dan menulis satu bagian; mengembalikan entri manifest.
+
+    `results` yang sudah dihitung (mis. dari mode chunked) langsung digambar.
+    """
+    import matplotlib
+
+    # Digambar tanpa layar. Dashboard yang hanya membaca laporan tidak
+    # mengimpor matplotlib sama sekali.
+    matplotlib.use("Agg")
+    streamlit.logger.set_log_level("error")
+    started = time.perf_counter()
+    results = SECTIONS[section]() if results is None else results
+    computed = time.perf_counter()
+    with record_charts() as charts:
+        RENDERERS[section](results)
+    rendered = time.perf_counter()
+
+    directory = section_directory(section, output)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "results.pkl"), 'wb') as f:
+        pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tables, values = [], {}
+    for key, value in results.items():
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            value.to_csv(os.path.join(directory, f"{key}.csv"))
+            tables.append(key)
+        else:
+            values[key] = value
+    with open(os.path.join(directory, "values.json"), 'w') as f:
+        json.dump(values, f, indent=2, default=_json_value)
+
+    cache = figure_cache()
+    figures, uses = {}, {}
+    for name, key, png in charts:
+        # Fungsi gambar yang sama bisa dipakai beberapa kali (mis. draw_4c).
+        name = name.removeprefix("draw_")
+        uses[name] = uses.get(name, 0) + 1
+        filename = name if uses[name] == 1 else f"{name}_{uses[name]}"
+        with open(os.path.join(directory, f"{filename}.png"), 'wb') as f:
+            f.write(png)
+        cache.persist(key, png)
+        figures[filename] = key
+    return {
+        'compute_seconds': round(computed - started, 3),
+        'render_seconds': round(rendered - computed, 3),
+        'write_seconds': round(time.perf_counter() - rendered, 3),
+        'tables': tables,
+        'figures': figures,
+    }
+
+
+def write_report(output: str = REPORT_DIRECTORY, sections: list = None, workers: int = None,
+                 partitions: int = None) -> dict:
+    """Fungsi untuk membuat laporan semua bagian secara paralel dan menulis manifest-nya.
+
+    Bila `partitions` diberikan, hasil dihitung out-of-core (lihat chunked.py)
+    dengan jumlah partisi tersebut sebelum digambar di proses anak.
+    """
+    sections = sections or list(SECTIONS)
+    generated = time.time()
+    # Cache kolumnar dan GeoParquet dibangun sekali di sini agar proses anak
+    # tidak berlomba menulis file yang sama. date_bounds() juga membangun tabel
+    # fakta dan cube; dengan start method fork proses anak mewarisinya dari
+    # cache proses ini, dengan spawn masing-masing membangun ulang. Mode
+    # chunked tidak memakai cache kolumnar karena membacanya butuh tabel utuh.
+    try:
+        build_geoparquet()
+    except FileNotFoundError as error:
+        # Peta 6c opsional: bagian Geospatial tetap dibuat, dengan peringatan sebagai ganti peta.
+        print(error)
+    if partitions:
+        aggregates = build_aggregates(partitions)
+        results, bounds = aggregate_results(aggregates), aggregate_date_bounds(aggregates)
+        del aggregates
+    else:
+        build_columnar_cache()
+        results, bounds = {}, date_bounds()
+    manifest = {
+        'format': REPORT_FORMAT,
+        'generated': generated,
+        'data_version': data_version(),
+        'date_bounds': [day.isoformat() for day in bounds],
+        'top_n': TOP_N,
+        'sections': {},
+    }
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(write_section, section, output, results.get(section)): section
+                   for section in sections}
+        for future in as_completed(futures):
+            section = futures[future]
+            manifest['sections'][section] = entry = future.result()
+            print(f"{section:<24}hitung {entry['compute_seconds']:>7.2f}s  gambar {entry['render_seconds']:>7.2f}s  "
+                  f"tulis {entry['write_seconds']:>6.2f}s")
+    manifest['seconds'] = round(time.time() - generated, 3)
+    os.makedirs(output, exist_ok=True)
+    path = os.path.join(output, MANIFEST_FILE)
+    with open(path + ".tmp", 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+    return manifest
+
+
+def _read_manifest(output: str) -> dict:
+    try:
+        with open(os.path.join(output, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def fresh_manifest(output: str = REPORT_DIRECTORY) -> dict:
+    """Fungsi untuk membaca manifest laporan; dictionary kosong bila belum ada atau lebih lama dari data sumber."""
+    manifest = _read_manifest(output)
+    try:
+        newest = max(mtime for _, mtime in data_version())
+    except FileNotFoundError:
+        return {}
+    # Waktu mulai dicatat sebelum data dibaca, jadi data yang diubah selama
+    # laporan dibuat tetap membuat laporan dianggap basi, begitu pula jumlah
+    # baris peringkat (DASHBOARD_TOP_N) yang berbeda.
+    fresh = manifest.get('format') == REPORT_FORMAT and manifest.get('generated', 0) >= newest and \
+        manifest.get('top_n') == TOP_N
+    return manifest if fresh else {}
+
+
+def precomputed_date_bounds(output: str = REPORT_DIRECTORY) -> tuple:
+    """Fungsi untuk mendapatkan rentang tanggal dari laporan batch; None bila laporan basi."""
+    bounds = fresh_manifest(output).get('date_bounds')
+    return tuple(datetime.date.fromisoformat(day) for day in bounds) if bounds else None
+
+
+@st.cache_resource(show_spinner=False, max_entries=len(SECTIONS))
+def _cached_report(path: str, mtime: float) -> dict:
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def precomputed_results(section: str, output: str = REPORT_DIRECTORY) -> dict:
+    """Fungsi untuk memuat hasil laporan batch sebuah bagian bila lebih baru dari data sumbernya.
+
+    Mengembalikan None bila laporan belum ada, tidak memuat bagian tersebut, atau
+    salah satu tabel sumber diubah setelah laporan mulai dibuat.
+    """
+    if section not in fresh_manifest(output).get('sections', {}):
+        return None
+    path = os.path.join(section_directory(section, output), "results.pkl")
+    try:
+        return _cached_report(path, os.path.getmtime(path))
+    except OSError:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', default=REPORT_DIRECTORY, help="direktori keluaran")
+    parser.add_argument('--sections', nargs='+', choices=list(SECTIONS), help="bagian yang dibuat (bawaan: semua)")
+    parser.add_argument('--workers', type=int, help="jumlah proses (bawaan: jumlah CPU)")
+    parser.add_argument('--chunked', action='store_true', help="hitung out-of-core untuk data lebih besar dari RAM")
+    parser.add_argument('--partitions', type=int, default=PARTITIONS, help="jumlah partisi mode chunked")
+    args = parser.parse_args()
+    streamlit.logger.set_log_level("error")
+    manifest = write_report(args.output, args.sections, args.workers, args.partitions if args.chunked else None)
+    print(f"Selesai dalam {manifest['seconds']:.2f}s -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pandas as pd
+import streamlit as st
+
+from facts import (PAYMENT_SOURCES, concat_frames, date_slice, fact_table, grain_rows, item_rows, order_rows,
+                   payment_table, prepared_table)
+from loader import table_version
+from metrics import measure
+from state import read_state
+from stats import value_sketch
+
+# Dimensi kubus item dan pembayaran. Pembayaran punya grain sendiri (satu
+# baris per pembayaran, bisa lebih dari satu per pesanan), jadi ukurannya
+# disimpan di kubus terpisah yang berbagi dimensi hari dan negara bagian.
+ITEM_DIMENSIONS = ['product_category_name', 'product_category_name_english', 'customer_state', 'seller_id']
+PAYMENT_DIMENSIONS = ['payment_type', 'customer_state']
+# Kubus peringkat (lihat rankings.py): satu ukuran per hari x dimensi yang
+# diperingkat, masing-masing pada grain nilainya.
+RANKING_DIMENSIONS = {
+    'category_returns': ['product_category_name_english'],
+    'seller_orders': ['seller_id'],
+    'category_seller_orders': ['product_category_name', 'seller_id'],
+    'city_sales': ['customer_city', 'customer_state'],
+}
+CUBE_NAMES = ['items', 'payments', 'delay_by_review', 'review_by_payment', 'seller_first_orders', *RANKING_DIMENSIONS]
+
+
+def _cube(frame: pd.DataFrame, day: pd.Series, dimensions: list) -> pd.DataFrame:
+    # Dimensi disimpan sebagai category (kode integer + kamus label). Baris
+    # tanpa nilai dimensi (mis. pesanan tanpa item) tetap dihitung.
+    keys = [day.rename('day')] + [frame[col].astype('category') for col in dimensions]
+    cube = frame.drop(columns=dimensions).groupby(keys, observed=True, dropna=False, sort=True).sum()
+    return cube.reset_index()
+
+
+def build_item_cube(fact: pd.DataFrame) -> pd.DataFrame:
+    """Fungsi untuk meringkas tabel fakta menjadi kubus hari x kategori x negara bagian x seller.
+
+    Ukuran disimpan sebagai jumlah dan cacah (bukan rata-rata) agar bisa
+    dijumlahkan ulang ke bulan, hari dalam seminggu, atau rentang tanggal apa pun.
+    """
+    has_item = fact['order_item_id'].notna()
+    # Waktu pengiriman dan keterlambatan milik pesanan, jadi hanya dihitung di
+    # baris item pertama; rata-ratanya per pesanan, bukan per item.
+    first_item = fact['first_item']
+    delay = fact['delay_time'].where(first_item)
+    delivery = fact['delivery_time'].where(first_item)
+    measures = pd.DataFrame({
+        'rows': 1,
+        'orders': first_item.astype('int32'),
+        'items': has_item.astype('int32'),
+        'revenue': fact['price'].where(has_item, 0.0),
+        'delay_sum': delay.fillna(0),
+        'delay_count': delay.notna().astype('int32'),
+        'delivery_sum': delivery.fillna(0),
+        'delivery_count': delivery.notna().astype('int32'),
+    })
+    measures[ITEM_DIMENSIONS] = fact[ITEM_DIMENSIONS]
+    return _cube(measures, fact['order_purchase_timestamp'].dt.normalize(), ITEM_DIMENSIONS)
+
+
+def build_payment_cube(payments: pd.DataFrame) -> pd.DataFrame:
+    """Fungsi untuk meringkas tabel pembayaran menjadi kubus hari x metode pembayaran x negara bagian."""
+    measures = pd.DataFrame({
+        'payments': 1,
+        'payment_value': payments['payment_value'],
+        'installment_payments': (payments['payment_installments'] > 1).astype('int32'),
+    })
+    measures[PAYMENT_DIMENSIONS] = payments[PAYMENT_DIMENSIONS]
+    return _cube(measures, payments['order_purchase_timestamp'].dt.normalize(), PAYMENT_DIMENSIONS)
+
+
+def _measure_cube(rows: pd.DataFrame, dimensions: list, measure: str, values: pd.Series = None) -> pd.DataFrame:
+    # Tanpa `values` setiap baris dicacah satu.
+    measures = pd.DataFrame({measure: 1 if values is None else values}, index=rows.index)
+    measures[dimensions] = rows[dimensions]
+    return _cube(measures, rows['order_purchase_timestamp'].dt.normalize(), dimensions)
+
+
+def build_ranking_cubes(fact: pd.DataFrame) -> dict:
+    """Fungsi untuk meringkas tabel fakta menjadi kubus peringkat (lihat RANKING_DIMENSIONS).
+
+    Retur dan pesanan seller dicacah pada grain yang sama dengan agregasi
+    engines.AGGREGATES bernama sama, sehingga pesanan dengan banyak item
+    tidak terhitung berkali-kali.
+    """
+    items = item_rows(fact)
+    returned = grain_rows(items[items['review_score'] == 1], ['order_id', 'product_category_name_english'])
+    category_sellers = grain_rows(items, ['order_id', 'product_category_name', 'seller_id'])
+    return {
+        'category_returns': _measure_cube(returned, RANKING_DIMENSIONS['category_returns'], 'returns'),
+        'seller_orders': _measure_cube(grain_rows(items, ['order_id', 'seller_id']), RANKING_DIMENSIONS['seller_orders'],
+                                       'orders'),
+        'category_seller_orders': _measure_cube(category_sellers, RANKING_DIMENSIONS['category_seller_orders'], 'orders'),
+        'city_sales': _measure_cube(fact, RANKING_DIMENSIONS['city_sales'], 'revenue', fact['price']),
+    }
+
+
+def seller_first_orders(items: pd.DataFrame) -> pd.Series:
+    """Fungsi untuk mendapatkan tanggal pesanan pertama setiap seller dari kubus item, terurut per tanggal."""
+    sold = items[items['items'] > 0]
+    return sold.groupby('seller_id', observed=True)['day'].min().sort_values()
+
+
+@measure('aggregate', 'cubes')
+def build_cubes(fact: pd.DataFrame, payments: pd.DataFrame) -> dict:
+    """Fungsi untuk membangun semua kubus dan sketsa (lihat `cubes`) dari tabel fakta dan pembayaran."""
+    items = build_item_cube(fact)
+    # Sketsa distribusi harian untuk boxplot 1e dan 2e, masing-masing pada grain
+    # nilainya: satu ulasan per pesanan dan per metode pembayaran pesanan.
+    orders = order_rows(fact)
+    order_methods = grain_rows(payments, ['order_id', 'payment_type'])
+    return {
+        'items': items,
+        'payments': build_payment_cube(payments),
+        'delay_by_review': value_sketch(orders, 'review_score', 'delay_time',
+                                        orders['order_purchase_timestamp'].dt.normalize()),
+        'review_by_payment': value_sketch(order_methods, 'payment_type', 'review_score',
+                                          order_methods['order_purchase_timestamp'].dt.normalize()),
+        'seller_first_orders': seller_first_orders(items),
+        **build_ranking_cubes(fact),
+    }
+
+
+# Dimensi setiap kubus/sketsa selain `day`, dipakai saat menggabungkan batch.
+CUBE_DIMENSIONS = {
+    'items': ITEM_DIMENSIONS,
+    'payments': PAYMENT_DIMENSIONS,
+    'delay_by_review': ['review_score', 'value'],
+    'review_by_payment': ['payment_type', 'value'],
+    **RANKING_DIMENSIONS,
+}
+
+
+def merge_cube(cube: pd.DataFrame, batch: pd.DataFrame, dimensions: list) -> pd.DataFrame:
+    """Fungsi untuk menambahkan kubus/sketsa sebuah batch ke kubus yang sudah ada.
+
+    Ukuran berupa jumlah dan cacah sehingga cukup dijumlahkan. Hanya baris
+    mulai hari pertama batch (ditambah baris tanpa tanggal) yang diagregasi
+    ulang; bagian awal kubus disalin apa adanya.
+    """
+    days = batch['day'].dropna()
+    split = date_slice(cube['day'], days.min(), None).start if len(days) else int(cube['day'].notna().sum())
+    return concat_frames([cube.iloc[:split], sum_cubes([cube.iloc[split:], batch], dimensions)])
+
+
+def sum_cubes(frames: list, dimensions: list) -> pd.DataFrame:
+    """Fungsi untuk menjumlahkan beberapa kubus/sketsa berdimensi sama menjadi satu kubus terurut per hari."""
+    combined = concat_frames(frames)
+    return combined.groupby(['day'] + dimensions, observed=True, dropna=False, sort=True).sum().reset_index()
+
+
+def merge_cubes(stored: dict, batch: dict) -> dict:
+    """Fungsi untuk menggabungkan semua kubus batch (hasil `build_cubes`) ke kubus yang sudah ada."""
+    merged = {name: merge_cube(stored[name], batch[name], dims) for name, dims in CUBE_DIMENSIONS.items()}
+    first = pd.concat([stored['seller_first_orders'], batch['seller_first_orders']])
+    merged['seller_first_orders'] = first.groupby(level=0, observed=True).min().sort_values()
+    return merged
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_cubes(versions: tuple) -> dict:
+    stored = {name: read_state(f"cube_{name}", versions) for name in CUBE_NAMES}
+    if all(part is not None for part in stored.values()):
+        return stored
+    return build_cubes(fact_table(), payment_table())
+
+
+def cubes() -> dict:
+    """Fungsi untuk memuat kubus agregasi dari cache proses; bersifat read-only."""
+    prepared = prepared_table('cubes')
+    if prepared is not None:
+        return prepared
+    return _cached_cubes(tuple(table_version(name) for name in PAYMENT_SOURCES))
+
+
+def cube_range(name: str, start: pd.Timestamp = None, end: pd.Timestamp = None) -> pd.DataFrame:
+    """Fungsi untuk mengambil baris kubus atau sketsa (lihat `cubes`) dalam rentang [start, end)."""
+    cube = cubes()[name]
+    return cube.iloc[date_slice(cube['day'], start, end)]
+
+
+def rollup(cube: pd.DataFrame, by, measures: list) -> pd.DataFrame:
+    """Fungsi untuk menjumlahkan ukuran kubus menurut dimensi atau turunan kolom `day`."""
+    return cube.groupby(by, observed=True)[measures].sum()
+
+
+def ratio(cube: pd.DataFrame, by, total: str, count: str) -> pd.Series:
+    """Fungsi untuk menghitung rata-rata dari pasangan ukuran jumlah/cacah."""
+    grouped = rollup(cube, by, [total, count])
+    return grouped[total] / grouped[count]
+
+
+def new_sellers(start: pd.Timestamp = None, end: pd.Timestamp = None) -> pd.Series:
+    """Fungsi untuk mengambil tanggal pesanan pertama seller yang jatuh dalam rentang [start, end)."""
+    first = cubes()['seller_first_orders']
+    return first.iloc[date_slice(first, start, end)]
+
+
+def date_bounds() -> tuple:
+    """Fungsi untuk mendapatkan tanggal pembelian pertama dan terakhir."""
+    day = cubes()['items']['day'].dropna()
+    return day.iloc[0].date(), day.iloc[-1].date()
@@ -0,0 +1,185 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Penyimpanan hasil olahan (tabel fakta, kubus, sketsa, kohort) di disk.
+
+Setiap penyimpanan mencatat versi (path, mtime) CSV sumber yang diwakilinya.
+ingest.py memperbarui hasil olahan secara bertahap lalu menyimpannya dengan
+versi CSV yang baru, sehingga dashboard cukup memuatnya dan tidak membangun
+ulang dari CSV. Bila CSV diubah di luar ingest.py, versinya tidak cocok dan
+hasil olahan dibangun ulang seperti biasa.
+
+Tabel disimpan sebagai Arrow IPC tanpa kompresi dengan tata letak yang bisa
+dipakai pandas apa adanya: satu chunk per kolom, tanpa bitmap null (NaN dan
+NaT disimpan sebagai nilainya), category sebagai kodenya, dan bool/tanggal/
+Period sebagai bilangan bulat. Saat dimuat, setiap kolom hanya berupa view
+read-only ke file yang di-memory-map, jadi beberapa replika dashboard di satu
+host berbagi halaman memori yang sama. Dengan DASHBOARD_STATE_DIRECTORY di
+tmpfs (mis. /dev/shm) satu proses penerbit (`python ingest.py --watch 10`)
+menyiapkan tabel di shared memory dan replika hanya memetakannya:
+
+    DASHBOARD_STATE_DIRECTORY=/dev/shm/e-commerce python ingest.py --watch 10
+    DASHBOARD_STATE_DIRECTORY=/dev/shm/e-commerce streamlit run dashboard.py
+"""
+
+import json
+import os
+import pickle
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from loader import CACHE_DIRECTORY
+from metrics import measure
+
+STATE_DIRECTORY_VARIABLE = "DASHBOARD_STATE_DIRECTORY"
+STATE_DIRECTORY = os.environ.get(STATE_DIRECTORY_VARIABLE) or os.path.join(CACHE_DIRECTORY, "state")
+MANIFEST_PATH = os.path.join(STATE_DIRECTORY, "manifest.json")
+# Dinaikkan setiap kali arti hasil olahan berubah (mis. grain ukuran kubus),
+# agar hasil lama yang versi CSV-nya masih cocok tidak dipakai lagi.
+STATE_FORMAT = 5
+
+
+# Kunci metadata skema Arrow yang menyimpan dtype pandas asli setiap kolom.
+DTYPES_KEY = b"dashboard.dtypes"
+
+
+def _column_array(column: pd.Series) -> pa.Array:
+    dtype = column.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.array(column.cat.codes.to_numpy())
+    if isinstance(dtype, pd.PeriodDtype):
+        return pa.array(column.array.asi8)
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufmM':
+        values = column.to_numpy()
+        if dtype.kind in 'bmM':
+            values = values.view('uint8' if dtype.kind == 'b' else 'int64')
+        # from_pandas=False: NaN tetap NaN, bukan null, sehingga tidak ada bitmap.
+        return pa.array(values, from_pandas=False)
+    return pa.array(column)
+
+
+def write_frame(frame: pd.DataFrame, path: str) -> None:
+    """Fungsi untuk menulis DataFrame (indeks bawaan) ke Arrow IPC dengan tata letak zero-copy (lihat `read_frame`)."""
+    table = pa.table({col: _column_array(frame[col]) for col in frame.columns}).combine_chunks()
+    table = table.replace_schema_metadata({DTYPES_KEY: pickle.dumps(dict(frame.dtypes))})
+    feather.write_feather(table, path, compression='uncompressed', chunksize=max(len(frame), 1))
+
+
+def _column_values(array: pa.ChunkedArray, dtype):
+    array = array.combine_chunks() if array.num_chunks != 1 else array.chunk(0)
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pd.Categorical.from_codes(array.to_numpy(zero_copy_only=True), dtype=dtype, validate=False)
+    if isinstance(dtype, pd.PeriodDtype):
+        return pd.arrays.PeriodArray(array.to_numpy(zero_copy_only=True), dtype=dtype)
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufmM':
+        return array.to_numpy(zero_copy_only=True).view(dtype)
+    if dtype == pd.StringDtype("pyarrow"):
+        return pd.arrays.ArrowStringArray(array)
+    return pd.Series(array.to_pandas()).astype(dtype).array
+
+
+def read_frame(path: str) -> pd.DataFrame:
+    """Fungsi untuk memuat file `write_frame` lewat memory map tanpa menyalin kolomnya.
+
+    Kolom menunjuk langsung ke halaman file sehingga bersifat read-only dan
+    dibagi semua proses yang memetakan file yang sama.
+    """
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    dtypes = pickle.loads(table.schema.metadata[DTYPES_KEY])
+    return pd.DataFrame({col: _column_values(table.column(col), dtypes[col]) for col in table.column_names},
+                        copy=False)
+
+
+def _read_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def state_matches(versions: tuple) -> bool:
+    """Fungsi untuk memeriksa apakah hasil olahan tersimpan mewakili versi CSV yang diberikan."""
+    manifest = _read_manifest()
+    stored = manifest.get('versions', {})
+    return manifest.get('format') == STATE_FORMAT and all(stored.get(path) == mtime for path, mtime in versions)
+
+
+def read_state(part: str, versions: tuple):
+    """Fungsi untuk memuat satu bagian hasil olahan; None bila tidak ada atau versinya tidak cocok."""
+    manifest = _read_manifest()
+    entry = manifest.get('parts', {}).get(part)
+    if entry is None or not state_matches(versions):
+        return None
+    path = os.path.join(STATE_DIRECTORY, manifest['generation'], entry['file'])
+    try:
+        with measure('load', f"state_{part}"):
+            if entry['kind'] == 'pickle':
+                with open(path, 'rb') as f:
+                    return pickle.load(f)
+            frame = read_frame(path)
+    except OSError:
+        return None
+    if entry['kind'] == 'series':
+        # Indeks dibangun langsung dari kolomnya; set_index akan menyalin frame.
+        index = [frame[col] for col in entry['index']]
+        index = pd.MultiIndex.from_arrays(index) if len(index) > 1 else pd.Index(index[0])
+        return pd.Series(frame[entry['name']].array, index=index, name=entry['name'], copy=False)
+    return frame
+
+
+def write_state(parts: dict, versions: tuple) -> None:
+    """Fungsi untuk menyimpan hasil olahan beserta versi CSV sumbernya.
+
+    Setiap penyimpanan ditulis ke direktori generasi baru lalu manifest
+    diganti secara atomik, jadi pembaca tidak pernah melihat campuran dua versi.
+    """
+    previous = _read_manifest().get('generation')
+    generation = uuid.uuid4().hex
+    directory = os.path.join(STATE_DIRECTORY, generation)
+    os.makedirs(directory)
+    entries = {}
+    for part, value in parts.items():
+        if isinstance(value, pd.DataFrame):
+            entries[part] = {'kind': 'frame', 'file': f"{part}.feather"}
+            write_frame(value, os.path.join(directory, f"{part}.feather"))
+        elif isinstance(value, pd.Series):
+            index = [name or 'index' for name in value.index.names]
+            entries[part] = {'kind': 'series', 'file': f"{part}.feather", 'index': index, 'name': value.name}
+            write_frame(value.rename_axis(index).reset_index(), os.path.join(directory, f"{part}.feather"))
+        else:
+            entries[part] = {'kind': 'pickle', 'file': f"{part}.pkl"}
+            with open(os.path.join(directory, f"{part}.pkl"), 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    manifest = {'format': STATE_FORMAT, 'generation': generation, 'versions': dict(versions), 'parts': entries}
+    with open(MANIFEST_PATH + ".tmp", 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(MANIFEST_PATH + ".tmp", MANIFEST_PATH)
+    if previous:
+        # Proses lain yang sedang membaca generasi lama tetap aman di Linux
+        # karena file yang sudah dibuka/di-memory-map tidak ikut hilang.
+        shutil.rmtree(os.path.join(STATE_DIRECTORY, previous), ignore_errors=True)
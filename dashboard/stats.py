@@ -0,0 +1,99 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pandas as pd
+
+MAX_FLIERS = 40
+
+
+def _label(value) -> str:
+    # Skor ulasan tersimpan sebagai float; tampilkan 1, 2, ... bukan 1.0, 2.0, ...
+    return f"{value:g}" if isinstance(value, (float, np.floating)) else str(value)
+
+
+def value_sketch(frame: pd.DataFrame, by: str, value: str, partition: pd.Series, resolution: float = 1.0) -> pd.DataFrame:
+    """Fungsi untuk membangun sketsa distribusi `value` per grup `by` dan per partisi.
+
+    Sketsa berupa histogram bin tetap: nilai dibulatkan ke kelipatan
+    `resolution` lalu dicacah per (partisi, grup, nilai). Histogram bisa
+    digabung cukup dengan menjumlahkan cacahnya, sehingga partisi harian dapat
+    digabung untuk rentang tanggal apa pun. Untuk nilai bulat (hari
+    keterlambatan, skor ulasan) dengan resolution=1 hasilnya eksak.
+    """
+    values = frame[value]
+    keep = values.notna() & frame[by].notna()
+    binned = (values[keep] / resolution).round() * resolution
+    keys = [partition[keep].rename('day'), frame.loc[keep, by], binned.rename('value')]
+    counts = binned.groupby(keys, observed=True, dropna=False, sort=True).size()
+    return counts.rename('count').reset_index()
+
+
+def merge_sketches(sketch: pd.DataFrame, by: str) -> pd.Series:
+    """Fungsi untuk menggabungkan sketsa seluruh partisi menjadi cacah per (grup, nilai).
+
+    Urutan grup mengikuti kemunculan pertamanya pada sketsa.
+    """
+    order = pd.unique(sketch[by])
+    counts = sketch.groupby([by, 'value'], observed=True)['count'].sum()
+    return counts.reindex(order, level=0)
+
+
+def _quantiles(values: np.ndarray, counts: np.ndarray, probs: list) -> np.ndarray:
+    # Sama dengan np.quantile(method='linear') pada data mentah: posisi
+    # h = (n - 1) * q dicari pada cacah kumulatif lewat binary search.
+    cumulative = np.cumsum(counts)
+    positions = (cumulative[-1] - 1) * np.asarray(probs)
+    lower = np.floor(positions)
+    lo = values[np.searchsorted(cumulative, lower, side='right')]
+    hi = values[np.searchsorted(cumulative, np.minimum(lower + 1, cumulative[-1] - 1), side='right')]
+    return lo + (positions - lower) * (hi - lo)
+
+
+def box_stats(counts: pd.Series, max_fliers: int = MAX_FLIERS) -> list:
+    """Fungsi untuk menghitung statistik boxplot per grup untuk `Axes.bxp` dari sketsa.
+
+    `counts` adalah hasil `merge_sketches`. Kuartil dan whisker (1.5 x IQR)
+    mengikuti aturan boxplot matplotlib/seaborn. Outlier disimpan sebagai
+    nilai unik dan dibatasi `max_fliers` nilai paling ekstrem per grup.
+    """
+    stats = []
+    for group, group_counts in counts.groupby(level=0, sort=False, observed=True):
+        values = group_counts.index.get_level_values('value').to_numpy(dtype='float64')
+        weights = group_counts.to_numpy()
+        q1, med, q3 = _quantiles(values, weights, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+        fliers = values[~inside]
+        if len(fliers) > max_fliers:
+            # Nilai sudah terurut; ambil yang paling jauh dari median di kedua sisi.
+            fliers = fliers[np.argsort(-np.abs(fliers - med), kind='stable')[:max_fliers]]
+        stats.append({
+            'label': _label(group),
+            'q1': q1,
+            'med': med,
+            'q3': q3,
+            'whislo': values[inside].min(),
+            'whishi': values[inside].max(),
+            'fliers': np.sort(fliers),
+        })
+    return stats
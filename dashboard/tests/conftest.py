@@ -0,0 +1,84 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Fixture bersama: dataset sintetis kecil (benchmarks/synthetic.py) di direktori sementara.
+
+Modul dashboard membaca main-data relatif terhadap direktori kerja, jadi
+seluruh sesi test dijalankan dari direktori sementara tersebut. Jalankan dari
+akar repositori atau direktori dashboard:
+
+    python -m pytest dashboard/tests
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+DASHBOARD_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DASHBOARD_DIRECTORY)
+# Grafik digambar tanpa layar, seperti di report.py.
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import streamlit.logger  # noqa: E402
+
+from benchmarks.synthetic import generate  # noqa: E402
+from geo import BRAZIL_STATES_FILE  # noqa: E402
+from loader import DATA_DIRECTORY, TABLES  # noqa: E402
+
+# Sekitar 2.000 pesanan: cukup untuk semua bagian, cukup kecil untuk setiap test.
+SCALE = 0.02
+
+
+@pytest.fixture(scope='session', autouse=True)
+def data_directory(tmp_path_factory):
+    """Fungsi untuk membuat dataset sintetis sekali per sesi dan menjalankan test dari direktorinya."""
+    streamlit.logger.set_log_level("error")
+    root = tmp_path_factory.mktemp('olist')
+    translation = os.path.join(DASHBOARD_DIRECTORY, DATA_DIRECTORY, TABLES['category_translation']['file'])
+    generate(str(root / DATA_DIRECTORY), SCALE, translation_path=translation)
+    # Peta negara bagian ikut di repositori, jadi ikut disalin seperti di checkout.
+    shutil.copyfile(os.path.join(DASHBOARD_DIRECTORY, DATA_DIRECTORY, BRAZIL_STATES_FILE),
+                    root / DATA_DIRECTORY / BRAZIL_STATES_FILE)
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        yield root / DATA_DIRECTORY
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def data_copy(data_directory, tmp_path, monkeypatch):
+    """Fungsi untuk menjalankan satu test dari salinan CSV main-data saja (tanpa peta dan cache)."""
+    import streamlit as st
+
+    target = tmp_path / DATA_DIRECTORY
+    target.mkdir()
+    for name in os.listdir(data_directory):
+        if name.endswith(".csv"):
+            shutil.copyfile(data_directory / name, target / name)
+    monkeypatch.chdir(tmp_path)
+    st.cache_resource.clear()
+    yield target
+    st.cache_resource.clear()
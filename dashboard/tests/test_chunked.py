@@ -0,0 +1,63 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test mode out-of-core (chunked.py): hasilnya sama persis dengan analysis.py di memori."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import SECTIONS
+from chunked import aggregate_results, build_aggregates
+from facts import fact_table, prepared_tables
+
+
+def _assert_same(expected, actual, name: str) -> None:
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(actual, expected, rtol=1e-9, obj=name)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(actual, expected, rtol=1e-9, obj=name)
+    elif isinstance(expected, (list, dict)):
+        assert type(actual) is type(expected) and len(actual) == len(expected), name
+        keys = expected.keys() if isinstance(expected, dict) else range(len(expected))
+        for key in keys:
+            _assert_same(expected[key], actual[key], f"{name}[{key}]")
+    elif isinstance(expected, (float, np.floating, np.ndarray)):
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, err_msg=name)
+    else:
+        assert actual == expected, name
+
+
+@pytest.mark.parametrize('partitions', [1, 4])
+def test_chunked_results_match_memory(partitions):
+    expected = {section: analyze() for section, analyze in SECTIONS.items()}
+    results = aggregate_results(build_aggregates(partitions, chunksize=500))
+    assert results.keys() == expected.keys()
+    for section, values in expected.items():
+        assert results[section].keys() == values.keys()
+        for key, value in values.items():
+            _assert_same(value, results[section][key], f"{section} {key}")
+
+
+def test_prepared_tables_do_not_load_fact_table():
+    with prepared_tables({}), pytest.raises(RuntimeError):
+        fact_table()
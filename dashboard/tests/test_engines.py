@@ -0,0 +1,80 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test kesamaan hasil mesin agregasi (engines.py): DuckDB sama dengan pandas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import SECTIONS
+from engines import AGGREGATES, ENGINE_VARIABLE, duckdb_aggregate, pandas_aggregate
+from rollups import date_bounds
+
+pytest.importorskip('duckdb')
+
+DAY = pd.Timedelta(days=1)
+RANGES = ['penuh', 'setahun', 'sempit', 'kosong']
+
+
+def date_range(label: str) -> tuple:
+    """Fungsi untuk menerjemahkan label RANGES menjadi rentang [start, end)."""
+    first, last = (pd.Timestamp(day) for day in date_bounds())
+    return {
+        'penuh': (None, None),
+        'setahun': (last - pd.DateOffset(years=1), last + DAY),
+        'sempit': (first, first + 2 * DAY),
+        'kosong': (first - 2 * DAY, first - DAY),
+    }[label]
+
+
+def _assert_equal(expected, actual, name: str) -> None:
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(actual, expected, rtol=1e-9, obj=name)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(actual, expected, rtol=1e-9, obj=name)
+    elif isinstance(expected, (list, dict)):
+        assert type(actual) is type(expected) and len(actual) == len(expected), name
+        keys = expected.keys() if isinstance(expected, dict) else range(len(expected))
+        for key in keys:
+            _assert_equal(expected[key], actual[key], f"{name}[{key}]")
+    elif isinstance(expected, (str, type(None))):
+        assert actual == expected, name
+    else:
+        np.testing.assert_allclose(actual, expected, rtol=1e-9, err_msg=name)
+
+
+@pytest.mark.parametrize('label', RANGES)
+@pytest.mark.parametrize('name', list(AGGREGATES))
+def test_duckdb_matches_pandas(name, label):
+    start, end = date_range(label)
+    _assert_equal(pandas_aggregate(name, start, end), duckdb_aggregate(name, start, end), name)
+
+
+@pytest.mark.parametrize('label', ['penuh', 'sempit'])
+@pytest.mark.parametrize('section', list(SECTIONS))
+def test_sections_match_across_engines(section, label, monkeypatch):
+    start, end = date_range(label)
+    monkeypatch.setenv(ENGINE_VARIABLE, 'pandas')
+    expected = SECTIONS[section](start, end)
+    monkeypatch.setenv(ENGINE_VARIABLE, 'duckdb')
+    _assert_equal(expected, SECTIONS[section](start, end), section)
@@ -0,0 +1,40 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test penomoran pesanan pelanggan (facts.py)."""
+
+import pandas as pd
+
+from facts import customer_order_numbers, order_sequence
+
+
+def test_order_numbers_do_not_overflow():
+    # Dua item pesanan pertama dan satu pesanan berikutnya dari pelanggan yang
+    # sudah punya lebih dari 32.767 pesanan dari batch sebelumnya.
+    fact = pd.DataFrame({
+        'customer_unique_id': ['a', 'a', 'a'],
+        'order_purchase_timestamp': pd.to_datetime(['2018-01-01', '2018-01-01', '2018-01-02']),
+        'first_item': [True, False, True],
+    })
+    number = customer_order_numbers(fact, pd.Series({'a': 40_000}))
+    assert number.tolist() == [40_001, 40_001, 40_002]
+    assert list(order_sequence(pd.Series(number))) == ['3+', '3+', '3+']
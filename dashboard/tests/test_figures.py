@@ -0,0 +1,50 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test cache gambar: batas ukuran di disk."""
+
+import os
+
+from figures import FigureCache
+
+PNG = b"\x89PNG" + b"\0" * 1020
+
+
+def test_spill_directory_is_capped(tmp_path):
+    cache = FigureCache(max_bytes=len(PNG), spill_directory=str(tmp_path), spill_limit=10 * len(PNG))
+    for i in range(40):
+        cache.put(f"{i:02d}", PNG)
+    files = sorted(os.listdir(tmp_path))
+    assert sum(os.path.getsize(tmp_path / name) for name in files) <= 10 * len(PNG)
+    # Yang terlama dihapus lebih dulu; yang terbaru tetap ada di disk.
+    assert "00.png" not in files and "38.png" in files
+
+
+def test_prune_keeps_recently_used(tmp_path):
+    for i in range(4):
+        (tmp_path / f"{i}.png").write_bytes(PNG)
+        os.utime(tmp_path / f"{i}.png", (i, i))
+    cache = FigureCache(max_bytes=0, spill_directory=str(tmp_path), spill_limit=3 * len(PNG))
+    # Membaca dari disk memperbarui mtime sehingga gambar ini tidak ikut dipangkas.
+    assert cache.get("0") == PNG
+    assert cache.prune() == 2
+    assert sorted(os.listdir(tmp_path)) == ["0.png", "3.png"]
@@ -0,0 +1,144 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test ingesti bertahap (ingest.py): hasilnya sama dengan pembangunan ulang penuh."""
+
+import os
+import shutil
+
+import pandas as pd
+import pytest
+import streamlit as st
+
+import ingest as ingest_module
+from ingest import PENDING_PATH, ingest, rebuild, source_versions
+from loader import DATA_DIRECTORY, TABLES
+from rollups import CUBE_NAMES
+from state import read_state
+
+BATCH_ORDERS = 50
+# Seperti ekstrak harian Olist: pesanan baru beserta pelanggannya (customer_id baru).
+SPLIT_TABLES = ['orders', 'order_items', 'order_payments', 'order_reviews', 'customers']
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    # Dibaca sebagai teks apa adanya agar CSV yang ditulis ulang tidak berubah formatnya.
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+@pytest.fixture
+def split_batch(data_directory, tmp_path, monkeypatch):
+    """Fungsi untuk memisahkan BATCH_ORDERS pesanan terakhir (beserta pelanggannya) dari salinan main-data."""
+    target, batch = tmp_path / DATA_DIRECTORY, tmp_path / "batch"
+    target.mkdir()
+    batch.mkdir()
+    for name in os.listdir(data_directory):
+        if name.endswith(".csv"):
+            shutil.copyfile(data_directory / name, target / name)
+    orders = _read_csv(target / TABLES['orders']['file'])
+    orders = orders.sort_values('order_purchase_timestamp', kind='stable')
+    new_orders = orders.tail(BATCH_ORDERS)
+    keys = {'customers': ('customer_id', set(new_orders['customer_id']))}
+    for name in SPLIT_TABLES:
+        column, values = keys.get(name, ('order_id', set(new_orders['order_id'])))
+        table = _read_csv(target / TABLES[name]['file'])
+        in_batch = table[column].isin(values)
+        table[in_batch].to_csv(batch / TABLES[name]['file'], index=False)
+        table[~in_batch].to_csv(target / TABLES[name]['file'], index=False)
+    monkeypatch.chdir(tmp_path)
+    st.cache_resource.clear()
+    yield batch, set(new_orders['order_id'])
+    st.cache_resource.clear()
+
+
+def _state() -> dict:
+    versions = source_versions()
+    parts = {name: read_state(f"cube_{name}", versions) for name in CUBE_NAMES}
+    parts['fact'] = read_state('fact', versions)
+    return parts
+
+
+def _canonical(frame) -> pd.DataFrame:
+    # Urutan baris kubus hasil gabungan boleh berbeda dari hasil bangun ulang.
+    if isinstance(frame, pd.Series):
+        frame = frame.reset_index()
+    frame = frame.reset_index(drop=isinstance(frame.index, pd.RangeIndex))
+    return frame.sort_values(list(frame.columns), kind='stable', ignore_index=True)
+
+
+def test_incremental_ingest_matches_rebuild(split_batch):
+    batch, new_orders = split_batch
+    rebuild()
+    assert ingest(str(batch)).startswith("bertahap")
+    incremental = _state()
+
+    fact = incremental['fact']
+    new_rows = fact[fact['order_id'].astype(str).isin(new_orders)]
+    assert new_rows['customer_state'].notna().all()
+    assert new_rows['customer_unique_id'].notna().all()
+    assert (new_rows['customer_order_number'] > 0).all()
+
+    st.cache_resource.clear()
+    rebuild()
+    full = _state()
+    columns = ['order_id', 'order_item_id', 'customer_unique_id', 'customer_state', 'customer_order_number']
+    pd.testing.assert_frame_equal(_canonical(incremental['fact'][columns].astype(str)),
+                                  _canonical(full['fact'][columns].astype(str)))
+    for name in CUBE_NAMES:
+        pd.testing.assert_frame_equal(_canonical(incremental[name]), _canonical(full[name]), check_dtype=False,
+                                      check_categorical=False, obj=name)
+
+
+def test_unknown_customer_is_rejected(split_batch):
+    batch, _ = split_batch
+    rebuild()
+    os.remove(batch / TABLES['customers']['file'])
+    with pytest.raises(ValueError, match="customer_id"):
+        ingest(str(batch))
+
+
+def test_interrupted_ingest_is_resumed(split_batch, monkeypatch):
+    batch, new_orders = split_batch
+    rebuild()
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    # Proses berhenti setelah baris batch disambung ke CSV, sebelum hasil olahan diterbitkan.
+    with monkeypatch.context() as patch:
+        patch.setattr(ingest_module, 'write_state', crash)
+        with pytest.raises(KeyboardInterrupt):
+            ingest(str(batch))
+    assert os.path.exists(PENDING_PATH)
+
+    st.cache_resource.clear()
+    assert ingest(str(batch)).startswith("bertahap")
+    assert not os.path.exists(PENDING_PATH)
+    orders = _read_csv(os.path.join(DATA_DIRECTORY, TABLES['orders']['file']))['order_id']
+    assert not orders.duplicated().any()
+    assert new_orders <= set(orders)
+    incremental = _state()
+
+    st.cache_resource.clear()
+    rebuild()
+    full = _state()
+    pd.testing.assert_frame_equal(_canonical(incremental['fact'].astype(str)), _canonical(full['fact'].astype(str)))
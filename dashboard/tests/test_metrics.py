@@ -0,0 +1,63 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test file metrik Prometheus per replika (metrics.py)."""
+
+import socket
+import subprocess
+import sys
+
+from metrics import REPLICA_PLACEHOLDER, Registry, replica_name, write_prometheus
+
+
+def _registry() -> Registry:
+    registry = Registry()
+    registry.add({'section': "Pembayaran", 'kind': 'analysis', 'step': "Pembayaran", 'seconds': 0.5,
+                  'cpu_seconds': 0.25, 'memory_delta_bytes': 0})
+    return registry
+
+
+def test_each_replica_writes_its_own_file(tmp_path):
+    write_prometheus(str(tmp_path / f"metrics-{REPLICA_PLACEHOLDER}.prom"), _registry())
+    path = tmp_path / f"metrics-{replica_name()}.prom"
+    assert [file.name for file in tmp_path.iterdir()] == [path.name]
+    text = path.read_text()
+    assert f'dashboard_step_calls_total{{replica="{replica_name()}",section="Pembayaran"' in text
+    assert f'dashboard_resident_memory_bytes{{replica="{replica_name()}"}}' in text
+
+
+def test_stale_replica_files_are_removed(tmp_path):
+    finished = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    stale = tmp_path / f"metrics-{socket.gethostname()}-{int(finished.stdout)}.prom"
+    other_host = tmp_path / "metrics-replica-lain-1.prom"
+    stale.write_text("")
+    other_host.write_text("")
+    write_prometheus(str(tmp_path / f"metrics-{REPLICA_PLACEHOLDER}.prom"), _registry())
+    assert not stale.exists()
+    assert other_host.exists()
+    assert (tmp_path / f"metrics-{replica_name()}.prom").exists()
+
+
+def test_fixed_path_is_kept(tmp_path):
+    path = tmp_path / "metrics.prom"
+    write_prometheus(str(path), _registry())
+    assert 'dashboard_step_calls_total{section="Pembayaran"' in path.read_text()
@@ -0,0 +1,49 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test laporan batch (report.py)."""
+
+import json
+import os
+
+from analysis import SECTIONS
+from geo import BRAZIL_STATES_FILE
+from loader import data_path
+from report import MANIFEST_FILE, write_report
+
+
+def test_report_draws_every_section(tmp_path):
+    manifest = write_report(str(tmp_path), workers=2)
+    assert set(manifest['sections']) == set(SECTIONS)
+    with open(tmp_path / MANIFEST_FILE) as f:
+        assert json.load(f)['sections'].keys() == manifest['sections'].keys()
+    assert '6c' in manifest['sections']['Geospatial']['figures']
+
+
+def test_report_without_state_map(data_copy, tmp_path):
+    # Salinan main-data tanpa peta negara bagian, mis. file peta terhapus.
+    assert not os.path.exists(data_path(BRAZIL_STATES_FILE))
+    manifest = write_report(str(tmp_path / "report"), workers=2)
+    assert set(manifest['sections']) == set(SECTIONS)
+    # Semua bagian lain tetap lengkap; hanya peta 6c yang tidak digambar.
+    figures = manifest['sections']['Geospatial']['figures']
+    assert '6a' in figures and '6c' not in figures
@@ -0,0 +1,45 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test warm-up replika (warmup.py)."""
+
+import os
+import shutil
+
+import pytest
+
+from geo import BRAZIL_STATES_FILE, geoparquet_path
+from warmup import stale_caches, warm_up
+
+
+def test_warm_up_makes_replica_ready(data_directory, data_copy):
+    shutil.copyfile(data_directory / BRAZIL_STATES_FILE, data_copy / BRAZIL_STATES_FILE)
+    assert "geoparquet" in stale_caches()
+    warm_up(workers=2)
+    assert os.path.exists(geoparquet_path())
+    assert stale_caches() == []
+
+
+def test_missing_state_map_is_not_ready(data_copy):
+    assert "peta negara bagian" in stale_caches(report=False)
+    with pytest.raises(FileNotFoundError):
+        warm_up(report=False)
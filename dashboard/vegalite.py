@@ -0,0 +1,241 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Spesifikasi Vega-Lite untuk backend grafik interaktif (lihat figures.chart).
+
+Setiap fungsi mengembalikan pasangan (data, spec): DataFrame agregat kecil
+yang dikirim ke browser (diserialisasi Streamlit sebagai Arrow) dan
+spesifikasi Vega-Lite tanpa data. Grafik digambar di browser, sehingga server
+tidak merender dan mengirim PNG, dan tooltip serta zoom/geser tersedia.
+Kategori ditampilkan sesuai urutan baris data, jadi urutan hasil analysis.py
+(mis. terbesar lebih dulu) tetap terjaga.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Tinggi per kategori untuk batang horizontal, dalam piksel.
+BAR_STEP = 16
+
+
+def series_frame(series: pd.Series, index: str, value: str) -> pd.DataFrame:
+    """Fungsi untuk mengubah Series hasil analisis menjadi DataFrame dua kolom (indeks, nilai)."""
+    return series.rename_axis(index).reset_index(name=value)
+
+
+def _frame(frame: pd.DataFrame) -> pd.DataFrame:
+    # Period, category, dan object dijadikan string agar aman diserialisasi
+    # Arrow dan dibaca Vega-Lite sebagai label biasa.
+    columns = {col: frame[col].astype(str) for col in frame.columns
+               if isinstance(frame[col].dtype, (pd.PeriodDtype, pd.CategoricalDtype)) or frame[col].dtype == object}
+    return frame.assign(**columns).reset_index(drop=True)
+
+
+def _field(name: str, kind: str, title: str = None, **options) -> dict:
+    field = {'field': name, 'type': kind}
+    if title is not None:
+        field['title'] = title
+    field.update(options)
+    return field
+
+
+def _spec(title: str, mark: dict, encoding: dict, **options) -> dict:
+    spec = {'title': title, 'mark': dict(mark, tooltip=True), 'encoding': encoding}
+    spec.update(options)
+    return spec
+
+
+# Zoom dan geser dengan roda tetikus/seret pada sumbu kontinu.
+ZOOM = [{'name': 'zoom', 'select': 'interval', 'bind': 'scales'}]
+
+
+def _type(series: pd.Series) -> str:
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'temporal'
+    return 'quantitative' if pd.api.types.is_numeric_dtype(series) else 'nominal'
+
+
+def bar(frame: pd.DataFrame, x: str, y: str, title: str, x_title: str, y_title: str, horizontal: bool = False,
+        color: str = None, color_title: str = None, color_scheme: str = None, tooltip: list = None) -> tuple:
+    """Fungsi untuk membuat diagram batang; `horizontal` berarti kategori di sumbu y (kolom `y`).
+
+    `color` mewarnai batang menurut kolom lain (kategori atau nilai), `tooltip`
+    menambah kolom yang ditampilkan saat kursor berada di atas batang, berupa
+    nama kolom atau pasangan (kolom, format d3) mis. ('share', '.1%').
+    """
+    category, value = ('y', 'x') if horizontal else ('x', 'y')
+    encoding = {
+        category: _field(y if horizontal else x, 'nominal', y_title if horizontal else x_title, sort=None),
+        value: _field(x if horizontal else y, 'quantitative', x_title if horizontal else y_title),
+    }
+    if color is not None:
+        encoding['color'] = _field(color, _type(frame[color]), color_title,
+                                   **({'scale': {'scheme': color_scheme}} if color_scheme else {}))
+    if tooltip is not None:
+        tooltip = [(col, None) if isinstance(col, str) else col for col in tooltip]
+        encoding['tooltip'] = [_field(col, _type(frame[col]), **({'format': fmt} if fmt else {})) for col, fmt in tooltip]
+    options = {'height': {'step': BAR_STEP}} if horizontal else {}
+    return _frame(frame), _spec(title, {'type': 'bar'}, encoding, **options)
+
+
+def line(frame: pd.DataFrame, x: str, y: str, title: str, x_title: str, y_title: str, x_type: str = 'ordinal',
+         color: str = None, color_title: str = None, points: bool = False) -> tuple:
+    """Fungsi untuk membuat diagram garis; sumbu x kontinu (`temporal`/`quantitative`) bisa di-zoom."""
+    encoding = {
+        'x': _field(x, x_type, x_title, **({'sort': None} if x_type == 'ordinal' else {})),
+        'y': _field(y, 'quantitative', y_title),
+    }
+    if color is not None:
+        encoding['color'] = _field(color, 'nominal', color_title)
+    options = {'params': ZOOM} if x_type != 'ordinal' else {}
+    return _frame(frame), _spec(title, {'type': 'line', 'point': points}, encoding, **options)
+
+
+def histogram(frame: pd.DataFrame, x: str, weight: str, title: str, x_title: str, y_title: str,
+              maxbins: int = 30) -> tuple:
+    """Fungsi untuk membuat histogram dari nilai yang sudah dicacah (kolom `weight` = frekuensi)."""
+    encoding = {
+        'x': _field(x, 'quantitative', x_title, bin={'maxbins': maxbins}),
+        'y': {'aggregate': 'sum', 'field': weight, 'type': 'quantitative', 'title': y_title},
+    }
+    return _frame(frame), _spec(title, {'type': 'bar'}, encoding)
+
+
+def pie(frame: pd.DataFrame, theta: str, color: str, title: str, label_format: str = '.1f') -> tuple:
+    """Fungsi untuk membuat diagram lingkaran berlabel nilai `theta`."""
+    encoding = {'theta': _field(theta, 'quantitative', stack=True), 'color': _field(color, 'nominal', sort=None)}
+    spec = {
+        'title': title,
+        'encoding': encoding,
+        'layer': [
+            {'mark': {'type': 'arc', 'outerRadius': 110, 'stroke': 'black', 'tooltip': True}},
+            {'mark': {'type': 'text', 'radius': 130}, 'encoding': {'text': _field(theta, 'quantitative', format=label_format)}},
+        ],
+    }
+    return _frame(frame), spec
+
+
+def boxplot(stats: list, title: str, x_title: str, y_title: str) -> tuple:
+    """Fungsi untuk membuat boxplot dari statistik yang sudah dihitung (lihat stats.box_stats)."""
+    boxes = pd.DataFrame([{key: stat[key] for key in ['label', 'q1', 'med', 'q3', 'whislo', 'whishi']} for stat in stats])
+    fliers = [{'label': stat['label'], 'value': float(value)} for stat in stats for value in stat['fliers']]
+    x = _field('label', 'nominal', x_title, sort=None)
+    spec = {
+        'title': title,
+        'encoding': {'x': x},
+        'layer': [
+            {'mark': {'type': 'rule'}, 'encoding': {'y': _field('whislo', 'quantitative', y_title), 'y2': {'field': 'whishi'}}},
+            {'mark': {'type': 'bar', 'size': 40, 'tooltip': True},
+             'encoding': {'y': _field('q1', 'quantitative'), 'y2': {'field': 'q3'}}},
+            {'mark': {'type': 'tick', 'size': 40, 'color': 'black', 'thickness': 2}, 'encoding': {'y': _field('med', 'quantitative')}},
+            {'data': {'values': fliers}, 'mark': {'type': 'point', 'shape': 'diamond', 'color': 'gray', 'tooltip': True},
+             'encoding': {'x': x, 'y': _field('value', 'quantitative')}},
+        ],
+    }
+    return _frame(boxes), spec
+
+
+def heatmap(matrix: pd.DataFrame, title: str, x_title: str, y_title: str, value_title: str = None,
+            value_format: str = '.1%', color_max: float = None) -> tuple:
+    """Fungsi untuk membuat heatmap beranotasi dari matriks (baris = sumbu y, kolom = sumbu x); sel NaN dilewati."""
+    x, y = matrix.columns.name or 'column', matrix.index.name or 'row'
+    cells = matrix.rename_axis(index=y, columns=x).stack().rename('value').reset_index()
+    # NaN (mis. hanya ada bulan ke-0) tidak lolos perbandingan, jadi skala mengikuti data.
+    scale = {'scheme': 'blues'}
+    if color_max is not None and color_max > 0:
+        scale.update(domain=[0, color_max], clamp=True)
+    color = _field('value', 'quantitative', value_title, legend={'format': value_format}, scale=scale)
+    spec = {
+        'title': title,
+        'encoding': {'x': _field(x, 'ordinal', x_title), 'y': _field(y, 'ordinal', y_title, sort=None)},
+        'height': {'step': 22},
+        'layer': [
+            {'mark': {'type': 'rect', 'tooltip': True}, 'encoding': {'color': color}},
+            {'mark': {'type': 'text', 'fontSize': 8},
+             'encoding': {'text': _field('value', 'quantitative', format=value_format)}},
+        ],
+    }
+    return _frame(cells), spec
+
+
+def stacked_bar(matrix: pd.DataFrame, title: str, x_title: str, y_title: str, color_title: str) -> tuple:
+    """Fungsi untuk membuat batang bertumpuk dari matriks (baris = sumbu x, kolom = tumpukan)."""
+    x, color = matrix.index.name or 'row', matrix.columns.name or 'column'
+    values = matrix.rename_axis(index=x, columns=color).stack().rename('value').reset_index()
+    encoding = {
+        'x': _field(x, 'ordinal', x_title, sort=None),
+        'y': _field('value', 'quantitative', y_title),
+        'color': _field(color, 'nominal', color_title, sort=None),
+        'order': {'field': '_order'},
+    }
+    values['_order'] = np.tile(np.arange(len(matrix.columns)), len(matrix))
+    return _frame(values), _spec(title, {'type': 'bar'}, encoding)
+
+
+def choropleth(features: list, frame: pd.DataFrame, key: str, value: str, title: str, value_title: str) -> tuple:
+    """Fungsi untuk membuat peta choropleth dari fitur GeoJSON dan nilai per wilayah (`frame[key]` = properti `sigla`).
+
+    Data utama adalah nilai per wilayah; geometri digabung lewat transform
+    lookup karena Streamlit mengubah data tingkat atas menjadi tabel Arrow.
+    Seperti peta matplotlib, wilayah tanpa nilai tidak digambar.
+    """
+    spec = {
+        'title': title,
+        'transform': [{'lookup': key, 'from': {'data': {'values': features}, 'key': 'properties.sigla'}, 'as': 'geo'}],
+        'projection': {'type': 'mercator'},
+        'mark': {'type': 'geoshape', 'stroke': 'black', 'strokeWidth': 0.5, 'tooltip': True},
+        'encoding': {
+            'shape': {'field': 'geo', 'type': 'geojson'},
+            'color': _field(value, 'quantitative', value_title, scale={'scheme': 'blues'}),
+            'tooltip': [_field(key, 'nominal', "Negara Bagian"), _field(value, 'quantitative', value_title)],
+        },
+        'height': 500,
+    }
+    return _frame(frame[[key, value]]), spec
+
+
+# Heksagon pointy-top sebagai path SVG berukuran satuan untuk mark point.
+HEXAGON = "M0,-1L0.866,-0.5L0.866,0.5L0,1L-0.866,0.5L-0.866,-0.5Z"
+
+
+def hexbin(frame: pd.DataFrame, value: str, title: str, value_title: str, size: int = 40) -> tuple:
+    """Fungsi untuk membuat peta kepadatan dari sel heksagon (kolom `lat`, `lng`, dan `value`); sel kosong dilewati.
+
+    Warna memakai skala log karena kepadatan terkonsentrasi di beberapa kota.
+    """
+    spec = {
+        'title': title,
+        'projection': {'type': 'mercator'},
+        'mark': {'type': 'point', 'shape': HEXAGON, 'filled': True, 'opacity': 0.9, 'size': size, 'tooltip': True},
+        'encoding': {
+            'longitude': _field('lng', 'quantitative'),
+            'latitude': _field('lat', 'quantitative'),
+            'color': _field(value, 'quantitative', value_title, scale={'type': 'log', 'scheme': 'viridis'}),
+            'tooltip': [_field('lat', 'quantitative', "Latitude", format='.2f'),
+                        _field('lng', 'quantitative', "Longitude", format='.2f'),
+                        _field(value, 'quantitative', value_title)],
+        },
+        'height': 500,
+    }
+    cells = frame.loc[frame[value] > 0, ['lat', 'lng', value]]
+    # Presisi float32 (~1 m) lebih dari cukup untuk pusat sel dan memperkecil data yang dikirim.
+    return _frame(cells.astype({'lat': 'float32', 'lng': 'float32'})), spec
@@ -0,0 +1,610 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tampilan tiap bagian dashboard: teks, subjudul, dan grafik dari hasil analysis.py.
+
+Modul ini tidak menjalankan apa pun saat diimpor sehingga bisa dipakai oleh
+dashboard.py maupun report.py (tanpa server Streamlit).
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import vegalite
+from figures import DeferredModule, chart
+from geo import MISSING_MAP_MESSAGE, brazil_states, brazil_states_version, state_features
+from geolocation import HEX_REFERENCE_LAT, HEX_SIZE_KM, hex_corners
+from metrics import rss_bytes
+from vegalite import series_frame
+
+# Pustaka grafik hanya dimuat saat sebuah fungsi gambar benar-benar dipanggil
+# (gambar belum ada di cache dan backend PNG).
+sns = DeferredModule('seaborn')
+plt = DeferredModule('matplotlib.pyplot')
+mdates = DeferredModule('matplotlib.dates')
+
+
+def footer() -> None:
+    """Fungsi untuk menampilkan copyright di akhir setiap bagian."""
+    st.markdown(
+        """
+        <div style="
+            margin-top: 10px;  
+            text-align: center; 
+            font-size: 15px; 
+            color: white;">
+            Copyright © 2025 Ika Nurfitriani
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+
+def debug_panel(steps: list) -> None:
+    """Fungsi untuk menampilkan waktu, waktu CPU, dan selisih memori setiap langkah run ini (lihat metrics.py) di sidebar."""
+    with st.sidebar.expander("🛠️ Debug: waktu per langkah", expanded=True):
+        if not steps:
+            st.caption("Tidak ada langkah yang dijalankan; semua hasil diambil dari cache.")
+            return
+        table = pd.DataFrame({
+            # Langkah bersarang diberi indentasi; waktunya sudah termasuk di langkah induk.
+            'Langkah': ["\u2003" * step['depth'] + step['step'] for step in steps],
+            'Jenis': [step['kind'] for step in steps],
+            'Detik': [step['seconds'] for step in steps],
+            'CPU (detik)': [step['cpu_seconds'] for step in steps],
+            'Δ RSS (MB)': [step['memory_delta_bytes'] / 2 ** 20 for step in steps],
+        })
+        st.dataframe(table.style.format(precision=3), hide_index=True, use_container_width=True)
+        total = sum(step['seconds'] for step in steps if step['depth'] == 0)
+        st.caption(f"Total {total:.2f} detik · RSS proses {rss_bytes() / 2 ** 20:.0f} MB")
+
+
+def boxplot(ax, stats: list) -> None:
+    """Fungsi untuk menggambar boxplot dari statistik yang sudah dihitung (lihat stats.box_stats)."""
+    if not stats:
+        # ax.bxp gagal untuk daftar kosong; sumbu dibiarkan kosong seperti sns.boxplot.
+        return
+    ax.bxp(stats, positions=range(len(stats)), widths=0.8, patch_artist=True,
+           boxprops={'facecolor': sns.color_palette()[0]}, medianprops={'color': 'black'},
+           flierprops={'marker': 'd', 'markersize': 4, 'markerfacecolor': 'gray'})
+
+
+def render_orders_delivery(r: dict) -> None:
+    """Fungsi untuk menampilkan bagian Pesanan & Pengiriman."""
+    st.write("Analisis Pesanan & Pengiriman")
+
+    # Pertanyaan 1a:
+    st.subheader("a. Rata-rata waktu pengiriman dari pemesanan hingga barang diterima")
+
+    def draw_1a(ax, delivery_counts):
+        # KDE butuh minimal dua nilai berbeda; rentang sempit bisa hanya punya satu.
+        sns.histplot(x=delivery_counts.index, weights=delivery_counts.values, bins=30,
+                     kde=len(delivery_counts) > 1, ax=ax)
+        ax.set_xlabel("Waktu Pengiriman (hari)")
+        ax.set_ylabel("Frekuensi")
+        ax.set_title("Distribusi Waktu Pengiriman")
+    chart(draw_1a, r['1a'], figsize=(8, 5), spec=lambda counts: vegalite.histogram(
+        series_frame(counts, 'delivery_time', 'count'), 'delivery_time', 'count',
+        "Distribusi Waktu Pengiriman", "Waktu Pengiriman (hari)", "Frekuensi"))
+
+    # Pertanyaan 1b:
+    st.subheader("b. Distribusi keterlambatan pengiriman berdasarkan kategori produk")
+    df_delay = r['1b']
+
+    def draw_1b(ax, df_delay):
+        sns.barplot(y='product_category_name', x='delay_time', data=df_delay.sort_values(by='delay_time', ascending=False), ax=ax)
+        ax.set_xlabel("Rata-rata keterlambatan (hari)")
+        ax.set_ylabel("Kategori Produk")
+        ax.set_title("Keterlambatan Pengiriman Berdasarkan Kategori Produk")
+    chart(draw_1b, df_delay, figsize=(12, len(df_delay) * 0.4), spec=lambda df_delay: vegalite.bar(
+        df_delay.sort_values(by='delay_time', ascending=False), 'delay_time', 'product_category_name',
+        "Keterlambatan Pengiriman Berdasarkan Kategori Produk", "Rata-rata keterlambatan (hari)", "Kategori Produk",
+        horizontal=True))
+
+    # Pertanyaan 1c:
+    st.subheader("c. Pola keterlambatan pengiriman pada hari atau bulan tertentu")
+
+    def draw_1c_month(ax, df_monthly_delay):
+        sns.lineplot(x=df_monthly_delay.index, y=df_monthly_delay.values, marker='o', errorbar=None, ax=ax)
+        ax.set_xlabel("Bulan")
+        ax.set_ylabel("Rata-rata Keterlambatan (hari)")
+        ax.set_title("Pola Keterlambatan Pengiriman per Bulan")
+    chart(draw_1c_month, r['1c_month'], figsize=(12, 6), spec=lambda df_monthly_delay: vegalite.line(
+        series_frame(df_monthly_delay, 'month', 'delay'), 'month', 'delay', "Pola Keterlambatan Pengiriman per Bulan",
+        "Bulan", "Rata-rata Keterlambatan (hari)", points=True))
+
+    def draw_1c_day(ax, df_daily_delay):
+        sns.lineplot(x=df_daily_delay.index, y=df_daily_delay.values, marker='o', errorbar=None, ax=ax)
+        ax.set_xlabel("Hari dalam Seminggu (0 = Senin, 6 = Minggu)")
+        ax.set_ylabel("Rata-rata Keterlambatan (hari)")
+        ax.set_title("Pola Keterlambatan Pengiriman per Hari")
+    chart(draw_1c_day, r['1c_day'], figsize=(12, 6), spec=lambda df_daily_delay: vegalite.line(
+        series_frame(df_daily_delay, 'day', 'delay'), 'day', 'delay', "Pola Keterlambatan Pengiriman per Hari",
+        "Hari dalam Seminggu (0 = Senin, 6 = Minggu)", "Rata-rata Keterlambatan (hari)", points=True))
+
+    # Pertanyaan 1d:
+    st.subheader("d. Kota atau negara bagian yang memiliki waktu pengiriman tercepat dan paling lambat")
+
+    def draw_1d(ax, df_state):
+        sns.barplot(x='delivery_time', y='customer_state', data=df_state.sort_values(by='delivery_time', ascending=False), ax=ax)
+        ax.set_xlabel("Rata-rata Waktu Pengiriman (hari)")
+        ax.set_ylabel("Negara Bagian")
+        ax.set_title("Waktu Pengiriman Berdasarkan Negara Bagian")
+    chart(draw_1d, r['1d'], figsize=(12, 6), spec=lambda df_state: vegalite.bar(
+        df_state.sort_values(by='delivery_time', ascending=False), 'delivery_time', 'customer_state',
+        "Waktu Pengiriman Berdasarkan Negara Bagian", "Rata-rata Waktu Pengiriman (hari)", "Negara Bagian",
+        horizontal=True))
+
+    # Pertanyaan 1e:
+    st.subheader("e. Hubungan antara metode pengiriman dengan tingkat kepuasan pelanggan")
+
+    def draw_1e(ax, delay_stats):
+        boxplot(ax, delay_stats)
+        ax.set_xlabel("Skor Review")
+        ax.set_ylabel("Keterlambatan Pengiriman (hari)")
+        ax.set_title("Hubungan Keterlambatan dengan Kepuasan Pelanggan")
+    if not r['1e']:
+        st.info("Tidak ada pesanan terkirim dengan ulasan pada rentang tanggal yang dipilih.")
+    else:
+        chart(draw_1e, r['1e'], figsize=(12, 6), spec=lambda delay_stats: vegalite.boxplot(
+            delay_stats, "Hubungan Keterlambatan dengan Kepuasan Pelanggan", "Skor Review",
+            "Keterlambatan Pengiriman (hari)"))
+    footer()
+
+
+def render_payments(r: dict) -> None:
+    """Fungsi untuk menampilkan bagian Pembayaran."""
+    st.write("Analisis Pembayaran")
+
+    # Pertanyaan 2a:
+    st.subheader("a. Rata-rata nilai pembayaran per transaksi")
+
+    def draw_2a(ax, avg_payment_per_transaction):
+        ax.bar(['Rata-rata'], [avg_payment_per_transaction], color='skyblue')
+        ax.set_title('Rata-rata Nilai Pembayaran per Transaksi')
+        ax.set_ylabel('Rata-rata Pembayaran')
+    chart(draw_2a, r['2a'], figsize=(6, 4), spec=lambda avg_payment_per_transaction: vegalite.bar(
+        pd.DataFrame({'label': ['Rata-rata'], 'payment': [avg_payment_per_transaction]}), 'label', 'payment',
+        "Rata-rata Nilai Pembayaran per Transaksi", "", "Rata-rata Pembayaran"))
+
+    # Pertanyaan 2b:
+    st.subheader("b. Pola pembayaran yang berbeda berdasarkan kategori produk")
+
+    def draw_2b(ax, category_payment):
+        ax.bar(category_payment.index, category_payment.values, color='skyblue')
+        ax.set_xticks(range(len(category_payment.index)))
+        ax.set_xticklabels(category_payment.index, rotation=90)
+        ax.set_title('Rata-rata Pembayaran berdasarkan Kategori Produk')
+        ax.set_xlabel('Kategori Produk')
+        ax.set_ylabel('Rata-rata Pembayaran')
+    chart(draw_2b, r['2b'], figsize=(10, 6), spec=lambda category_payment: vegalite.bar(
+        series_frame(category_payment, 'category', 'payment'), 'category', 'payment',
+        "Rata-rata Pembayaran berdasarkan Kategori Produk", "Kategori Produk", "Rata-rata Pembayaran"))
+
+    # Pertanyaan 2c:
+    st.subheader("c. Persentase pesanan yang menggunakan cicilan dibandingkan dengan pembayaran penuh")
+
+    def draw_2c(ax, cicilan_percentage):
+        ax.pie([cicilan_percentage, 100 - cicilan_percentage],
+               labels=['Cicilan', 'Lunas'],
+               autopct='%1.1f%%',
+               colors=['lightblue', 'lightgray'],
+               startangle=0,
+               wedgeprops={'edgecolor': 'black'})
+        ax.set_title('Persentase Pesanan dengan Cicilan')
+    chart(draw_2c, r['2c'], figsize=(6, 4), spec=lambda cicilan_percentage: vegalite.pie(
+        pd.DataFrame({'Jenis': ['Cicilan', 'Lunas'], 'Persentase': [cicilan_percentage, 100 - cicilan_percentage]}),
+        'Persentase', 'Jenis', "Persentase Pesanan dengan Cicilan"))
+
+    # Pertanyaan 2d:
+    st.subheader("d. Tren penggunaan metode pembayaran dari waktu ke waktu")
+
+    def draw_2d(ax, payments_orders):
+        # Data sudah berupa total per bulan dan metode, jadi seaborn tidak perlu
+        # mengagregasi ulang maupun bootstrap interval kepercayaan.
+        sns.lineplot(data=payments_orders, x='year_month', y='payment_value', hue='payment_type', estimator=None, errorbar=None, ax=ax)
+        plt.xticks(rotation=45)
+        ax.set_title('Tren Penggunaan Metode Pembayaran dari Waktu ke Waktu')
+        ax.set_xlabel('Waktu (Tahun-Bulan)')
+        ax.set_ylabel('Total Pembayaran')
+        ax.legend(title='Metode Pembayaran')
+    chart(draw_2d, r['2d'], figsize=(12, 6), spec=lambda payments_orders: vegalite.line(
+        payments_orders, 'year_month', 'payment_value', "Tren Penggunaan Metode Pembayaran dari Waktu ke Waktu",
+        "Waktu (Tahun-Bulan)", "Total Pembayaran", color='payment_type', color_title="Metode Pembayaran"))
+
+    # Pertanyaan 2e:
+    st.subheader("e. Hubungan antara metode pembayaran dengan rating ulasan pelanggan")
+
+    def draw_2e(ax, rating_stats):
+        boxplot(ax, rating_stats)
+        ax.set_title('Hubungan Metode Pembayaran dengan Rating Ulasan')
+        ax.set_xlabel('Metode Pembayaran')
+        ax.set_ylabel('Rating Ulasan')
+    if not r['2e']:
+        st.info("Tidak ada pembayaran dengan ulasan pada rentang tanggal yang dipilih.")
+    else:
+        chart(draw_2e, r['2e'], figsize=(8, 5), spec=lambda rating_stats: vegalite.boxplot(
+            rating_stats, "Hubungan Metode Pembayaran dengan Rating Ulasan", "Metode Pembayaran", "Rating Ulasan"))
+    footer()
+
+
+def render_sales_products(r: dict) -> None:
+    """Fungsi untuk menampilkan bagian Penjualan & Produk."""
+    st.write("Analisis Penjualan & Produk")
+
+    # Pertanyaan 3a:
+    st.subheader("a. Distribusi jumlah unit produk yang terjual dalam setiap kategori")
+
+    def draw_3a(ax, category_sales):
+        sns.barplot(x=category_sales.index, y=category_sales.values, hue=category_sales.index, palette="Blues_r", ax=ax, legend=False)
+        plt.xticks(rotation=90)
+        ax.set_title("Distribusi Jumlah Unit Produk Terjual per Kategori")
+        ax.set_xlabel("Kategori Produk")
+        ax.set_ylabel("Jumlah Terjual")
+    chart(draw_3a, r['3a'], figsize=(12, 6), spec=lambda category_sales: vegalite.bar(
+        series_frame(category_sales, 'category', 'sold'), 'category', 'sold',
+        "Distribusi Jumlah Unit Produk Terjual per Kategori", "Kategori Produk", "Jumlah Terjual"))
+
+    # Pertanyaan 3b:
+    st.subheader("b. Tren jumlah produk yang terjual setiap bulan")
+
+    def draw_3b_total(ax, monthly_orders):
+        ax.plot(monthly_orders.index, monthly_orders.values, linestyle='-')
+        ax.set_title("Tren Bulanan Jumlah Produk Terjual", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Waktu", fontsize=12)
+        ax.set_ylabel("Jumlah Produk Terjual", fontsize=12)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+        plt.xticks(rotation=45)
+    chart(draw_3b_total, r['3b_total'], figsize=(12, 6), spec=lambda monthly_orders: vegalite.line(
+        series_frame(monthly_orders, 'month', 'items'), 'month', 'items', "Tren Bulanan Jumlah Produk Terjual",
+        "Waktu", "Jumlah Produk Terjual", x_type='temporal'))
+
+    def draw_3b_top(ax, category_trend, top_category):
+        ax.plot(category_trend.index, category_trend.values, linestyle='-')
+        ax.set_title(f"Tren Bulanan Kategori Produk Terlaris: {top_category}", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Waktu", fontsize=12)
+        ax.set_ylabel("Jumlah Produk Terjual", fontsize=12)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+        plt.xticks(rotation=45)
+    if r['3b_top_category'] is None:
+        st.info("Tidak ada produk berkategori pada rentang tanggal yang dipilih.")
+    else:
+        chart(draw_3b_top, r['3b_top'], r['3b_top_category'], figsize=(12, 6), spec=lambda category_trend, top_category: vegalite.line(
+            series_frame(category_trend, 'month', 'items'), 'month', 'items',
+            f"Tren Bulanan Kategori Produk Terlaris: {top_category}", "Waktu", "Jumlah Produk Terjual", x_type='temporal'))
+
+    # Pertanyaan 3c:
+    st.subheader("c. Produk yang memiliki jumlah retur tertinggi")
+
+    def draw_3c(ax, returns_count):
+        sns.barplot(x=returns_count.index, y=returns_count.values, hue=returns_count.index, palette="Blues_r", legend=False, ax=ax)
+        ax.set_xticks(range(len(returns_count)))
+        ax.set_xticklabels(returns_count.index, rotation=90)
+        ax.set_title("Jumlah Retur Tertinggi per Kategori Produk", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Kategori Produk", fontsize=12)
+        ax.set_ylabel("Jumlah Retur", fontsize=12)
+    chart(draw_3c, r['3c'], figsize=(12, 6), spec=lambda returns_count: vegalite.bar(
+        series_frame(returns_count, 'category', 'returns'), 'category', 'returns',
+        "Jumlah Retur Tertinggi per Kategori Produk", "Kategori Produk", "Jumlah Retur"))
+
+    # Pertanyaan 3d:
+    st.subheader("d. Kontribusi setiap kategori produk terhadap total pendapatan")
+
+    def draw_3d(ax, category_revenue):
+        sns.barplot(x=category_revenue.index, y=category_revenue.values, hue=category_revenue.index, palette="Blues_r", legend=False, ax=ax)
+        ax.set_xticks(range(len(category_revenue)))
+        ax.set_xticklabels(category_revenue.index, rotation=90)
+        ax.set_title("Kontribusi Setiap Kategori terhadap Total Pendapatan", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Kategori Produk", fontsize=12)
+        ax.set_ylabel("Pendapatan (BRL)", fontsize=12)
+    chart(draw_3d, r['3d'], figsize=(12, 6), spec=lambda category_revenue: vegalite.bar(
+        series_frame(category_revenue, 'category', 'revenue'), 'category', 'revenue',
+        "Kontribusi Setiap Kategori terhadap Total Pendapatan", "Kategori Produk", "Pendapatan (BRL)"))
+
+    # Pertanyaan 3e:
+    st.subheader("e. Pola penjualan produk berdasarkan hari dalam seminggu atau bulan dalam setahun")
+
+    def draw_3e_day(ax, day_sales):
+        sns.barplot(x=day_sales.index, y=day_sales.values, hue=day_sales.index, palette='dark:blue', legend=False, ax=ax)
+        ax.set_title("Pola Penjualan berdasarkan Hari dalam Seminggu", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Hari", fontsize=12)
+        ax.set_ylabel("Jumlah Pesanan", fontsize=12)
+    chart(draw_3e_day, r['3e_day'], figsize=(12, 6), spec=lambda day_sales: vegalite.bar(
+        series_frame(day_sales, 'day', 'orders'), 'day', 'orders', "Pola Penjualan berdasarkan Hari dalam Seminggu",
+        "Hari", "Jumlah Pesanan"))
+
+    def draw_3e_month(ax, month_sales):
+        sns.barplot(x=month_sales.index, y=month_sales.values, hue=month_sales.index, palette='dark:blue', legend=False, ax=ax)
+        ax.set_xticks(range(len(month_sales.index)))
+        ax.set_xticklabels(month_sales.index, rotation=90)
+        ax.set_title("Pola Penjualan berdasarkan Bulan dalam Setahun", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Bulan", fontsize=12)
+        ax.set_ylabel("Jumlah Pesanan", fontsize=12)
+    chart(draw_3e_month, r['3e_month'], figsize=(12, 6), spec=lambda month_sales: vegalite.bar(
+        series_frame(month_sales, 'month', 'orders'), 'month', 'orders', "Pola Penjualan berdasarkan Bulan dalam Setahun",
+        "Bulan", "Jumlah Pesanan"))
+    footer()
+
+
+def render_customers(r: dict) -> None:
+    """Fungsi untuk menampilkan bagian Pelanggan."""
+    st.write("Analisis Pelanggan")
+
+    # Pertanyaan 4a:
+    st.subheader("a. Distribusi tahun transaksi pelanggan")
+
+    def draw_4a(ax, year_counts):
+        # KDE butuh lebih dari satu titik; rentang tanggal sempit bisa hanya berisi satu tahun.
+        sns.histplot(x=year_counts.index, weights=year_counts.values, bins=10, kde=len(year_counts) > 1, ax=ax, color="skyblue")
+        ax.set_title("Distribusi Tahun Transaksi Pelanggan", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Tahun", fontsize=12)
+        ax.set_ylabel("Jumlah Pelanggan", fontsize=12)
+    chart(draw_4a, r['4a'], figsize=(8, 5), spec=lambda year_counts: vegalite.bar(
+        series_frame(year_counts, 'year', 'customers'), 'year', 'customers', "Distribusi Tahun Transaksi Pelanggan",
+        "Tahun", "Jumlah Pelanggan"))
+
+    # Pertanyaan 4b:
+    st.subheader("b. Kota atau negara bagian yang memiliki pelanggan paling aktif")
+
+    def draw_4b(ax, active_customers):
+        sns.barplot(data=active_customers, x='State', y='Total Customers', hue='State', palette='Blues_r', legend=False, ax=ax)
+        ax.set_title("Negara Bagian dengan Pelanggan Paling Aktif", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Negara Bagian", fontsize=12)
+        ax.set_ylabel("Jumlah Pelanggan", fontsize=12)
+        plt.xticks(rotation=45)
+    chart(draw_4b, r['4b'], figsize=(10, 5), spec=lambda active_customers: vegalite.bar(
+        active_customers, 'State', 'Total Customers', "Negara Bagian dengan Pelanggan Paling Aktif", "Negara Bagian",
+        "Jumlah Pelanggan"))
+
+    # Pertanyaan 4c:
+    st.subheader("c. Perbedaan preferensi produk antara pelanggan baru dan pelanggan lama")
+
+    def draw_4c(ax, product_counts, palette, title):
+        sns.barplot(x=product_counts['product_category_name'],
+                    y=product_counts['count'],
+                    hue=product_counts['product_category_name'],
+                    palette=palette,
+                    legend=False,
+                    ax=ax)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xlabel("Nama Produk", fontsize=12)
+        ax.set_ylabel("Jumlah Pembelian", fontsize=12)
+        ax.set_xticks(range(len(product_counts)))
+        ax.set_xticklabels(product_counts['product_category_name'], rotation=45, ha='right')
+
+    # Beberapa produk teratas bisa berkategori sama, jadi batang interaktif
+    # dibuat per produk dan diwarnai menurut kategorinya.
+    def spec_4c(product_counts, palette, title):
+        return vegalite.bar(product_counts, 'product_id', 'count', title, "Produk", "Jumlah Pembelian",
+                            color='product_category_name', color_title="Kategori Produk")
+    chart(draw_4c, r['4c_new'], 'Greens_r', "Produk yang Lebih Sering Dibeli oleh Pelanggan Baru", figsize=(10, 5),
+          spec=spec_4c)
+    chart(draw_4c, r['4c_old'], 'Reds_r', "Produk yang Lebih Sering Dibeli oleh Pelanggan Lama", figsize=(10, 5),
+          spec=spec_4c)
+
+    # Pertanyaan 4d:
+    st.subheader("d. Tren retensi pelanggan dari waktu ke waktu")
+
+    def draw_4d(ax, retention):
+        # Bulan ke-0 selalu 100%, jadi skala warna mengikuti bulan-bulan sesudahnya.
+        later = retention.iloc[:, 1:].max().max()
+        sns.heatmap(retention, annot=True, fmt='.1%', annot_kws={'fontsize': 7}, cmap='Blues', vmin=0,
+                    vmax=later if later > 0 else None, cbar_kws={'format': '{x:.0%}'}, ax=ax)
+        ax.set_title("Retensi Pelanggan per Kohort Bulan Pembelian Pertama", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Bulan sejak Pembelian Pertama", fontsize=12)
+        ax.set_ylabel("Kohort (Bulan Pembelian Pertama)", fontsize=12)
+
+    retention = r['4d']
+    if retention.empty:
+        st.info("Tidak ada kohort pada rentang tanggal yang dipilih.")
+    else:
+        chart(draw_4d, retention, figsize=(14, max(4, len(retention) * 0.4)), spec=lambda retention: vegalite.heatmap(
+            retention, "Retensi Pelanggan per Kohort Bulan Pembelian Pertama", "Bulan sejak Pembelian Pertama",
+            "Kohort (Bulan Pembelian Pertama)", "Retensi", color_max=retention.iloc[:, 1:].max().max()))
+
+    # Pertanyaan 4e:
+    st.subheader("e. Pembelian ulang: pesanan pertama, kedua, dan ketiga ke atas per pelanggan")
+
+    def draw_4e(ax, sequence_trend):
+        sequence_trend.plot(kind='bar', stacked=True, color=sns.color_palette('Blues_r', 3), width=0.9, ax=ax)
+        ax.set_title("Jumlah Pesanan per Bulan berdasarkan Urutan Pesanan Pelanggan", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Bulan", fontsize=12)
+        ax.set_ylabel("Jumlah Pesanan", fontsize=12)
+        ax.legend(title="Pesanan ke-")
+        plt.xticks(rotation=45)
+    chart(draw_4e, r['4e_trend'], figsize=(12, 6), spec=lambda sequence_trend: vegalite.stacked_bar(
+        sequence_trend, "Jumlah Pesanan per Bulan berdasarkan Urutan Pesanan Pelanggan", "Bulan", "Jumlah Pesanan",
+        "Pesanan ke-"))
+
+    repeat_summary = r['4e_summary'].rename(columns={
+        'orders': 'Jumlah Pesanan',
+        'customers': 'Jumlah Pelanggan',
+        'revenue': 'Pendapatan (BRL)',
+        'average_order_value': 'Rata-rata Nilai Pesanan (BRL)',
+    })
+    repeat_summary.index.name = 'Pesanan ke-'
+    st.dataframe(repeat_summary.round(2))
+    footer()
+
+
+def render_sellers(r: dict) -> None:
+    """Fungsi untuk menampilkan bagian Seller & Revenue."""
+    st.write("Analisis Seller & Revenue")
+
+    # Pertanyaan 5a:
+    st.subheader("a. Seller yang memiliki jumlah pesanan terbanyak")
+
+    def draw_5a(ax, top_sellers):
+        sns.barplot(data=top_sellers, x='seller_id', y='order_count', hue='seller_id', dodge=False, palette='viridis', ax=ax)
+        ax.set_title(f"Top {len(top_sellers)} Seller dengan Jumlah Pesanan Terbanyak", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Seller ID", fontsize=12)
+        ax.set_ylabel("Jumlah Pesanan", fontsize=12)
+        ax.set_xticks(range(len(top_sellers)))
+        ax.set_xticklabels(top_sellers['seller_id'], rotation=90)
+    chart(draw_5a, r['5a'], figsize=(12, 6), spec=lambda top_sellers: vegalite.bar(
+        top_sellers, 'seller_id', 'order_count', f"Top {len(top_sellers)} Seller dengan Jumlah Pesanan Terbanyak",
+        "Seller ID", "Jumlah Pesanan", tooltip=['seller_id', 'order_count', ('share', '.1%')]))
+
+    # Pertanyaan 5b:
+    st.subheader("b. Seller yang menguasai sebagian besar penjualan dalam kategori tertentu")
+
+    def draw_5b(ax, df_category_top_seller):
+        sns.barplot(data=df_category_top_seller, x='product_category_name', y='order_count', hue='product_category_name', dodge=False, palette='Set2', ax=ax)
+        ax.set_title("Seller yang Mendominasi Kategori Produk", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Kategori Produk", fontsize=12)
+        ax.set_ylabel("Jumlah Pesanan", fontsize=12)
+        ax.set_xticks(range(len(df_category_top_seller)))
+        ax.set_xticklabels(df_category_top_seller['product_category_name'], rotation=90)
+        # Porsi pesanan kategori yang dipegang seller teratasnya.
+        for bar, share in zip(sorted(ax.patches, key=lambda bar: bar.get_x()), df_category_top_seller['share']):
+            ax.annotate(f"{share:.0%}", (bar.get_x() + bar.get_width() / 2, bar.get_height()), ha='center',
+                        va='bottom', fontsize=7, rotation=90)
+    chart(draw_5b, r['5b'], figsize=(12, 6), spec=lambda df_category_top_seller: vegalite.bar(
+        df_category_top_seller, 'product_category_name', 'order_count', "Seller yang Mendominasi Kategori Produk",
+        "Kategori Produk", "Jumlah Pesanan",
+        tooltip=['product_category_name', 'seller_id', 'order_count', ('share', '.1%')]))
+
+    # Pertanyaan 5c:
+    st.subheader("c. Seller baru yang bergabung setiap bulan/tahun")
+
+    def draw_5c(ax, seller_join_trend):
+        ax.plot(seller_join_trend.index.astype(str), seller_join_trend.values, marker='o', linestyle='-', color='b')
+        ax.set_title("Jumlah Seller Baru per Bulan", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Bulan", fontsize=12)
+        ax.set_ylabel("Jumlah Seller Baru", fontsize=12)
+        ax.grid(True)
+        plt.xticks(rotation=45)
+    chart(draw_5c, r['5c'], figsize=(12, 6), spec=lambda seller_join_trend: vegalite.line(
+        series_frame(seller_join_trend, 'month', 'sellers'), 'month', 'sellers', "Jumlah Seller Baru per Bulan", "Bulan",
+        "Jumlah Seller Baru", points=True))
+    footer()
+
+
+def render_geospatial(r: dict) -> None:
+    """Fungsi untuk menampilkan bagian Geospatial."""
+    st.write("Geospatial Analysis")
+
+    # Pertanyaan 6a:
+    st.subheader("a. Kota dan negara bagian yang memiliki kontribusi penjualan tertinggi")
+
+    def draw_6a(ax, top_cities):
+        sns.barplot(data=top_cities, x='customer_city', y='price', hue='customer_state', palette='viridis', ax=ax)
+        ax.set_xticks(range(len(top_cities)))
+        ax.set_xticklabels(top_cities['customer_city'], rotation=45, ha='right')
+        ax.set_xlabel("Kota", fontsize=12)
+        ax.set_ylabel("Total Penjualan", fontsize=12)
+        ax.set_title(f"Top {len(top_cities)} Kota dengan Penjualan Tertinggi", fontsize=14, fontweight='bold')
+        ax.legend(title="Negara Bagian")
+    chart(draw_6a, r['6a'], figsize=(12, 6), spec=lambda top_cities: vegalite.bar(
+        top_cities, 'customer_city', 'price', f"Top {len(top_cities)} Kota dengan Penjualan Tertinggi", "Kota",
+        "Total Penjualan", color='customer_state', color_title="Negara Bagian",
+        tooltip=['customer_city', 'customer_state', 'price', ('share', '.1%')]))
+
+    # Pertanyaan 6b:
+    st.subheader("b. Pola geografis dalam jumlah pesanan atau keterlambatan pengiriman")
+
+    def draw_6b(ax, delay_by_state):
+        sns.barplot(data=delay_by_state, x='customer_state', y='delay', hue='customer_state', palette='coolwarm', ax=ax, dodge=False)
+        ax.set_xticks(range(len(delay_by_state['customer_state'])))
+        ax.set_xticklabels(delay_by_state['customer_state'], rotation=45, ha='right')
+        ax.set_xlabel("Negara Bagian", fontsize=12)
+        ax.set_ylabel("Rata-rata Keterlambatan (hari)", fontsize=12)
+        ax.set_title("Keterlambatan Pengiriman Rata-rata per Negara Bagian", fontsize=14, fontweight='bold')
+    chart(draw_6b, r['6b'], figsize=(12, 6), spec=lambda delay_by_state: vegalite.bar(
+        delay_by_state, 'customer_state', 'delay', "Keterlambatan Pengiriman Rata-rata per Negara Bagian",
+        "Negara Bagian", "Rata-rata Keterlambatan (hari)", color='delay', color_scheme='blueorange'))
+
+    # Pertanyaan 6c:
+    st.subheader("c. Distribusi pesanan di seluruh Brasil")
+    try:
+        map_version = brazil_states_version()
+    except FileNotFoundError:
+        st.warning(MISSING_MAP_MESSAGE)
+    else:
+        def draw_6c(ax, state_orders, map_version):
+            brazil_map = brazil_states().merge(state_orders, left_on='sigla', right_on='customer_state', how='left')
+            brazil_map.plot(column='order_count', cmap='Blues', linewidth=0.8, edgecolor='black', legend=True, ax=ax)
+            ax.set_title("Jumlah Pesanan per Negara Bagian di Brasil", fontsize=14, fontweight='bold')
+            ax.set_xlabel("Longitude")
+            ax.set_ylabel("Latitude")
+        # Versi file peta menggantikan geometri di kunci cache sehingga geometri
+        # tidak perlu di-hash dan baru dimuat saat gambar belum ada di cache.
+        chart(draw_6c, r['6c'], map_version, figsize=(12, 8), spec=lambda state_orders, map_version: vegalite.choropleth(
+            state_features(), state_orders, 'customer_state', 'order_count', "Jumlah Pesanan per Negara Bagian di Brasil",
+            "Jumlah Pesanan"))
+
+    # Pertanyaan 6d:
+    st.subheader(f"d. Kepadatan pesanan dan seller per heksagon ({HEX_SIZE_KM:g} km)")
+    density = r['6d']
+
+    def draw_6d(ax, density, value, label, title):
+        from matplotlib.collections import PolyCollection
+        from matplotlib.colors import LogNorm
+
+        cells = density[density[value] > 0]
+        hexagons = PolyCollection(hex_corners(cells.index.to_numpy()), array=cells[value].to_numpy(), cmap='viridis',
+                                  norm=LogNorm(), edgecolors='none')
+        ax.add_collection(hexagons)
+        ax.autoscale_view()
+        # Sel heksagon dibangun pada proyeksi equirectangular dengan lintang acuan ini.
+        ax.set_aspect(1 / np.cos(np.radians(HEX_REFERENCE_LAT)))
+        plt.colorbar(hexagons, ax=ax, label=label)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xlabel("Longitude")
+        ax.set_ylabel("Latitude")
+    for value, label, title in [('orders', "Jumlah Pesanan", "Kepadatan Pesanan Pelanggan"),
+                                ('sellers', "Jumlah Seller", "Kepadatan Seller")]:
+        chart(draw_6d, density, value, label, title, figsize=(10, 8),
+              spec=lambda density, value, label, title: vegalite.hexbin(density, value, title, label))
+
+    # Pertanyaan 6e:
+    st.subheader("e. Jarak seller ke pelanggan dibandingkan seller terdekat")
+
+    def draw_6e(ax, distance_counts):
+        sns.histplot(x=distance_counts.index, weights=distance_counts.values, bins=40, ax=ax)
+        ax.set_xlabel("Jarak Seller ke Pelanggan (km)")
+        ax.set_ylabel("Frekuensi")
+        ax.set_title("Distribusi Jarak Seller ke Pelanggan")
+    chart(draw_6e, r['6e_distance'], figsize=(8, 5), spec=lambda counts: vegalite.histogram(
+        series_frame(counts, 'seller_distance_km', 'count'), 'seller_distance_km', 'count',
+        "Distribusi Jarak Seller ke Pelanggan", "Jarak Seller ke Pelanggan (km)", "Frekuensi",
+        maxbins=40))
+
+    state_distance = r['6e_states'].rename(columns={
+        'customer_state': 'Negara Bagian',
+        'orders': 'Jumlah Pesanan',
+        'seller_distance_km': 'Rata-rata Jarak Seller (km)',
+        'nearest_seller_km': 'Rata-rata Jarak Seller Terdekat (km)',
+    })
+    st.dataframe(state_distance.set_index('Negara Bagian').round(1))
+    footer()
+
+
+RENDERERS = {
+    "Pesanan & Pengiriman": render_orders_delivery,
+    "Pembayaran": render_payments,
+    "Penjualan & Produk": render_sales_products,
+    "Pelanggan": render_customers,
+    "Seller & Revenue": render_sellers,
+    "Geospatial": render_geospatial,
+}
@@ -0,0 +1,128 @@
+# MIT License
+
+# Copyright (c) 2025 Ika Nurfitriani
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Warm-up replika dashboard: membangun semua cache sebelum replika menerima trafik.
+
+Replika baru yang langsung melayani pengunjung pertama harus mengonversi CSV,
+membangun tabel fakta, kubus, dan kohort, lalu menghitung dan menggambar
+bagian yang dibuka. Skrip ini mengerjakan semua itu lebih dulu dan menyimpan
+hasilnya di disk:
+
+    cache kolumnar     main-data/.cache/<tabel>.feather (loader.py)
+    geometri           GeoParquet negara bagian dan centroid kode pos
+    hasil olahan       tabel fakta, pembayaran, kubus, kohort (state.py)
+    laporan            hasil dan grafik semua bagian untuk rentang penuh (report.py)
+
+Setelah itu replika hanya memetakan hasil olahan ke memori, dan rentang penuh
+dilayani dari laporan beserta gambarnya. Jalankan sebelum `streamlit run`
+(mis. sebagai init container). Pakai `--check` sebagai readiness probe: kode
+keluarnya 0 hanya bila semua cache masih sesuai dengan CSV di main-data.
+
+    python warmup.py && streamlit run dashboard.py
+    python warmup.py --check
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import streamlit.logger
+
+from analysis import SECTIONS
+from geo import BRAZIL_STATES_FILE, build_geoparquet, geoparquet_path
+from geolocation import build_zip_centroids, centroids_path
+from ingest import rebuild, source_versions
+from loader import TABLES, build_columnar_cache, columnar_fresh, data_path
+from report import fresh_manifest, write_report
+from state import state_matches
+
+
+def _newer(target: str, source: str) -> bool:
+    return not os.path.exists(source) or (os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source))
+
+
+def _report_complete() -> bool:
+    sections = fresh_manifest().get('sections', {})
+    if not set(SECTIONS) <= set(sections):
+        return False
+    # Laporan tanpa peta 6c (peta sempat hilang saat dibuat) tidak lengkap.
+    return '6c' in sections['Geospatial'].get('figures', {})
+
+
+def stale_caches(report: bool = True) -> list:
+    """Fungsi untuk mendaftar cache yang belum ada atau lebih lama dari sumbernya, tanpa membangunnya."""
+    stale = [f"kolumnar {name}" for name in TABLES
+             if os.path.exists(data_path(TABLES[name]['file'])) and not columnar_fresh(name)]
+    if not os.path.exists(data_path(BRAZIL_STATES_FILE)):
+        stale.append("peta negara bagian")
+    elif not _newer(geoparquet_path(), data_path(BRAZIL_STATES_FILE)):
+        stale.append("geoparquet")
+    if not _newer(centroids_path(), data_path(TABLES['geolocation']['file'])):
+        stale.append("centroid kode pos")
+    if not state_matches(source_versions()):
+        stale.append("hasil olahan")
+    if report and not _report_complete():
+        stale.append("laporan")
+    return stale
+
+
+def warm_up(report: bool = True, workers: int = None) -> dict:
+    """Fungsi untuk membangun cache yang basi (lihat `stale_caches`); mengembalikan durasi tiap langkah."""
+    steps = {
+        'kolumnar': build_columnar_cache,
+        'geoparquet': build_geoparquet,
+        'centroid kode pos': build_zip_centroids,
+        'hasil olahan': lambda: state_matches(source_versions()) or rebuild(),
+    }
+    if report:
+        # Laporan lama tetap dipakai selama masih lebih baru dari CSV.
+        steps['laporan'] = lambda: _report_complete() or write_report(workers=workers)
+    seconds = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        step()
+        seconds[name] = time.perf_counter() - started
+        print(f"{name:<20}{seconds[name]:>8.2f}s", flush=True)
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--check', action='store_true',
+                        help="hanya periksa; kode keluar 1 bila ada cache yang basi (readiness probe)")
+    parser.add_argument('--no-report', action='store_true', help="jangan buat atau wajibkan laporan rentang penuh")
+    parser.add_argument('--workers', type=int, help="jumlah proses pembuat laporan (bawaan: jumlah CPU)")
+    args = parser.parse_args()
+    streamlit.logger.set_log_level("error")
+    if not args.check:
+        started = time.perf_counter()
+        warm_up(not args.no_report, args.workers)
+        print(f"Warm-up selesai dalam {time.perf_counter() - started:.2f}s")
+    stale = stale_caches(not args.no_report)
+    if stale:
+        print(f"Belum siap: {', '.join(stale)}")
+    sys.exit(1 if stale else 0)
+
+
+if __name__ == "__main__":
+    main()